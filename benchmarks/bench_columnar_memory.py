@@ -0,0 +1,77 @@
+"""
+Benchmark peak RSS extraction output list of dict vs ColumnarBatch sampai transform_data.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_columnar_memory --products 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import resource
+import subprocess
+import sys
+import time
+
+from tests.fake_site import PRODUCT_TYPES
+from utils.columnar import ColumnarBatch
+from utils.transform import DataTransformer
+
+CARDS_PER_PAGE = 20
+
+
+def iter_page_products(products: int):
+    """Product per page seperti output extract_product_data, string berbeda untuk setiap card"""
+    for start in range(0, products, CARDS_PER_PAGE):
+        yield [{
+            'Title': f"{PRODUCT_TYPES[number % len(PRODUCT_TYPES)]} {number}",
+            'Price': f"${10 + number % 490}.99",
+            'Rating': f"Rating: ⭐ {1 + number % 40 / 10:.1f} / 5",
+            'Colors': f"{1 + number % 5} Colors",
+            'Size': f"Size: {('S', 'M', 'L', 'XL', 'XXL')[number % 5]}",
+            'Gender': f"Gender: {('Men', 'Women', 'Unisex')[number % 3]}",
+        } for number in range(start, min(start + CARDS_PER_PAGE, products))]
+
+
+def peak_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_child(path: str, products: int):
+    baseline = peak_rss_mb()
+    start = time.perf_counter()
+
+    collected = ColumnarBatch() if path == 'columnar' else []
+    for page in iter_page_products(products):
+        collected.extend(ColumnarBatch.from_records(page) if path == 'columnar' else page)
+    extracted = peak_rss_mb()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df = DataTransformer().transform_data(collected)
+    elapsed = time.perf_counter() - start
+    print(f"{path} {baseline:.1f} {extracted:.1f} {peak_rss_mb():.1f} {elapsed:.2f} {len(df)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--products', type=int, default=1_000_000)
+    parser.add_argument('--child', choices=['dict', 'columnar'], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(args.child, args.products)
+        return
+
+    print(f"{'path':>9} {'extract MB':>11} {'peak MB':>9} {'seconds':>9} {'rows':>9}   (RSS di atas baseline import)")
+    for path in ('dict', 'columnar'):
+        # Proses terpisah agar peak RSS satu path tidak terbawa ke path lain
+        output = subprocess.run([sys.executable, '-m', 'benchmarks.bench_columnar_memory',
+                                 '--products', str(args.products), '--child', path],
+                                check=True, capture_output=True, text=True).stdout.split()
+        _, baseline, extracted, peak, seconds, rows = output
+        print(f"{path:>9} {float(extracted) - float(baseline):>11.1f} {float(peak) - float(baseline):>9.1f} "
+              f"{float(seconds):>9.2f} {rows:>9}")
+
+
+if __name__ == '__main__':
+    main()
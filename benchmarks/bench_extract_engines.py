@@ -0,0 +1,60 @@
+"""
+Benchmark engine extraction sync vs async vs process terhadap server lokal.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_extract_engines --pages 50 500 5000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import sys
+import time
+
+from tests.fake_site import FakeFashionSite
+from utils.extract import ProductExtractor, AsyncProductExtractor, ProcessPoolExtractor
+
+
+def run_sync(base_url: str, pages: int, workers: int) -> int:
+    extractor = ProductExtractor(base_url=base_url, max_workers=workers, requests_per_second=1e9)
+    return len(extractor.scrape_all_pages(1, pages))
+
+
+def run_async(base_url: str, pages: int, workers: int) -> int:
+    extractor = AsyncProductExtractor(base_url=base_url, max_workers=workers)
+    return len(asyncio.run(extractor.scrape_all_pages(1, pages)))
+
+
+def run_process(base_url: str, pages: int, workers: int) -> int:
+    extractor = ProcessPoolExtractor(base_url=base_url, max_workers=workers, requests_per_second=1e9)
+    try:
+        products = extractor.scrape_all_pages(1, pages)
+    finally:
+        extractor.close()
+    print(extractor.utilisation_report(), file=sys.stderr)
+    return len(products)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, nargs='+', default=[50, 500, 5000])
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    parser.add_argument('--latency', type=float, default=0.0, help="latency server per response (detik)")
+    args = parser.parse_args()
+
+    print(f"{'pages':>7} {'engine':>7} {'seconds':>9} {'pages/sec':>10} {'products':>9}")
+    with FakeFashionSite(pages=max(args.pages), cards_per_page=args.cards_per_page,
+                         latency=args.latency) as site:
+        for pages in args.pages:
+            for name, runner in (('sync', run_sync), ('async', run_async), ('process', run_process)):
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    products = runner(site.url, pages, args.workers)
+                elapsed = time.perf_counter() - start
+                print(f"{pages:>7} {name:>7} {elapsed:>9.2f} {pages / elapsed:>10.1f} {products:>9}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,85 @@
+"""
+Benchmark output CSV vs Parquet (beberapa codec): waktu write, ukuran file, waktu read-back.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_output_formats --rows 100000 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import shutil
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from tests.fake_site import PRODUCT_TYPES
+from utils.load import DataLoader
+from utils.schema import COLUMNS, cast_to_profile
+
+FORMATS = (
+    ('csv', None),
+    ('parquet', 'snappy'),
+    ('parquet', 'zstd'),
+    ('parquet', 'gzip'),
+    ('parquet', 'none'),
+)
+
+
+def make_clean_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Frame seperti hasil transform_data dengan profile standard"""
+    rng = np.random.default_rng(seed)
+    types = np.array(PRODUCT_TYPES, dtype=object)[rng.integers(0, len(PRODUCT_TYPES), rows)]
+    return cast_to_profile(pd.DataFrame({
+        'Title': types + ' ' + np.arange(rows).astype(str).astype(object),
+        'Price': rng.integers(10, 500, rows) * 16000.0 + 15840.0,
+        'Rating': np.round(rng.uniform(1, 5, rows), 1),
+        'Colors': rng.integers(1, 6, rows),
+        'Size': np.array(['S', 'M', 'L', 'XL', 'XXL'], dtype=object)[rng.integers(0, 5, rows)],
+        'Gender': np.array(['Men', 'Women', 'Unisex'], dtype=object)[rng.integers(0, 3, rows)],
+    }, columns=COLUMNS))
+
+
+def run_format(loader: DataLoader, df: pd.DataFrame, output_format: str, codec, row_group_size: int):
+    """Return (detik write, bytes, detik read, dtype sama setelah read)"""
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        if output_format == 'csv':
+            path = loader.save_to_csv(df, "products.csv")
+        else:
+            path = loader.save_to_parquet(df, f"products.{codec}.parquet", codec, row_group_size)
+    write_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    result = pd.read_csv(path) if output_format == 'csv' else pd.read_parquet(path)
+    read_seconds = time.perf_counter() - start
+    return write_seconds, os.path.getsize(path), read_seconds, result.dtypes.equals(df.dtypes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--row-group-size', type=int, default=128_000)
+    args = parser.parse_args()
+
+    output_dir = tempfile.mkdtemp()
+    loader = DataLoader(output_dir)
+    try:
+        print(f"{'rows':>10} {'format':>16} {'write s':>8} {'MB':>8} {'read s':>8} {'types kept':>11}")
+        for rows in args.rows:
+            df = make_clean_frame(rows)
+            for output_format, codec in FORMATS:
+                write_seconds, size, read_seconds, typed = run_format(loader, df, output_format, codec,
+                                                                      args.row_group_size)
+                name = output_format if codec is None else f"{output_format}/{codec}"
+                print(f"{rows:>10} {name:>16} {write_seconds:>8.2f} {size / 1024 / 1024:>8.1f} "
+                      f"{read_seconds:>8.2f} {str(typed):>11}")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,34 @@
+"""
+Micro-benchmark parser backend extract_product_data (cards/sec).
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_parser --pages 200 --cards-per-page 20
+"""
+
+import argparse
+import time
+
+from tests.fake_site import render_page
+from utils.extract import PARSERS, ProductExtractor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=200)
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    args = parser.parse_args()
+
+    pages = [render_page(n, args.pages, args.cards_per_page).encode('utf-8')
+             for n in range(1, args.pages + 1)]
+
+    print(f"{'parser':>12} {'seconds':>9} {'cards/sec':>11} {'cards':>8}")
+    for backend in PARSERS:
+        extractor = ProductExtractor(parser=backend)
+        start = time.perf_counter()
+        cards = sum(len(extractor.parse_page(content)) for content in pages)
+        elapsed = time.perf_counter() - start
+        print(f"{backend:>12} {elapsed:>9.2f} {cards / elapsed:>11.0f} {cards:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""
+Benchmark parse / transform / load dari arsip HTML (tanpa network).
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_replay --archive archive
+    python -m benchmarks.bench_replay --generate 1000
+"""
+
+import argparse
+import contextlib
+import io
+import shutil
+import tempfile
+import time
+
+from tests.fake_site import render_page
+from utils.archive import HtmlArchive
+from utils.extract import PARSERS, ReplayExtractor
+from utils.load import load_fashion_data
+from utils.transform import transform_fashion_data
+
+
+def generate_archive(archive_dir: str, pages: int, cards_per_page: int):
+    archive = HtmlArchive(archive_dir, run_id="synthetic")
+    for page_num in range(1, pages + 1):
+        archive.store(page_num, f"synthetic/page{page_num}",
+                      render_page(page_num, pages, cards_per_page).encode('utf-8'))
+    archive.save_manifest()
+
+
+def timed(func, *args, **kwargs):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--archive', help="direktori arsip hasil --archive di main.py")
+    parser.add_argument('--run-id', help="manifest yang di replay, default run terakhir")
+    parser.add_argument('--generate', type=int, default=200, help="jumlah page arsip sintetis")
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    parser.add_argument('--parser', choices=PARSERS, default='lxml')
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        archive_dir = args.archive
+        if archive_dir is None:
+            archive_dir = f"{work_dir}/archive"
+            generate_archive(archive_dir, args.generate, args.cards_per_page)
+
+        extractor = ReplayExtractor(archive_dir, run_id=args.run_id, parser=args.parser)
+        products, parse_time = timed(extractor.scrape_all_pages, 1, extractor.discover_last_page())
+        df, transform_time = timed(transform_fashion_data, products)
+        _, load_time = timed(load_fashion_data, df, output_dir=work_dir)
+
+        print(f"{'stage':>10} {'seconds':>9} {'rows/sec':>11}")
+        for stage, elapsed, rows in (('parse', parse_time, len(products)),
+                                     ('transform', transform_time, len(products)),
+                                     ('load', load_time, len(df))):
+            print(f"{stage:>10} {elapsed:>9.3f} {rows / elapsed:>11.0f}")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    main()
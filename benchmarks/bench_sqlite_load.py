@@ -0,0 +1,74 @@
+"""
+Benchmark load SQLite (rows/sec untuk insert dan upsert ulang) dan query dashboard: full scan CSV vs SQLite ber-index.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_sqlite_load --rows 100000 1000000
+"""
+
+import argparse
+import contextlib
+import io
+import shutil
+import sqlite3
+import tempfile
+import time
+
+import pandas as pd
+
+from benchmarks.bench_output_formats import make_clean_frame
+from utils.load import DataLoader
+
+QUERY = "SELECT COUNT(*), AVG(Price) FROM products WHERE Gender = ? AND Size = ? AND Price < ?"
+QUERY_ARGS = ('Women', 'M', 2_000_000.0)
+
+
+def timed(func):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    return time.perf_counter() - start, result
+
+
+def query_csv(path: str):
+    df = pd.read_csv(path)
+    gender, size, price = QUERY_ARGS
+    selected = df.loc[(df['Gender'] == gender) & (df['Size'] == size) & (df['Price'] < price), 'Price']
+    return len(selected), selected.mean()
+
+
+def query_sqlite(path: str):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute(QUERY, QUERY_ARGS).fetchone()
+    finally:
+        conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[100_000, 1_000_000])
+    parser.add_argument('--batch-size', type=int, default=10_000)
+    args = parser.parse_args()
+
+    output_dir = tempfile.mkdtemp()
+    loader = DataLoader(output_dir)
+    try:
+        print(f"{'rows':>10} {'insert r/s':>11} {'upsert r/s':>11} {'csv query ms':>13} {'sqlite query ms':>16}")
+        for rows in args.rows:
+            df = make_clean_frame(rows)
+            db_name = f"products_{rows}.db"
+            _, csv_path = timed(lambda: loader.save_to_csv(df, f"products_{rows}.csv"))
+            insert_seconds, db_path = timed(lambda: loader.save_to_sqlite(df, db_name, batch_size=args.batch_size))
+            upsert_seconds, _ = timed(lambda: loader.save_to_sqlite(df, db_name, batch_size=args.batch_size))
+
+            csv_seconds, csv_result = timed(lambda: query_csv(csv_path))
+            sqlite_seconds, sqlite_result = timed(lambda: query_sqlite(db_path))
+            assert csv_result[0] == sqlite_result[0]
+            print(f"{rows:>10} {rows / insert_seconds:>11,.0f} {rows / upsert_seconds:>11,.0f} "
+                  f"{csv_seconds * 1000:>13.1f} {sqlite_seconds * 1000:>16.1f}")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark DataTransformer.transform_data: clean_* per row vs vectorized str.extract vs factorize (rows/sec).
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_transform --rows 10000 1000000 10000000
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from tests.fake_site import PRODUCT_TYPES
+from utils.transform import COLUMNS, DataTransformer
+
+
+def make_raw_frame(rows: int, seed: int = 0) -> pd.DataFrame:
+    """Frame raw seperti hasil extraction, termasuk nilai invalid dan duplikat"""
+    rng = np.random.default_rng(seed)
+    numbers = rng.integers(1, max(2, rows // 2), rows)
+    types = np.array(PRODUCT_TYPES, dtype=object)[rng.integers(0, len(PRODUCT_TYPES), rows)]
+    titles = pd.Series(types + ' ' + numbers.astype(str).astype(object))
+    titles[rng.random(rows) < 0.02] = 'Unknown Product'
+
+    prices = pd.Series('$' + rng.integers(10, 500, rows).astype(str).astype(object) + '.99')
+    prices[rng.random(rows) < 0.02] = 'Price Unavailable'
+    ratings = pd.Series('Rating: ⭐ ' + np.round(rng.uniform(1, 5, rows), 1).astype(str).astype(object) + ' / 5')
+    ratings[rng.random(rows) < 0.02] = 'Rating: ⭐ Invalid Rating / 5'
+
+    return pd.DataFrame({
+        'Title': titles,
+        'Price': prices,
+        'Rating': ratings,
+        'Colors': rng.integers(1, 6, rows).astype(str).astype(object) + ' Colors',
+        'Size': 'Size: ' + np.array(['S', 'M', 'L', 'XL', 'XXL'], dtype=object)[rng.integers(0, 5, rows)],
+        'Gender': 'Gender: ' + np.array(['Men', 'Women', 'Unisex'], dtype=object)[rng.integers(0, 3, rows)],
+    }, columns=COLUMNS)
+
+
+PATHS = (
+    ('rowwise', {'vectorized': False, 'factorize': False}),
+    ('vectorized', {'vectorized': True, 'factorize': False}),
+    ('factorized', {'vectorized': True, 'factorize': True}),
+)
+
+
+def time_transform(transformer: DataTransformer, frame: pd.DataFrame, trace_memory: bool = False):
+    """Return (detik, peak alokasi sementara dalam MB atau None, hasil)"""
+    if trace_memory:
+        tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = transformer.transform_data(frame)
+    elapsed = time.perf_counter() - start
+    peak = None
+    if trace_memory:
+        peak = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        tracemalloc.stop()
+    return elapsed, peak, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument('--max-rowwise-rows', type=int, default=None,
+                        help="lewati path per-row di atas jumlah row ini")
+    parser.add_argument('--trace-memory', action='store_true',
+                        help="ukur peak alokasi sementara dengan tracemalloc (lebih lambat)")
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'path':>10} {'seconds':>9} {'rows/sec':>11} {'peak MB':>9} {'clean rows':>11}")
+    for rows in args.rows:
+        frame = make_raw_frame(rows)
+        results = {}
+        for name, options in PATHS:
+            if name == 'rowwise' and args.max_rowwise_rows and rows > args.max_rowwise_rows:
+                print(f"{rows:>10} {name:>10} {'skipped':>9}")
+                continue
+            elapsed, peak, results[name] = time_transform(DataTransformer(**options), frame, args.trace_memory)
+            peak_text = f"{peak:.1f}" if peak is not None else '-'
+            print(f"{rows:>10} {name:>10} {elapsed:>9.2f} {rows / elapsed:>11.0f} {peak_text:>9} "
+                  f"{len(results[name]):>11}")
+
+        baseline = next(iter(results.values()))
+        for result in results.values():
+            pd.testing.assert_frame_equal(result, baseline)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark scaling DataTransformer.transform_data_parallel untuk 1, 2, 4 dan 8 worker process.
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_transform_scaling --rows 1000000 --workers 1 2 4 8
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import time
+
+import pandas as pd
+
+from benchmarks.bench_transform import make_raw_frame
+from utils.transform import DataTransformer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--partitions-per-worker', type=int, default=4)
+    args = parser.parse_args()
+
+    products = make_raw_frame(args.rows).to_dict('records')
+    transformer = DataTransformer()
+    print(f"{args.rows} rows, {os.cpu_count()} CPUs")
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        expected = transformer.transform_data(products)
+    baseline = time.perf_counter() - start
+
+    print(f"{'workers':>8} {'seconds':>9} {'rows/sec':>11} {'speedup':>8}")
+    print(f"{'serial':>8} {baseline:>9.2f} {args.rows / baseline:>11.0f} {1:>8.2f}")
+    for workers in args.workers:
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = transformer.transform_data_parallel(products, workers,
+                                                         workers * args.partitions_per_worker)
+        elapsed = time.perf_counter() - start
+        pd.testing.assert_frame_equal(result, expected)
+        print(f"{workers:>8} {elapsed:>9.2f} {args.rows / elapsed:>11.0f} {baseline / elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    main()
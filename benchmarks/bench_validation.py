@@ -0,0 +1,46 @@
+"""
+Benchmark validasi: rangkaian pass terpisah validate_data lama vs DataValidator (penuh dan sampled).
+
+Jalankan dari root repository:
+    python -m benchmarks.bench_validation --rows 1000000 10000000
+"""
+
+import argparse
+import time
+
+from benchmarks.bench_output_formats import make_clean_frame
+from utils.schema import dtype_matches, get_profile
+from utils.validation import DataValidator
+
+
+def legacy_checks(df) -> bool:
+    """Pass yang dijalankan validate_data sebelum DataValidator (tanpa print)"""
+    for col, expected in get_profile().items():
+        dtype_matches(df[col].dtype, expected)
+    return not (df.isnull().sum().sum() > 0 or df.duplicated().sum() > 0
+                or (df['Price'] <= 0).any() or not df['Rating'].between(0, 5).all())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1_000_000, 10_000_000])
+    parser.add_argument('--sample-rows', type=int, default=100_000)
+    args = parser.parse_args()
+
+    validator = DataValidator()
+    print(f"{'rows':>10} {'legacy s':>9} {'engine s':>9} {'sampled s':>10} {'passed':>7}")
+    for rows in args.rows:
+        df = make_clean_frame(rows)
+        start = time.perf_counter()
+        legacy = legacy_checks(df)
+        legacy_seconds = time.perf_counter() - start
+
+        report = validator.validate(df)
+        sampled = validator.validate(df, sample_rows=args.sample_rows)
+        assert report.passed == legacy
+        print(f"{rows:>10} {legacy_seconds:>9.2f} {report.elapsed:>9.2f} {sampled.elapsed:>10.3f} "
+              f"{str(report.passed):>7}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+"""
+Load test ProductExtractor terhadap stand-in lokal fashion-studio.
+
+Jalankan dari root repository:
+    python -m benchmarks.load_test --pages 10000 --workers 32 --latency 0.02 --error-rate 0.01
+"""
+
+import argparse
+import contextlib
+import io
+import time
+from collections import Counter
+
+from tests.fake_site import FakeFashionSite
+from utils.extract import PARSERS, ProductExtractor
+from utils.metrics import percentile
+from utils.retry import RetryPolicy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--pages', type=int, default=1000)
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--rps', type=float, default=None, help="batas requests per detik")
+    parser.add_argument('--parser', choices=PARSERS, default='lxml')
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--latency-jitter', type=float, default=0.0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--malformed-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with FakeFashionSite(args.pages, args.cards_per_page, latency=args.latency,
+                         latency_jitter=args.latency_jitter, error_rate=args.error_rate,
+                         malformed_rate=args.malformed_rate, seed=args.seed) as site:
+        extractor = ProductExtractor(base_url=site.url, max_workers=args.workers,
+                                     requests_per_second=args.rps or 1e9, parser=args.parser,
+                                     pool_size=args.workers,
+                                     retry_policy=RetryPolicy(backoff_base=0.05, backoff_max=1.0))
+
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            products = extractor.scrape_all_pages(1, args.pages)
+        elapsed = time.perf_counter() - start
+
+    latencies = [outcome['latency'] for outcome in extractor.ledger.values()]
+    statuses = Counter(outcome['status'] for outcome in extractor.ledger.values())
+    attempts = sum(outcome['attempts'] for outcome in extractor.ledger.values())
+
+    print(f"Pages: {args.pages} in {elapsed:.2f}s ({args.pages / elapsed:.1f} pages/sec)")
+    print(f"Products: {len(products)} ({len(products) / elapsed:.0f} products/sec)")
+    print(f"Page latency p50: {percentile(latencies, 50) * 1000:.1f}ms, "
+          f"p99: {percentile(latencies, 99) * 1000:.1f}ms")
+    print(f"Statuses: {dict(statuses)}, attempts: {attempts}, server errors: {site.errors_served}")
+    print(extractor.transfer_report())
+
+
+if __name__ == '__main__':
+    main()
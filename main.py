@@ -4,19 +4,125 @@ Fashion Studio ETL Pipeline
 Web scraping dan pemrosesan data produk fashion dari https://fashion-studio.dicoding.dev/
 """
 
+import argparse
 import os
 import sys
 from datetime import datetime
 
 sys.path.append(os.path.join(os.path.dirname(__file__), 'utils'))
 
-from utils.extract import extract_fashion_data
-from utils.transform import transform_fashion_data
-from utils.load import load_fashion_data
+from utils.extract import extract_fashion_data, iter_fashion_data
+from utils.transform import row_fingerprints, transform_fashion_data, transform_fashion_stream
+from utils.load import DataLoader, load_fashion_data, load_fashion_stream
+from utils.columnar import ColumnarBatch
+from utils.fingerprint import FingerprintIndex
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Fashion Studio ETL Pipeline")
+    parser.add_argument('--stream', action='store_true',
+                        help="proses data per page tanpa menyimpan seluruh katalog di memory")
+    parser.add_argument('--resume', action='store_true',
+                        help="lanjutkan extraction dari checkpoint run sebelumnya")
+    parser.add_argument('--archive', metavar='DIR',
+                        help="simpan raw HTML setiap page ke arsip content-addressed")
+    parser.add_argument('--replay', metavar='DIR',
+                        help="jalankan pipeline dari arsip HTML tanpa akses network")
+    profile = parser.add_mutually_exclusive_group()
+    profile.add_argument('--compact', action='store_true',
+                         help="pakai schema profile compact (category dan numeric sempit) untuk hemat memory")
+    profile.add_argument('--arrow', action='store_true',
+                         help="data antar stage sebagai Arrow record batch dan kolom Arrow-backed")
+    parser.add_argument('--incremental', action='store_true',
+                        help="hanya proses row baru (fingerprint index persisten) dan append ke CSV")
+    parser.add_argument('--columnar', action='store_true',
+                        help="kumpulkan hasil extraction per kolom (ColumnarBatch) tanpa dict per product")
+    parser.add_argument('--transform-workers', type=int, metavar='N',
+                        help="transform data dengan N worker process (mode non-streaming)")
+    parser.add_argument('--parse-workers', type=int, metavar='N',
+                        help="parse HTML di process pool dengan N worker (fetch tetap memakai thread)")
+    output = parser.add_mutually_exclusive_group()
+    output.add_argument('--parquet', nargs='?', const='snappy', metavar='CODEC',
+                        help="tulis products.parquet (default codec snappy) sebagai pengganti CSV")
+    output.add_argument('--sqlite', action='store_true',
+                        help="upsert ke products.db (SQLite, key Title) sebagai pengganti CSV")
+    output.add_argument('--merge', action='store_true',
+                        help="merge ke products.csv berdasarkan Title: hanya insert / update / delete yang berubah")
+    args = parser.parse_args(argv)
+    if args.parquet and (args.stream or args.incremental):
+        parser.error("--parquet hanya didukung tanpa --stream dan --incremental")
+    if args.sqlite and args.stream:
+        parser.error("--sqlite hanya didukung tanpa --stream")
+    if args.merge and (args.stream or args.incremental):
+        parser.error("--merge hanya didukung tanpa --stream dan --incremental")
+    return args
+
+
+def output_format_for(args) -> str:
+    if args.parquet:
+        return "parquet"
+    return "sqlite" if args.sqlite else "csv"
+
+
+def engine_for(args) -> str:
+    return "process" if args.parse_workers else "sync"
+
+
+def profile_for(args) -> str:
+    if args.arrow:
+        return "arrow"
+    return "compact" if args.compact else "standard"
+
+
+def history_for(args, filename: str = "products.csv"):
+    """Fingerprint index untuk --incremental. Index yang masih kosong diisi dulu dari CSV yang sudah ada,
+    agar run incremental pertama tidak meng-append ulang seluruh katalog"""
+    if not args.incremental:
+        return None
+    history = FingerprintIndex(".fingerprint_index")
+    if not len(history.fingerprints) and output_format_for(args) == 'csv' and os.path.exists(filename):
+        history.seed(row_fingerprints(DataLoader().read_csv(filename)))
+        print(f"Fingerprint index seeded from {filename}: {len(history.fingerprints)} rows")
+    return history
+
+
+def save_history(history):
+    """Simpan fingerprint index hanya setelah load berhasil, agar row baru tidak hilang jika load gagal"""
+    if history is not None:
+        history.save()
+        print(history.report())
+
+
+def run_streaming(args):
+    """ETL pipeline dalam mode streaming: extract, transform dan load per batch"""
+    print("STREAM: Extract -> Transform -> Load per page...")
+    print("-" * 40)
+    
+    batches = iter_fashion_data(start_page=1, end_page=None, max_workers=5, requests_per_second=5,
+                                cache_dir=".http_cache", page_index_dir=".page_index", parser="lxml",
+                                checkpoint_dir=".checkpoint", resume=args.resume,
+                                archive_dir=args.archive, replay_dir=args.replay,
+                                engine=engine_for(args), parse_workers=args.parse_workers)
+    if args.arrow:
+        batches = (ColumnarBatch.from_records(products).to_arrow() for products in batches)
+    profile = profile_for(args)
+    history = history_for(args)
+    csv_path = load_fashion_stream(transform_fashion_stream(batches, profile, history=history),
+                                   filename="products.csv", profile=profile, append=args.incremental)
+    save_history(history)
+    
+    print()
+    print("="*60)
+    print("ETL PIPELINE COMPLETED SUCCESSFULLY!")
+    print("="*60)
+    print(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"Output file: {csv_path}")
+
+
+def main(argv=None):
     """Main ETL pipeline function"""
+    args = parse_args(argv)
+    
     print("="*60)
     print("FASHION STUDIO ETL PIPELINE")
     print("="*60)
@@ -24,22 +130,34 @@ def main():
     print()
     
     try:
+        if args.stream:
+            run_streaming(args)
+            return
+        
         print("EXTRACT: Starting web scraping...")
         print("-" * 40)
         
-        raw_products = extract_fashion_data(start_page=1, end_page=50)
+        raw_products = extract_fashion_data(start_page=1, end_page=None, max_workers=5, requests_per_second=5,
+                                            cache_dir=".http_cache", page_index_dir=".page_index", parser="lxml",
+                                            checkpoint_dir=".checkpoint", resume=args.resume,
+                                            archive_dir=args.archive, replay_dir=args.replay,
+                                            engine=engine_for(args), parse_workers=args.parse_workers,
+                                            columnar=args.columnar or args.arrow)
         
         if not raw_products:
             print("No data extracted. Exiting...")
             return
         
         print(f"Extraction completed: {len(raw_products)} products")
+        if args.arrow:
+            raw_products = raw_products.to_arrow()
         print()
         
         print("TRANSFORM: Starting data transformation...")
         print("-" * 40)
         
-        clean_df = transform_fashion_data(raw_products)
+        history = history_for(args)
+        clean_df = transform_fashion_data(raw_products, profile_for(args), args.transform_workers, history)
         
         if clean_df.empty:
             print("No data after transformation. Exiting...")
@@ -51,7 +169,10 @@ def main():
         print("LOAD: Starting data loading...")
         print("-" * 40)
         
-        csv_path = load_fashion_data(clean_df, filename="products.csv")
+        csv_path = load_fashion_data(clean_df, filename="products.csv", profile=profile_for(args),
+                                     append=args.incremental, merge=args.merge,
+                                     output_format=output_format_for(args), compression=args.parquet or 'snappy')
+        save_history(history)
         
         print(f"Loading completed: {csv_path}")
         print()
@@ -0,0 +1,265 @@
+"""
+Stand-in lokal untuk https://fashion-studio.dicoding.dev/
+Menyajikan halaman collection-card sintetis lewat http.server agar extractor
+bisa dites tanpa menyentuh website asli. Latency, error 5xx dan card rusak
+bisa diinjeksi untuk load test.
+
+Jalankan sebagai server standalone:
+    python -m tests.fake_site --pages 10000 --port 8000 --latency 0.05 --error-rate 0.01
+"""
+
+import argparse
+import gzip
+import hashlib
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+PRODUCT_TYPES = ['T-shirt', 'Hoodie', 'Pants', 'Outerwear', 'Jacket', 'Shirt', 'Sweater']
+SIZES = ['S', 'M', 'L', 'XL', 'XXL']
+GENDERS = ['Men', 'Women', 'Unisex']
+
+CARD_TEMPLATE = """
+        <div class="collection-card">
+            <div style="position: relative;">
+                <img src="https://picsum.photos/280/350?random={number}" class="collection-image" alt="{title}">
+            </div>
+            <div class="product-details">
+                <h3 class="product-title">{title}</h3>
+                <div class="price-container"><span class="price">${price:.2f}</span></div>
+                <p style="font-size: 14px; color: #777;">Rating: ⭐ {rating:.1f} / 5</p>
+                <p style="font-size: 14px; color: #777;">{colors} Colors</p>
+                <p style="font-size: 14px; color: #777;">Size: {size}</p>
+                <p style="font-size: 14px; color: #777;">Gender: {gender}</p>
+            </div>
+        </div>"""
+
+
+MALFORMED_CARD_TEMPLATES = [
+    """
+        <div class="collection-card">
+            <div class="product-details">
+                <h3 class="product-title">Unknown Product</h3>
+                <p class="price">Price Unavailable</p>
+                <p style="font-size: 14px; color: #777;">Rating: ⭐ Invalid Rating / 5</p>
+                <p style="font-size: 14px; color: #777;">5 Colors</p>
+                <p style="font-size: 14px; color: #777;">Size: M</p>
+                <p style="font-size: 14px; color: #777;">Gender: Men</p>
+            </div>
+        </div>""",
+    """
+        <div class="collection-card">
+            <div class="product-details">
+                <h3 class="product-title">{title}</h3>
+                <div class="price-container"><span class="price">${price:.2f}</span></div>
+                <p style="font-size: 14px; color: #777;">Rating: Not Rated</p>
+                <p style="font-size: 14px; color: #777;">{colors} Colors</p>
+            </div>
+        </div>""",
+    """
+        <div class="collection-card">
+            <div class="product-details">
+                <h3 class="product-title">{title}</h3>
+                <div class="price-container"><span class="price">${price:.2f}""",
+]
+
+
+def is_malformed(number: int, malformed_rate: float, seed: int = 0) -> bool:
+    """Tentukan secara deterministik apakah card nomor ini dibuat rusak"""
+    return malformed_rate > 0 and random.Random(seed * 1000003 + number).random() < malformed_rate
+
+
+def render_card(number: int, malformed: bool = False) -> str:
+    """Render satu card produk yang deterministik berdasarkan nomor produk"""
+    template = MALFORMED_CARD_TEMPLATES[number % len(MALFORMED_CARD_TEMPLATES)] if malformed else CARD_TEMPLATE
+    return template.format(
+        number=number,
+        title=f"{PRODUCT_TYPES[number % len(PRODUCT_TYPES)]} {number}",
+        price=10 + (number * 37 % 49000) / 100,
+        rating=1 + (number * 7 % 40) / 10,
+        colors=1 + number % 5,
+        size=SIZES[number % len(SIZES)],
+        gender=GENDERS[number % len(GENDERS)],
+    )
+
+
+def render_page(page_num: int, total_pages: int, cards_per_page: int, show_page_count: bool = True,
+                malformed_rate: float = 0.0, seed: int = 0) -> str:
+    """Render satu halaman katalog lengkap dengan pagination"""
+    first = (page_num - 1) * cards_per_page + 1
+    cards = "".join(render_card(n, is_malformed(n, malformed_rate, seed))
+                    for n in range(first, first + cards_per_page))
+
+    links = []
+    if page_num > 1:
+        links.append(f'<li class="page-item previous"><a class="page-link" href="/page{page_num - 1}">Previous</a></li>')
+    if show_page_count:
+        links.append(f'<li class="page-item current"><span class="page-link">Page {page_num} of {total_pages}</span></li>')
+    if page_num < total_pages:
+        links.append(f'<li class="page-item next"><a class="page-link" href="/page{page_num + 1}">Next</a></li>')
+
+    return f"""<!DOCTYPE html>
+<html>
+<head><title>Fashion Studio</title></head>
+<body>
+    <div class="collection-grid" id="collectionList">{cards}
+    </div>
+    <ul class="pagination">{"".join(links)}</ul>
+</body>
+</html>"""
+
+
+class FakeFashionSite:
+    """Server HTTP lokal yang meniru markup fashion-studio"""
+
+    def __init__(self, pages: int = 3, cards_per_page: int = 20, show_page_count: bool = True,
+                 fail_pages: dict = None, latency: float = 0.0, latency_jitter: float = 0.0,
+                 error_rate: float = 0.0, malformed_rate: float = 0.0, seed: int = 0,
+                 host: str = '127.0.0.1', port: int = 0):
+        self.pages = pages
+        self.cards_per_page = cards_per_page
+        self.show_page_count = show_page_count
+        self.fail_pages = dict(fail_pages or {})
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.malformed_rate = malformed_rate
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.errors_served = 0
+        self.server = ThreadingHTTPServer((host, port), self._make_handler())
+        self.server.daemon_threads = True
+        self.thread = None
+        self.requests_served = 0
+        self.not_modified_served = 0
+        self.last_modified = 'Mon, 01 Jan 2024 00:00:00 GMT'
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def _make_handler(self):
+        site = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            disable_nagle_algorithm = True
+
+            def do_GET(self):
+                page_num = site.resolve_page(self.path)
+                if page_num is None:
+                    self.send_error(404)
+                    return
+
+                site.requests_served += 1
+                delay = site.response_delay()
+                if delay:
+                    time.sleep(delay)
+
+                if site.take_failure(page_num):
+                    self.send_response(503)
+                    self.send_header('Retry-After', '0')
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                body = render_page(page_num, site.pages, site.cards_per_page, site.show_page_count,
+                                   site.malformed_rate, site.seed).encode('utf-8')
+                etag = '"' + hashlib.md5(body).hexdigest() + '"'
+
+                if self.headers.get('If-None-Match') == etag:
+                    site.not_modified_served += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('ETag', etag)
+                self.send_header('Last-Modified', site.last_modified)
+                if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                    body = gzip.compress(body)
+                    self.send_header('Content-Encoding', 'gzip')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def resolve_page(self, path: str):
+        """Petakan path URL ke nomor page, None jika tidak ada"""
+        if path in ('/', ''):
+            return 1
+        match = re.fullmatch(r'/page(\d+)', path, flags=re.IGNORECASE)
+        if match and 1 <= int(match.group(1)) <= self.pages:
+            return int(match.group(1))
+        return None
+
+    def response_delay(self) -> float:
+        with self.lock:
+            return self.latency + self.rng.uniform(0, self.latency_jitter)
+
+    def take_failure(self, page_num: int) -> bool:
+        """True jika request untuk page ini harus dibalas 503"""
+        with self.lock:
+            if self.fail_pages.get(page_num, 0) > 0:
+                self.fail_pages[page_num] -= 1
+                self.errors_served += 1
+                return True
+            if self.error_rate and self.rng.random() < self.error_rate:
+                self.errors_served += 1
+                return True
+        return False
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, kwargs={'poll_interval': 0.05},
+                                       daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stand-in lokal fashion-studio")
+    parser.add_argument('--pages', type=int, default=50)
+    parser.add_argument('--cards-per-page', type=int, default=20)
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--latency', type=float, default=0.0, help="latency tetap per response (detik)")
+    parser.add_argument('--latency-jitter', type=float, default=0.0, help="tambahan latency acak (detik)")
+    parser.add_argument('--error-rate', type=float, default=0.0, help="peluang response 503")
+    parser.add_argument('--malformed-rate', type=float, default=0.0, help="peluang card rusak")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    site = FakeFashionSite(args.pages, args.cards_per_page, latency=args.latency,
+                           latency_jitter=args.latency_jitter, error_rate=args.error_rate,
+                           malformed_rate=args.malformed_rate, seed=args.seed, port=args.port)
+    print(f"Serving {args.pages} pages on {site.url}")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.server.server_close()
+
+
+if __name__ == '__main__':
+    main()
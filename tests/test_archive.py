@@ -0,0 +1,115 @@
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.archive import HtmlArchive
+from utils.checkpoint import CheckpointStore
+from utils.extract import ProductExtractor, ReplayExtractor, extract_fashion_data
+from tests.fake_site import FakeFashionSite
+
+
+class TestHtmlArchive(unittest.TestCase):
+    
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp()
+        self.archive = HtmlArchive(self.archive_dir, run_id="run1")
+    
+    def tearDown(self):
+        shutil.rmtree(self.archive_dir)
+    
+    def test_identical_bodies_stored_once(self):
+        """Test body yang sama hanya disimpan satu kali"""
+        first = self.archive.store(1, 'http://x/', b'<html>same</html>')
+        second = self.archive.store(2, 'http://x/Page2', b'<html>same</html>')
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.archive.objects_written, 1)
+        self.assertEqual(self.archive.read(first), b'<html>same</html>')
+    
+    def test_manifest_latest_run(self):
+        """Test manifest run terakhir dipakai secara default"""
+        self.archive.store(1, 'http://x/', b'old')
+        self.archive.save_manifest()
+        
+        newer = HtmlArchive(self.archive_dir, run_id="run2")
+        digest = newer.store(1, 'http://x/', b'new')
+        newer.save_manifest()
+        
+        self.assertEqual(self.archive.list_runs(), ['run1', 'run2'])
+        self.assertEqual(self.archive.load_manifest()[1]['hash'], digest)
+        self.assertNotEqual(self.archive.load_manifest('run1')[1]['hash'], digest)
+    
+    def test_load_manifest_empty_archive(self):
+        """Test arsip tanpa manifest"""
+        with self.assertRaises(FileNotFoundError):
+            self.archive.load_manifest()
+
+
+class TestReplay(unittest.TestCase):
+    
+    def setUp(self):
+        self.archive_dir = tempfile.mkdtemp()
+    
+    def tearDown(self):
+        shutil.rmtree(self.archive_dir)
+    
+    def test_replay_matches_live_run(self):
+        """Test replay dari arsip menghasilkan data yang sama tanpa network"""
+        with FakeFashionSite(pages=3, cards_per_page=4) as site:
+            extractor = ProductExtractor(base_url=site.url, requests_per_second=1000,
+                                         archive_dir=self.archive_dir)
+            live_products = extractor.scrape_all_pages(1, 3)
+            extractor.archive.save_manifest()
+        
+        replay = ReplayExtractor(self.archive_dir, parser='lxml')
+        
+        self.assertEqual(replay.discover_last_page(), 3)
+        self.assertEqual(replay.scrape_all_pages(1, 3), live_products)
+        self.assertEqual(extract_fashion_data(1, None, replay_dir=self.archive_dir), live_products)
+    
+    def test_replay_after_discovery_run(self):
+        """Test page 1 yang diambil saat discovery (end_page=None) ikut diarsip dan di-replay"""
+        with FakeFashionSite(pages=6, cards_per_page=5) as site:
+            live_products = extract_fashion_data(1, None, requests_per_second=1000, base_url=site.url,
+                                                 archive_dir=self.archive_dir)
+        
+        manifest = HtmlArchive(self.archive_dir).load_manifest()
+        
+        self.assertEqual(sorted(manifest), [1, 2, 3, 4, 5, 6])
+        self.assertEqual(len(live_products), 30)
+        self.assertEqual(extract_fashion_data(1, None, replay_dir=self.archive_dir), live_products)
+    
+    def test_replay_leaves_checkpoint_untouched(self):
+        """Test replay tidak menghapus atau mengisi checkpoint run live yang terputus"""
+        archive = HtmlArchive(self.archive_dir)
+        archive.store(1, 'http://x/', b'<div></div>')
+        archive.save_manifest()
+        checkpoint_dir = os.path.join(self.archive_dir, "checkpoint")
+        store = CheckpointStore(checkpoint_dir)
+        store.save_page(2, [])
+        store.save_meta({'last_page': 5})
+        
+        extract_fashion_data(1, None, replay_dir=self.archive_dir, checkpoint_dir=checkpoint_dir)
+        extract_fashion_data(1, None, replay_dir=self.archive_dir, checkpoint_dir=checkpoint_dir, resume=True)
+        
+        self.assertEqual(list(store.load_pages()), [2])
+        self.assertEqual(store.load_meta(), {'last_page': 5})
+    
+    def test_replay_missing_page(self):
+        """Test page yang tidak ada di arsip dianggap not_found"""
+        archive = HtmlArchive(self.archive_dir)
+        archive.store(1, 'http://x/', b'<div></div>')
+        archive.save_manifest()
+        
+        replay = ReplayExtractor(self.archive_dir)
+        
+        self.assertEqual(replay.scrape_page(2), [])
+        self.assertEqual(replay.ledger[2]['status'], 'not_found')
+
+
+if __name__ == '__main__':
+    unittest.main()
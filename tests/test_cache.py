@@ -0,0 +1,97 @@
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.cache import ResponseCache
+from utils.extract import ProductExtractor
+from tests.fake_site import FakeFashionSite
+
+
+class TestResponseCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = ResponseCache(self.cache_dir, max_bytes=100)
+    
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+    
+    def test_conditional_headers(self):
+        """Test header validator dari entry yang tersimpan"""
+        self.assertEqual(self.cache.conditional_headers('http://x/'), {})
+        
+        self.cache.store('http://x/', b'body', {'ETag': '"abc"', 'Last-Modified': 'yesterday'})
+        
+        self.assertEqual(self.cache.conditional_headers('http://x/'),
+                         {'If-None-Match': '"abc"', 'If-Modified-Since': 'yesterday'})
+    
+    def test_store_without_validators(self):
+        """Test response tanpa validator tidak di cache"""
+        self.cache.store('http://x/', b'body', {})
+        
+        self.assertEqual(self.cache.misses, 1)
+        self.assertEqual(len(self.cache.entries), 0)
+    
+    def test_hit_counts_bytes_saved(self):
+        """Test hit menghitung bytes yang tidak perlu di download"""
+        self.cache.store('http://x/', b'0123456789', {'ETag': '"a"'})
+        
+        self.assertEqual(self.cache.hit('http://x/'), b'0123456789')
+        self.assertEqual(self.cache.hits, 1)
+        self.assertEqual(self.cache.bytes_saved, 10)
+    
+    def test_lru_eviction(self):
+        """Test entry paling lama tidak dipakai dihapus saat melebihi max_bytes"""
+        self.cache.store('http://x/1', b'a' * 40, {'ETag': '"1"'})
+        self.cache.store('http://x/2', b'b' * 40, {'ETag': '"2"'})
+        self.cache.hit('http://x/1')
+        self.cache.store('http://x/3', b'c' * 40, {'ETag': '"3"'})
+        
+        self.assertIn('http://x/1', self.cache.entries)
+        self.assertNotIn('http://x/2', self.cache.entries)
+        self.assertIn('http://x/3', self.cache.entries)
+        self.assertLessEqual(self.cache.total_bytes, 100)
+    
+    def test_index_persists(self):
+        """Test index cache bisa dibaca ulang"""
+        self.cache.store('http://x/', b'body', {'ETag': '"abc"'})
+        self.cache.save()
+        
+        reloaded = ResponseCache(self.cache_dir, max_bytes=100)
+        
+        self.assertEqual(reloaded.hit('http://x/'), b'body')
+
+
+class TestExtractorWithCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.site = FakeFashionSite(pages=3, cards_per_page=4).start()
+    
+    def tearDown(self):
+        self.site.stop()
+        shutil.rmtree(self.cache_dir)
+    
+    def test_second_run_served_from_cache(self):
+        """Test run kedua memakai 304 dan body dari cache"""
+        first = ProductExtractor(base_url=self.site.url, requests_per_second=1000,
+                                 cache_dir=self.cache_dir)
+        first_products = first.scrape_all_pages(1, 3)
+        first.cache.save()
+        
+        second = ProductExtractor(base_url=self.site.url, requests_per_second=1000,
+                                  cache_dir=self.cache_dir)
+        second_products = second.scrape_all_pages(1, 3)
+        
+        self.assertEqual(first_products, second_products)
+        self.assertEqual(second.cache.hits, 3)
+        self.assertEqual(second.cache.misses, 0)
+        self.assertEqual(self.site.not_modified_served, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
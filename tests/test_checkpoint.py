@@ -0,0 +1,103 @@
+import unittest
+import os
+import sys
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.checkpoint import CheckpointStore
+from utils.extract import ProductExtractor
+from tests.fake_site import FakeFashionSite
+
+
+class TestCheckpointStore(unittest.TestCase):
+    
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.store = CheckpointStore(self.checkpoint_dir)
+    
+    def tearDown(self):
+        shutil.rmtree(self.checkpoint_dir)
+    
+    def test_save_and_load_pages(self):
+        """Test page tersimpan dan bisa dibaca ulang"""
+        self.store.save_page(2, [{'Title': 'Hoodie 2'}])
+        self.store.save_page(1, [])
+        
+        self.assertEqual(self.store.load_pages(), {1: [], 2: [{'Title': 'Hoodie 2'}]})
+        self.assertFalse([f for f in os.listdir(self.checkpoint_dir) if f.endswith('.tmp')])
+    
+    def test_corrupt_page_skipped(self):
+        """Test file checkpoint rusak diabaikan"""
+        self.store.save_page(1, [{'Title': 'T-shirt 1'}])
+        with open(self.store.page_path(2), 'w') as f:
+            f.write('[{"Title": ')
+        
+        self.assertEqual(list(self.store.load_pages()), [1])
+    
+    def test_clear(self):
+        """Test clear menghapus semua page"""
+        self.store.save_page(1, [])
+        self.store.save_meta({'last_page': 1})
+        self.store.clear()
+        
+        self.assertEqual(self.store.load_pages(), {})
+        self.assertEqual(self.store.load_meta(), {})
+
+
+class TestExtractorResume(unittest.TestCase):
+    
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.site = FakeFashionSite(pages=4, cards_per_page=2).start()
+    
+    def tearDown(self):
+        self.site.stop()
+        shutil.rmtree(self.checkpoint_dir)
+    
+    def make_extractor(self, resume):
+        return ProductExtractor(base_url=self.site.url, requests_per_second=1000,
+                                checkpoint_dir=self.checkpoint_dir, resume=resume)
+    
+    def test_resume_fetches_only_missing_pages(self):
+        """Test resume hanya fetch page yang belum ada di checkpoint"""
+        expected = self.make_extractor(resume=False).scrape_all_pages(1, 4)
+        os.remove(CheckpointStore(self.checkpoint_dir).page_path(3))
+        
+        extractor = self.make_extractor(resume=True)
+        products = extractor.scrape_all_pages(1, 4)
+        
+        self.assertEqual(products, expected)
+        self.assertEqual(extractor.page_requests, 1)
+        self.assertEqual(sorted(extractor.ledger), [3])
+    
+    def test_discovery_page_checkpointed_and_reused(self):
+        """Test page 1 dari discovery ikut di-checkpoint, resume tidak fetch ulang page 1 untuk discovery"""
+        first = self.make_extractor(resume=False)
+        expected = first.scrape_all_pages(1, first.discover_last_page())
+        
+        self.assertEqual(sorted(first.checkpoint.load_pages()), [1, 2, 3, 4])
+        os.remove(CheckpointStore(self.checkpoint_dir).page_path(3))
+        
+        extractor = self.make_extractor(resume=True)
+        last_page = extractor.discover_last_page()
+        products = extractor.scrape_all_pages(1, last_page)
+        
+        self.assertEqual(last_page, 4)
+        self.assertEqual(products, expected)
+        self.assertEqual(extractor.discovery_requests, 0)
+        self.assertEqual(sorted(extractor.ledger), [3])
+    
+    def test_fresh_run_clears_checkpoint(self):
+        """Test run tanpa resume mulai dari awal"""
+        self.make_extractor(resume=False).scrape_all_pages(1, 2)
+        
+        extractor = self.make_extractor(resume=False)
+        
+        self.assertEqual(extractor.restored, {})
+        self.assertEqual(extractor.checkpoint.load_pages(), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
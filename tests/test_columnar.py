@@ -0,0 +1,125 @@
+import unittest
+import pandas as pd
+import pyarrow as pa
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.columnar import ColumnarBatch, arrow_to_frame
+from utils.load import DataLoader, load_fashion_data
+from utils.extract import ProductExtractor
+from utils.transform import DataTransformer, transform_fashion_stream
+from tests.fake_site import FakeFashionSite
+
+
+def make_products(count: int):
+    return [{'Title': f'Item {i % 9}', 'Price': f'${10 + i % 4}.00', 'Rating': 'Rating: 4.0 / 5',
+             'Colors': '3 Colors', 'Size': 'Size: M', 'Gender': 'Gender: Women'} for i in range(count)]
+
+
+class TestColumnarBatch(unittest.TestCase):
+    
+    def test_round_trip_records(self):
+        """Test record masuk ke buffer kolom dan bisa dibaca kembali sebagai dict"""
+        products = make_products(3)
+        batch = ColumnarBatch.from_records(products)
+        
+        self.assertEqual(len(batch), 3)
+        self.assertEqual(batch.columns['Title'], ['Item 0', 'Item 1', 'Item 2'])
+        self.assertEqual(batch.to_records(), products)
+        self.assertEqual(batch[1], products[1])
+    
+    def test_missing_field_is_none(self):
+        """Test field yang tidak ada di record menjadi None"""
+        batch = ColumnarBatch.from_records([{'Title': 'Hoodie 1'}])
+        
+        self.assertIsNone(batch.columns['Price'][0])
+    
+    def test_extend_with_batch_and_records(self):
+        """Test extend dengan ColumnarBatch lain maupun list of dict"""
+        batch = ColumnarBatch.from_records(make_products(2))
+        batch.extend(ColumnarBatch.from_records(make_products(3)))
+        batch.extend(make_products(1))
+        
+        self.assertEqual(len(batch), 6)
+        self.assertEqual(batch.to_frame().shape, (6, 6))
+    
+    def test_transform_matches_dict_path(self):
+        """Test transform dari ColumnarBatch sama dengan dari list of dict"""
+        products = make_products(40)
+        transformer = DataTransformer()
+        
+        expected = transformer.transform_data(products)
+        
+        pd.testing.assert_frame_equal(transformer.transform_data(ColumnarBatch.from_records(products)), expected)
+        streamed = pd.concat(transform_fashion_stream(
+            [ColumnarBatch.from_records(products[i:i + 7]) for i in range(0, 40, 7)], chunk_size=10),
+            ignore_index=True)
+        pd.testing.assert_frame_equal(streamed, expected)
+
+
+class TestArrowInterchange(unittest.TestCase):
+    
+    def test_to_arrow(self):
+        """Test ColumnarBatch menjadi Arrow record batch dan frame Arrow-backed"""
+        batch = ColumnarBatch.from_records(make_products(3) + [{'Title': 'Hoodie 9'}]).to_arrow()
+        frame = arrow_to_frame(batch)
+        
+        self.assertIsInstance(batch, pa.RecordBatch)
+        self.assertEqual(batch.num_rows, 4)
+        self.assertEqual(frame['Title'].dtype, pd.StringDtype('pyarrow'))
+        self.assertTrue(pd.isna(frame['Price'][3]))
+    
+    def test_arrow_profile_matches_standard(self):
+        """Test transform profile arrow dari record batch memberi nilai yang sama dengan profile standard"""
+        products = make_products(40) + [dict(make_products(1)[0], Title='Unknown Product')]
+        expected = DataTransformer().transform_data(products)
+        
+        transformer = DataTransformer(profile='arrow')
+        result = transformer.transform_data(ColumnarBatch.from_records(products).to_arrow())
+        streamed = pd.concat(transformer.transform_stream(
+            [ColumnarBatch.from_records(products[i:i + 7]).to_arrow() for i in range(0, 41, 7)], chunk_size=10),
+            ignore_index=True)
+        
+        self.assertEqual(str(result['Price'].dtype), 'double[pyarrow]')
+        self.assertEqual(result['Size'].dtype, pd.StringDtype('pyarrow'))
+        pd.testing.assert_frame_equal(result.astype(expected.dtypes), expected)
+        pd.testing.assert_frame_equal(streamed, result)
+    
+    def test_validate_and_load_arrow(self):
+        """Test validate_data menerima dtype Arrow dan DataLoader menerima Arrow Table"""
+        df = DataTransformer(profile='arrow').transform_data(make_products(20))
+        loader = DataLoader(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, loader.output_dir)
+        
+        self.assertTrue(loader.validate_data(df, profile='arrow'))
+        self.assertTrue(loader.validate_data(df, profile='standard'))
+        
+        csv_path = load_fashion_data(pa.Table.from_pandas(df), output_dir=loader.output_dir, profile='arrow')
+        self.assertEqual(len(pd.read_csv(csv_path)), len(df))
+
+
+class TestColumnarExtraction(unittest.TestCase):
+    
+    def setUp(self):
+        self.site = FakeFashionSite(pages=3, cards_per_page=4).start()
+    
+    def tearDown(self):
+        self.site.stop()
+    
+    def test_scrape_all_pages_columnar(self):
+        """Test extractor columnar menghasilkan data yang sama dengan list of dict"""
+        options = dict(base_url=self.site.url, max_workers=2, requests_per_second=1000)
+        expected = ProductExtractor(**options).scrape_all_pages(1, 3)
+        
+        batch = ProductExtractor(columnar=True, **options).scrape_all_pages(1, 3)
+        
+        self.assertIsInstance(batch, ColumnarBatch)
+        self.assertEqual(batch.to_records(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
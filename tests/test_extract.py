@@ -1,19 +1,33 @@
 import unittest
 from unittest.mock import Mock, patch
+import asyncio
 import os
+import shutil
 import sys
+import tempfile
+import time
 import requests
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 
-from utils.extract import ProductExtractor, extract_fashion_data
+from utils.extract import (ProductExtractor, AsyncProductExtractor, ProcessPoolExtractor, TokenBucket,
+                           extract_fashion_data, iter_fashion_data, parse_page_records)
 from bs4 import BeautifulSoup
+from tests.fake_site import FakeFashionSite, render_page
 
 
 class TestProductExtractor(unittest.TestCase):
     
+    parser = 'html.parser'
+    
     def setUp(self):
-        self.extractor = ProductExtractor()
+        self.extractor = ProductExtractor(parser=self.parser)
+    
+    def parse(self, html_content):
+        if self.parser == 'html.parser':
+            soup = BeautifulSoup(html_content, 'html.parser')
+            return self.extractor.extract_product_data(soup)
+        return self.extractor.parse_page(html_content.encode('utf-8'))
     
     def test_init(self):
         """initialization"""
@@ -33,8 +47,7 @@ class TestProductExtractor(unittest.TestCase):
         </div>
         """
         
-        soup = BeautifulSoup(html_content, 'html.parser')
-        products = self.extractor.extract_product_data(soup)
+        products = self.parse(html_content)
         
         self.assertEqual(len(products), 1)
         product = products[0]
@@ -59,8 +72,7 @@ class TestProductExtractor(unittest.TestCase):
         </div>
         """
         
-        soup = BeautifulSoup(html_content, 'html.parser')
-        products = self.extractor.extract_product_data(soup)
+        products = self.parse(html_content)
         
         self.assertEqual(len(products), 1)
         product = products[0]
@@ -71,8 +83,7 @@ class TestProductExtractor(unittest.TestCase):
     def test_extract_product_data_empty_html(self):
         """Test extractdata dari html kosong"""
         html_content = "<div></div>"
-        soup = BeautifulSoup(html_content, 'html.parser')
-        products = self.extractor.extract_product_data(soup)
+        products = self.parse(html_content)
         
         self.assertEqual(len(products), 0)
     
@@ -115,6 +126,60 @@ class TestProductExtractor(unittest.TestCase):
         self.assertEqual(mock_scrape_page.call_count, 3)
         self.assertEqual(len(products), 3)
     
+    @patch('utils.extract.ProductExtractor.scrape_page')
+    def test_scrape_all_pages_concurrent_keeps_order(self, mock_scrape_page):
+        """Test scraping paralel tetap urut sesuai nomor page"""
+        def fake_scrape(page_num):
+            time.sleep(0.01 * (5 - page_num))
+            return [{'Title': f'Product {page_num}'}]
+        
+        mock_scrape_page.side_effect = fake_scrape
+        extractor = ProductExtractor(max_workers=4, requests_per_second=1000)
+        
+        products = extractor.scrape_all_pages(1, 4)
+        
+        self.assertEqual([p['Title'] for p in products],
+                         ['Product 1', 'Product 2', 'Product 3', 'Product 4'])
+    
+    @patch('utils.extract.ProductExtractor.scrape_page')
+    def test_iter_pages_yields_batch_per_page(self, mock_scrape_page):
+        """Test iter_pages yield satu batch untuk setiap page"""
+        mock_scrape_page.side_effect = lambda page_num: [{'Title': f'Product {page_num}'}] * page_num
+        extractor = ProductExtractor(max_workers=2, requests_per_second=1000)
+        
+        batches = list(extractor.iter_pages(1, 5))
+        
+        self.assertEqual([len(batch) for batch in batches], [1, 2, 3, 4, 5])
+    
+    def test_token_bucket_limits_rate(self):
+        """Test token bucket membatasi jumlah request per detik"""
+        bucket = TokenBucket(rate=20, capacity=1)
+        
+        start = time.monotonic()
+        for _ in range(5):
+            bucket.acquire()
+        elapsed = time.monotonic() - start
+        
+        self.assertGreaterEqual(elapsed, 0.15)
+    
+    def test_token_bucket_invalid_rate(self):
+        """Test token bucket dengan rate tidak valid"""
+        with self.assertRaises(ValueError):
+            TokenBucket(rate=0)
+    
+    def test_parse_page_matches_default_parser(self):
+        """Test parser backend menghasilkan dict yang sama dengan html.parser"""
+        content = render_page(1, 2, 10).encode('utf-8')
+        expected = ProductExtractor().extract_product_data(BeautifulSoup(content, 'html.parser'))
+        
+        self.assertEqual(len(expected), 10)
+        self.assertEqual(self.extractor.parse_page(content), expected)
+    
+    def test_unknown_parser(self):
+        """Test parser backend yang tidak dikenal"""
+        with self.assertRaises(ValueError):
+            ProductExtractor(parser='regex')
+    
     @patch('utils.extract.ProductExtractor')
     def test_extract_fashion_data(self, mock_extractor_class):
         """Test main extract function"""
@@ -131,5 +196,197 @@ class TestProductExtractor(unittest.TestCase):
         mock_extractor.scrape_all_pages.assert_called_once_with(1, 2)
 
 
+
+class TestProductExtractorLxml(TestProductExtractor):
+    
+    parser = 'lxml'
+
+
+class TestPaginationDiscovery(unittest.TestCase):
+    
+    def start_site(self, **kwargs):
+        site = FakeFashionSite(cards_per_page=2, **kwargs).start()
+        self.addCleanup(site.stop)
+        return site
+    
+    def test_discover_from_page_count(self):
+        """Test page terakhir dibaca dari teks pagination page 1"""
+        site = self.start_site(pages=7)
+        extractor = ProductExtractor(base_url=site.url)
+        
+        self.assertEqual(extractor.discover_last_page(), 7)
+        self.assertEqual(extractor.discovery_requests, 1)
+        self.assertIn(1, extractor.prefetched)
+    
+    def test_discover_by_probing(self):
+        """Test probe exponential lalu binary search tanpa teks pagination"""
+        site = self.start_site(pages=13, show_page_count=False)
+        extractor = ProductExtractor(base_url=site.url, requests_per_second=1000)
+        
+        last_page = extractor.discover_last_page()
+        products = extractor.scrape_all_pages(1, last_page)
+        
+        self.assertEqual(last_page, 13)
+        self.assertEqual(len(products), 26)
+        self.assertLess(extractor.discovery_requests + extractor.page_requests, 13 + 8)
+    
+    def test_early_stop_after_empty_pages(self):
+        """Test scraping berhenti setelah beberapa page kosong berturut-turut"""
+        site = self.start_site(pages=5)
+        extractor = ProductExtractor(base_url=site.url, requests_per_second=1000, max_empty_pages=2)
+        
+        products = extractor.scrape_all_pages(1, None)
+        
+        self.assertEqual(len(products), 10)
+        self.assertEqual(extractor.page_requests, 7)
+    
+    def test_early_stop_concurrent(self):
+        """Test early stop pada mode concurrent"""
+        site = self.start_site(pages=9)
+        extractor = ProductExtractor(base_url=site.url, max_workers=3, requests_per_second=1000,
+                                     max_empty_pages=2)
+        
+        products = extractor.scrape_all_pages(1, None)
+        
+        self.assertEqual(len(products), 18)
+        self.assertLessEqual(extractor.page_requests, 9 + 2 + 6)
+    
+    def test_extract_fashion_data_discovers_end_page(self):
+        """Test extract_fashion_data dengan end_page=None"""
+        site = self.start_site(pages=4)
+        
+        products = extract_fashion_data(1, None, max_workers=2, requests_per_second=1000,
+                                        base_url=site.url)
+        
+        self.assertEqual(len(products), 8)
+
+
+class TestAsyncProductExtractor(unittest.TestCase):
+    
+    def setUp(self):
+        self.site = FakeFashionSite(pages=4, cards_per_page=5).start()
+    
+    def tearDown(self):
+        self.site.stop()
+    
+    def test_scrape_all_pages_against_local_site(self):
+        """Test async extractor terhadap server lokal"""
+        extractor = AsyncProductExtractor(base_url=self.site.url, max_workers=3)
+        
+        products = asyncio.run(extractor.scrape_all_pages(1, 4))
+        
+        self.assertEqual(len(products), 20)
+        self.assertEqual(products[0]['Title'], 'Hoodie 1')
+        self.assertEqual(products[-1]['Title'], 'Sweater 20')
+    
+    def test_matches_sync_engine(self):
+        """Test hasil async sama dengan hasil sync"""
+        sync_products = ProductExtractor(base_url=self.site.url, max_workers=2,
+                                         requests_per_second=1000).scrape_all_pages(1, 4)
+        async_products = asyncio.run(
+            AsyncProductExtractor(base_url=self.site.url).scrape_all_pages(1, 4))
+        
+        self.assertEqual(sync_products, async_products)
+    
+    def test_missing_page_returns_empty(self):
+        """Test page yang tidak ada menghasilkan list kosong"""
+        extractor = AsyncProductExtractor(base_url=self.site.url)
+        
+        products = asyncio.run(extractor.scrape_all_pages(5, 6))
+        
+        self.assertEqual(products, [])
+    
+    def test_scan_until_empty_without_last_page(self):
+        """Test tanpa hasil discovery, async scrape sampai max_empty_pages page kosong (bukan 50 page)"""
+        extractor = AsyncProductExtractor(base_url=self.site.url, max_workers=3, max_empty_pages=2)
+        
+        with patch.object(extractor, 'discover_last_page', return_value=None):
+            products = asyncio.run(extractor.scrape_all_pages(1, None))
+        
+        self.assertEqual(len(products), 20)
+        self.assertEqual(extractor.page_requests, 6)
+    
+    def test_extract_fashion_data_async_engine(self):
+        """Test extract_fashion_data memilih engine async dengan opsi extractor lengkap"""
+        index_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, index_dir)
+        
+        products = extract_fashion_data(1, 4, max_workers=3, base_url=self.site.url, engine='async',
+                                        page_index_dir=index_dir, columnar=True)
+        
+        self.assertEqual(len(products), 20)
+        self.assertEqual(products[0]['Title'], 'Hoodie 1')
+    
+    def test_extract_fashion_data_unknown_engine(self):
+        """Test engine yang tidak dikenal"""
+        with self.assertRaises(ValueError):
+            extract_fashion_data(1, 1, engine='curl')
+
+
+class TestProcessPoolExtractor(unittest.TestCase):
+    
+    def setUp(self):
+        self.site = FakeFashionSite(pages=4, cards_per_page=5).start()
+    
+    def tearDown(self):
+        self.site.stop()
+    
+    def test_matches_sync_engine(self):
+        """Test parsing di process pool menghasilkan data yang sama dengan sync"""
+        sync_products = ProductExtractor(base_url=self.site.url, max_workers=2,
+                                         requests_per_second=1000).scrape_all_pages(1, 4)
+        extractor = ProcessPoolExtractor(base_url=self.site.url, max_workers=2, requests_per_second=1000,
+                                         parser='lxml', parse_workers=2)
+        try:
+            products = extractor.scrape_all_pages(1, 4)
+        finally:
+            extractor.close()
+        
+        self.assertEqual(products, sync_products)
+        self.assertGreater(extractor.parse_busy, 0)
+        self.assertIn('parse', extractor.utilisation_report())
+    
+    def test_fetch_does_not_wait_for_parsing(self):
+        """Test dengan satu fetch thread beberapa page tetap diparsing paralel di process pool"""
+        sync_products = ProductExtractor(base_url=self.site.url, requests_per_second=1000).scrape_all_pages(1, 4)
+        extractor = ProcessPoolExtractor(base_url=self.site.url, max_workers=1, requests_per_second=1000,
+                                         parse_workers=2)
+        submitted = []
+        in_flight = []
+        submit = extractor.parse_pool.submit
+        
+        def record_submit(*args):
+            future = submit(*args)
+            submitted.append(future)
+            in_flight.append(sum(not future.done() for future in submitted))
+            return future
+        
+        with patch.object(extractor.parse_pool, 'submit', side_effect=record_submit), \
+                patch.object(extractor, 'parse_page', side_effect=AssertionError("blocking parse")):
+            try:
+                products = extractor.scrape_all_pages(1, 4)
+            finally:
+                extractor.close()
+        
+        self.assertEqual(products, sync_products)
+        self.assertEqual(len(submitted), 4)
+        self.assertGreater(max(in_flight), 1)
+    
+    def test_parse_page_records_returns_tuples(self):
+        """Test worker function return record tuple dan durasi parsing"""
+        records, elapsed = parse_page_records('html.parser', render_page(1, 1, 2).encode())
+        
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[0][0], 'Hoodie 1')
+        self.assertGreaterEqual(elapsed, 0)
+    
+    def test_iter_fashion_data_process_engine(self):
+        """Test streaming extraction dengan engine process"""
+        batches = list(iter_fashion_data(1, 4, max_workers=2, requests_per_second=1000,
+                                         base_url=self.site.url, engine='process', parse_workers=2))
+        
+        self.assertEqual(sum(len(batch) for batch in batches), 20)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,55 @@
+import unittest
+import os
+import sys
+import time
+
+import requests
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.extract import ProductExtractor
+from utils.retry import RetryPolicy
+from utils.transform import DataTransformer
+from tests.fake_site import FakeFashionSite, is_malformed, render_page
+
+
+class TestFakeFashionSite(unittest.TestCase):
+    
+    def test_malformed_cards_deterministic(self):
+        """Test card rusak dipilih secara deterministik berdasarkan seed"""
+        first = render_page(3, 10, 20, malformed_rate=0.3, seed=7)
+        second = render_page(3, 10, 20, malformed_rate=0.3, seed=7)
+        
+        self.assertEqual(first, second)
+        self.assertFalse(any(is_malformed(n, 0.0) for n in range(100)))
+        self.assertTrue(all(is_malformed(n, 1.0) for n in range(100)))
+    
+    def test_malformed_cards_filtered_by_transform(self):
+        """Test card rusak bisa di parse dan dibuang saat transform"""
+        content = render_page(1, 1, 30, malformed_rate=1.0).encode('utf-8')
+        products = ProductExtractor(parser='lxml').parse_page(content)
+        
+        self.assertEqual(len(products), 30)
+        self.assertEqual(len(DataTransformer().transform_data(products)), 0)
+    
+    def test_injected_latency(self):
+        """Test latency diterapkan pada setiap response"""
+        with FakeFashionSite(pages=1, latency=0.1) as site:
+            start = time.perf_counter()
+            requests.get(site.url, timeout=5)
+            
+            self.assertGreaterEqual(time.perf_counter() - start, 0.1)
+    
+    def test_injected_errors_recovered_by_retry(self):
+        """Test error 503 acak ditangani retry extractor"""
+        with FakeFashionSite(pages=20, cards_per_page=2, error_rate=0.2, seed=1) as site:
+            extractor = ProductExtractor(base_url=site.url, max_workers=4, requests_per_second=1000,
+                                         retry_policy=RetryPolicy(max_retries=8, backoff_base=0.001))
+            products = extractor.scrape_all_pages(1, 20)
+        
+        self.assertGreater(site.errors_served, 0)
+        self.assertEqual(len(products), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,149 @@
+import unittest
+import numpy as np
+import os
+import shutil
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.fingerprint import FingerprintIndex, FingerprintSet
+from utils.load import DataLoader, load_fashion_data
+from utils.transform import DataTransformer, row_fingerprints
+
+
+class TestFingerprintSet(unittest.TestCase):
+    
+    def test_add_new_marks_first_occurrence(self):
+        """Test hanya kemunculan pertama yang dianggap baru, dalam batch maupun antar batch"""
+        seen = FingerprintSet()
+        
+        first = seen.add_new(np.array([5, 7, 5, 9], dtype=np.uint64))
+        second = seen.add_new(np.array([9, 11, 7, 11], dtype=np.uint64))
+        
+        self.assertEqual(first.tolist(), [True, True, False, True])
+        self.assertEqual(second.tolist(), [False, True, False, False])
+        self.assertEqual(len(seen), 4)
+    
+    def test_zero_fingerprint(self):
+        """Test fingerprint 0 (penanda slot kosong) tetap bisa disimpan"""
+        seen = FingerprintSet()
+        
+        self.assertEqual(seen.add_new(np.array([0, 0, 1], dtype=np.uint64)).tolist(), [True, False, True])
+        self.assertEqual(seen.add_new(np.array([0], dtype=np.uint64)).tolist(), [False])
+    
+    def test_matches_python_set_with_growth_and_collisions(self):
+        """Test hasil sama dengan set Python saat table membesar dan slot bertabrakan"""
+        rng = np.random.default_rng(0)
+        seen = FingerprintSet(capacity=16)
+        expected_seen = set()
+        
+        for _ in range(30):
+            # Kelipatan 1024 memaksa banyak fingerprint jatuh di slot awal yang sama
+            batch = (rng.integers(0, 3000, rng.integers(0, 500)) * 1024).astype(np.uint64)
+            expected = []
+            for value in batch.tolist():
+                expected.append(value not in expected_seen)
+                expected_seen.add(value)
+            
+            self.assertEqual(seen.add_new(batch).tolist(), expected)
+        
+        self.assertEqual(len(seen), len(expected_seen))
+        self.assertLessEqual(len(seen), seen.capacity * seen.max_load)
+    
+    def test_empty_batch(self):
+        """Test batch kosong"""
+        self.assertEqual(FingerprintSet().add_new([]).tolist(), [])
+
+
+class TestFingerprintIndex(unittest.TestCase):
+    
+    def setUp(self):
+        self.index_dir = tempfile.mkdtemp()
+        self.product = {
+            'Title': 'T-shirt 1',
+            'Price': '$50.00',
+            'Rating': 'Rating:  4.5 / 5',
+            'Colors': '3 Colors',
+            'Size': 'Size: M',
+            'Gender': 'Gender: Men'
+        }
+    
+    def tearDown(self):
+        shutil.rmtree(self.index_dir)
+    
+    def test_save_and_memory_map(self):
+        """Test index disimpan lalu di memory-map saat run berikutnya"""
+        index = FingerprintIndex(self.index_dir)
+        index.add_new(np.arange(100, dtype=np.uint64))
+        index.save()
+        
+        reloaded = FingerprintIndex(self.index_dir)
+        
+        self.assertIsInstance(reloaded.fingerprints.table, np.memmap)
+        self.assertEqual(reloaded.loaded, 100)
+        self.assertEqual(reloaded.add_new(np.array([5, 200], dtype=np.uint64)).tolist(), [False, True])
+        self.assertIn("1 new this run", reloaded.report())
+    
+    def test_growth_after_reload(self):
+        """Test table hasil memory-map tetap bisa membesar"""
+        index = FingerprintIndex(self.index_dir)
+        index.add_new(np.arange(1, 10, dtype=np.uint64))
+        index.save()
+        
+        reloaded = FingerprintIndex(self.index_dir)
+        reloaded.add_new(np.arange(1, 5000, dtype=np.uint64))
+        reloaded.save()
+        
+        self.assertEqual(len(FingerprintIndex(self.index_dir).fingerprints), 4999)
+    
+    def test_inconsistent_index_starts_empty(self):
+        """Test metadata yang tidak cocok dengan table dianggap index kosong"""
+        index = FingerprintIndex(self.index_dir)
+        index.add_new(np.arange(10, dtype=np.uint64))
+        index.save()
+        with open(os.path.join(self.index_dir, FingerprintIndex.META_FILE), 'w') as f:
+            f.write('{"capacity": 7')
+        
+        self.assertEqual(len(FingerprintIndex(self.index_dir).fingerprints), 0)
+    
+    def test_second_run_returns_only_new_rows(self):
+        """Test run kedua dengan history hanya menghasilkan row baru"""
+        first = DataTransformer(history=FingerprintIndex(self.index_dir))
+        self.assertEqual(len(first.transform_data([self.product])), 1)
+        first.history.save()
+        
+        other = dict(self.product, Title='Hoodie 2')
+        second = DataTransformer(history=FingerprintIndex(self.index_dir))
+        result = second.transform_data([self.product, other])
+        
+        self.assertEqual(result['Title'].tolist(), ['Hoodie 2'])
+    
+    def test_seed_from_existing_csv(self):
+        """Test index kosong yang diisi dari CSV run sebelumnya tidak meloloskan row yang sudah ada"""
+        output_dir = os.path.join(self.index_dir, "output")
+        load_fashion_data(DataTransformer().transform_data([self.product]), output_dir=output_dir)
+        
+        index = FingerprintIndex(os.path.join(self.index_dir, "index"))
+        index.seed(row_fingerprints(DataLoader(output_dir).read_csv("products.csv")))
+        other = dict(self.product, Title='Hoodie 2')
+        result = DataTransformer(history=index).transform_data([self.product, other])
+        
+        self.assertEqual(result['Title'].tolist(), ['Hoodie 2'])
+        self.assertIn("1 new this run", index.report())
+    
+    def test_stream_uses_history(self):
+        """Test streaming transform juga membuang row dari run sebelumnya"""
+        first = DataTransformer(history=FingerprintIndex(self.index_dir))
+        list(first.transform_stream(iter([[self.product]])))
+        first.history.save()
+        
+        other = dict(self.product, Title='Hoodie 2')
+        second = DataTransformer(history=FingerprintIndex(self.index_dir))
+        chunks = list(second.transform_stream(iter([[self.product], [other, self.product]])))
+        
+        self.assertEqual([title for chunk in chunks for title in chunk['Title']], ['Hoodie 2'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,10 +4,12 @@ import os
 import sys
 import tempfile
 import shutil
+import pyarrow.parquet as pq
+import sqlite3
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 
-from utils.load import DataLoader, load_fashion_data
+from utils.load import DataLoader, SummaryAccumulator, load_fashion_data, load_fashion_stream, merge_frames
 
 
 class TestDataLoader(unittest.TestCase):
@@ -49,6 +51,15 @@ class TestDataLoader(unittest.TestCase):
         result = self.loader.validate_data(self.sample_df)
         self.assertTrue(result)
     
+    def test_validate_data_compact_profile(self):
+        """Test validasi data dengan schema profile compact"""
+        compact_df = self.sample_df.astype({'Rating': 'float32', 'Colors': 'int8',
+                                            'Size': 'category', 'Gender': 'category'})
+        
+        self.assertTrue(self.loader.validate_data(compact_df, profile='compact'))
+        with self.assertRaises(ValueError):
+            self.loader.validate_data(compact_df, profile='tiny')
+    
     def test_validate_data_empty(self):
         """Test validasi data dengan DataFrame kosong"""
         empty_df = pd.DataFrame()
@@ -171,6 +182,208 @@ class TestDataLoader(unittest.TestCase):
         result = self.loader.validate_data(loaded_df)
         self.assertTrue(result)
 
+    
+    def test_summary_accumulator_matches_describe(self):
+        """Test statistik incremental sama dengan describe() sekaligus"""
+        df = pd.concat([self.sample_df, self.sample_df.assign(Price=[500000.0, 900000.0])],
+                       ignore_index=True)
+        accumulator = SummaryAccumulator()
+        accumulator.update(df.iloc[:1])
+        accumulator.update(df.iloc[1:])
+        
+        expected = df.describe().loc[['count', 'mean', 'std', 'min', 'max']]
+        pd.testing.assert_frame_equal(accumulator.describe(), expected, check_dtype=False)
+        self.assertEqual(dict(accumulator.gender_counts), {'Men': 2, 'Women': 2})
+    
+    def test_save_to_parquet_preserves_types(self):
+        """Test Parquet menyimpan dtype, statistik kolom dan ukuran row group"""
+        filepath = self.loader.save_to_parquet(self.sample_df, "products.parquet",
+                                               compression='zstd', row_group_size=1)
+        
+        metadata = pq.ParquetFile(filepath).metadata
+        self.assertEqual(metadata.num_row_groups, 2)
+        price = metadata.row_group(0).column(1)
+        self.assertEqual(price.compression, 'ZSTD')
+        self.assertTrue(price.is_stats_set)
+        self.assertEqual(price.statistics.min, 800000.0)
+        pd.testing.assert_frame_equal(pd.read_parquet(filepath), self.sample_df)
+    
+    def test_load_fashion_data_parquet(self):
+        """Test load_fashion_data dengan output_format parquet"""
+        path = load_fashion_data(self.sample_df, filename="out.csv", output_dir=self.test_dir,
+                                 output_format='parquet')
+        
+        self.assertEqual(os.path.basename(path), "out.parquet")
+        self.assertFalse(os.path.exists(os.path.join(self.test_dir, "out.csv")))
+        pd.testing.assert_frame_equal(pd.read_parquet(path), self.sample_df)
+        
+        with self.assertRaises(ValueError):
+            load_fashion_data(self.sample_df, output_dir=self.test_dir, output_format='xlsx')
+        with self.assertRaises(ValueError):
+            load_fashion_data(self.sample_df, output_dir=self.test_dir, output_format='parquet', append=True)
+    
+    def test_save_to_sqlite_upsert(self):
+        """Test upsert SQLite: row dengan key sama di-update, row baru di-insert"""
+        filepath = self.loader.save_to_sqlite(self.sample_df, batch_size=1)
+        changed = self.sample_df.copy()
+        changed.loc[0, 'Price'] = 900000.0
+        changed.loc[1, 'Title'] = 'Jacket 3'
+        self.loader.save_to_sqlite(changed)
+        
+        conn = sqlite3.connect(filepath)
+        try:
+            rows = conn.execute("SELECT Title, Price, Colors FROM products ORDER BY Title").fetchall()
+            indexes = {row[1] for row in conn.execute("PRAGMA index_list(products)")}
+            journal_mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        finally:
+            conn.close()
+        
+        self.assertEqual(rows, [('Hoodie 2', 1200000.0, 5), ('Jacket 3', 1200000.0, 5),
+                                ('T-shirt 1', 900000.0, 3)])
+        self.assertTrue({'ux_products_Title', 'ix_products_Gender', 'ix_products_Size',
+                         'ix_products_Price'} <= indexes)
+        self.assertEqual(journal_mode, 'wal')
+    
+    def test_save_to_sqlite_composite_key(self):
+        """Test natural key dari beberapa kolom, key yang tidak dikenal ditolak"""
+        df = pd.concat([self.sample_df, self.sample_df.assign(Size='XL')], ignore_index=True)
+        filepath = self.loader.save_to_sqlite(df, "sized.db", key=('Title', 'Size'))
+        
+        conn = sqlite3.connect(filepath)
+        try:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM products").fetchone()[0], 4)
+        finally:
+            conn.close()
+        
+        with self.assertRaises(ValueError):
+            self.loader.save_to_sqlite(df, key=('Sku',))
+    
+    def test_load_fashion_data_sqlite(self):
+        """Test load_fashion_data dengan output_format sqlite"""
+        path = load_fashion_data(self.sample_df, filename="out.csv", output_dir=self.test_dir,
+                                 output_format='sqlite')
+        
+        self.assertEqual(os.path.basename(path), "out.db")
+        conn = sqlite3.connect(path)
+        try:
+            result = pd.read_sql("SELECT * FROM products ORDER BY rowid", conn)
+        finally:
+            conn.close()
+        pd.testing.assert_frame_equal(result, self.sample_df, check_dtype=False)
+    
+    def test_merge_frames_counts(self):
+        """Test merge berdasarkan key menghitung insert / update / delete"""
+        incoming = pd.concat([self.sample_df.iloc[:1], self.sample_df.iloc[:1].assign(Title='Jacket 3')],
+                             ignore_index=True)
+        incoming.loc[0, 'Rating'] = 4.9
+        
+        merged, removed, counts = merge_frames(self.sample_df, incoming)
+        
+        self.assertEqual(counts, {'inserted': 1, 'updated': 1, 'deleted': 1})
+        self.assertEqual(list(merged['Title']), ['T-shirt 1', 'Jacket 3'])
+        self.assertEqual(merged.loc[0, 'Rating'], 4.9)
+        self.assertEqual(list(removed['Title']), ['Hoodie 2'])
+    
+    def test_merge_frames_unchanged_compact(self):
+        """Test float32 dari profile compact tidak dianggap berubah"""
+        compact = self.sample_df.astype({'Rating': 'float32', 'Colors': 'int8', 'Size': 'category'})
+        
+        _, _, counts = merge_frames(self.sample_df, compact)
+        
+        self.assertEqual(counts, {'inserted': 0, 'updated': 0, 'deleted': 0})
+    
+    def test_merge_compact_frame_keeps_float32_text(self):
+        """Test merge frame compact menulis Rating float32 sama seperti save_to_csv, bukan hasil widening"""
+        compact = self.sample_df.assign(Title=['T-shirt 1', 'Jacket 3'], Rating=[4.5, 3.3]).astype(
+            {'Rating': 'float32', 'Colors': 'int8', 'Size': 'category'})
+        
+        self.loader.merge_to_csv(self.sample_df, "merged.csv")
+        counts = self.loader.merge_to_csv(compact, "merged.csv")
+        
+        self.assertEqual(counts, {'inserted': 1, 'updated': 0, 'deleted': 1})
+        with open(os.path.join(self.test_dir, "merged.csv"), encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[1:], ['T-shirt 1,800000.0,4.5,3,M,Men', 'Jacket 3,1200000.0,3.3,5,L,Women'])
+    
+    def test_merge_to_csv(self):
+        """Test merge ke CSV: file ditulis ulang secara atomic dan row yang hilang dicatat"""
+        self.loader.merge_to_csv(self.sample_df, "merged.csv")
+        path = os.path.join(self.test_dir, "merged.csv")
+        mtime = os.stat(path).st_mtime_ns
+        
+        self.assertEqual(self.loader.merge_to_csv(self.sample_df, "merged.csv"),
+                         {'inserted': 0, 'updated': 0, 'deleted': 0})
+        self.assertEqual(os.stat(path).st_mtime_ns, mtime)
+        
+        changed = self.sample_df.iloc[1:].copy()
+        changed['Price'] = 1300000.0
+        counts = self.loader.merge_to_csv(changed, "merged.csv")
+        
+        self.assertEqual(counts, {'inserted': 0, 'updated': 1, 'deleted': 1})
+        self.assertFalse(os.path.exists(path + ".tmp"))
+        loaded_df = pd.read_csv(path)
+        self.assertEqual(list(loaded_df['Title']), ['Hoodie 2'])
+        self.assertEqual(list(loaded_df['Price']), [1300000.0])
+        removed_df = pd.read_csv(os.path.join(self.test_dir, "removed_products.csv"))
+        self.assertEqual(list(removed_df['Title']), ['T-shirt 1'])
+        self.assertIn('Removed At', removed_df.columns)
+    
+    def test_load_fashion_data_merge(self):
+        """Test load_fashion_data dengan merge=True"""
+        load_fashion_data(self.sample_df, filename="m.csv", output_dir=self.test_dir, merge=True)
+        path = load_fashion_data(self.sample_df.iloc[:1], filename="m.csv", output_dir=self.test_dir, merge=True)
+        
+        self.assertEqual(list(pd.read_csv(path)['Title']), ['T-shirt 1'])
+        with self.assertRaises(ValueError):
+            load_fashion_data(self.sample_df, output_dir=self.test_dir, merge=True, append=True)
+    
+    def test_load_fashion_stream(self):
+        """Test load per chunk menulis CSV dan summary"""
+        chunks = [self.sample_df.iloc[:1], self.sample_df.iloc[1:]]
+        
+        csv_path = load_fashion_stream(iter(chunks), filename="stream.csv", output_dir=self.test_dir)
+        
+        loaded_df = pd.read_csv(csv_path)
+        self.assertEqual(list(loaded_df['Title']), ['T-shirt 1', 'Hoodie 2'])
+        
+        with open(os.path.join(self.test_dir, "summary.txt"), encoding='utf-8') as f:
+            self.assertIn("Total Records: 2", f.read())
+    
+    def test_load_fashion_stream_empty(self):
+        """Test load streaming tanpa data"""
+        with self.assertRaises(ValueError):
+            load_fashion_stream(iter([]), filename="empty.csv", output_dir=self.test_dir)
+    
+    def test_load_fashion_stream_failure_keeps_previous_csv(self):
+        """Test CSV lama tetap utuh jika iterator chunk gagal di tengah jalan"""
+        csv_path = load_fashion_stream(iter([self.sample_df]), filename="keep.csv", output_dir=self.test_dir)
+        
+        def failing_frames():
+            yield self.sample_df.iloc[:1]
+            raise ConnectionError("network down")
+        
+        with self.assertRaises(ConnectionError):
+            load_fashion_stream(failing_frames(), filename="keep.csv", output_dir=self.test_dir)
+        with self.assertRaises(ValueError):
+            load_fashion_stream(iter([]), filename="keep.csv", output_dir=self.test_dir)
+        
+        self.assertEqual(list(pd.read_csv(csv_path)['Title']), ['T-shirt 1', 'Hoodie 2'])
+        self.assertEqual(os.listdir(self.test_dir).count("keep.csv.tmp"), 0)
+    
+    def test_append_mode(self):
+        """Test append menambahkan row ke CSV yang ada, header hanya ditulis sekali"""
+        load_fashion_data(self.sample_df.iloc[:1], filename="inc.csv", output_dir=self.test_dir, append=True)
+        load_fashion_stream(iter([self.sample_df.iloc[1:]]), filename="inc.csv",
+                            output_dir=self.test_dir, append=True)
+        csv_path = load_fashion_data(self.sample_df.iloc[:0], filename="inc.csv",
+                                     output_dir=self.test_dir, append=True)
+        
+        loaded_df = pd.read_csv(csv_path)
+        self.assertEqual(list(loaded_df['Title']), ['T-shirt 1', 'Hoodie 2'])
+        # Summary append menggambarkan seluruh CSV, bukan hanya row run terakhir
+        with open(os.path.join(self.test_dir, "summary.txt"), encoding='utf-8') as f:
+            self.assertIn("Total Records: 2", f.read())
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
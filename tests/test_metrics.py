@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.metrics import TransferStats, percentile
+from utils.extract import ProductExtractor
+from tests.fake_site import FakeFashionSite
+
+
+class TestMetrics(unittest.TestCase):
+    
+    def test_percentile(self):
+        """Test percentile nearest-rank"""
+        values = list(range(1, 101))
+        
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 99), 99)
+        self.assertEqual(percentile([0.2], 90), 0.2)
+        self.assertEqual(percentile([], 50), 0.0)
+    
+    def test_transfer_stats_report(self):
+        """Test ringkasan statistik transfer"""
+        stats = TransferStats()
+        stats.record(100, 400, 'gzip', 0.01)
+        stats.record(50, 50, None, 0.03)
+        
+        self.assertEqual(stats.compression_ratio, 3.0)
+        self.assertEqual(dict(stats.encodings), {'gzip': 1, 'identity': 1})
+        report = stats.report(connections_opened=1, connections_reused=1)
+        self.assertIn("150 bytes on wire", report)
+        self.assertIn("1 opened, 1 reused", report)
+
+
+class TestExtractorTransfer(unittest.TestCase):
+    
+    def setUp(self):
+        self.site = FakeFashionSite(pages=4, cards_per_page=20).start()
+    
+    def tearDown(self):
+        self.site.stop()
+    
+    def test_gzip_negotiated_and_connections_reused(self):
+        """Test response gzip dan koneksi keep-alive dipakai ulang"""
+        extractor = ProductExtractor(base_url=self.site.url, requests_per_second=1000)
+        
+        products = extractor.scrape_all_pages(1, 4)
+        opened, reused = extractor.connection_stats()
+        
+        self.assertEqual(len(products), 80)
+        self.assertEqual(extractor.transfer_stats.encodings['gzip'], 4)
+        self.assertLess(extractor.transfer_stats.wire_bytes, extractor.transfer_stats.decoded_bytes)
+        self.assertEqual(opened, 1)
+        self.assertEqual(reused, 3)
+    
+    def test_pool_size_follows_workers(self):
+        """Test ukuran pool mengikuti jumlah worker"""
+        self.assertEqual(ProductExtractor(max_workers=32).adapter._pool_maxsize, 32)
+        self.assertEqual(ProductExtractor(pool_size=5).adapter._pool_maxsize, 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+from unittest.mock import patch
+import os
+import sys
+import tempfile
+import shutil
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.page_index import PageIndex
+from utils.extract import ProductExtractor, ReplayExtractor
+from tests.fake_site import FakeFashionSite
+
+
+class TestPageIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.index_dir)
+
+    def test_lookup_requires_same_hash(self):
+        """Test record hanya dipakai ulang jika hash body sama"""
+        index = PageIndex(self.index_dir)
+        index.store(1, index.digest(b'<html>1</html>'), [{'Title': 'Hoodie 1'}])
+
+        self.assertEqual(index.lookup(1, index.digest(b'<html>1</html>')), [{'Title': 'Hoodie 1'}])
+        self.assertIsNone(index.lookup(1, index.digest(b'<html>changed</html>')))
+        self.assertIsNone(index.lookup(2, index.digest(b'<html>1</html>')))
+        self.assertIsNone(index.lookup(1, index.digest(b'<html>1</html>'), 'lxml:1'))
+        self.assertEqual((index.parsed, index.reused), (1, 1))
+
+    def test_save_and_reload(self):
+        """Test index persisten antar run"""
+        index = PageIndex(self.index_dir)
+        index.store(3, index.digest('body'), [{'Title': 'Hoodie 3'}])
+        index.save()
+
+        reloaded = PageIndex(self.index_dir)
+
+        self.assertEqual(reloaded.lookup(3, reloaded.digest(b'body')), [{'Title': 'Hoodie 3'}])
+
+    def test_corrupt_index_is_empty(self):
+        """Test index rusak dianggap kosong"""
+        with open(os.path.join(self.index_dir, PageIndex.INDEX_FILE), 'w') as f:
+            f.write('{broken')
+
+        self.assertEqual(PageIndex(self.index_dir).pages, {})
+
+
+class TestExtractorPageIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.index_dir = tempfile.mkdtemp()
+        self.site = FakeFashionSite(pages=3, cards_per_page=4).start()
+
+    def tearDown(self):
+        self.site.stop()
+        shutil.rmtree(self.index_dir)
+
+    def run_extractor(self, parser='html.parser'):
+        extractor = ProductExtractor(base_url=self.site.url, max_workers=2, requests_per_second=1000,
+                                     parser=parser, page_index_dir=self.index_dir)
+        products = extractor.scrape_all_pages(1, 3)
+        extractor.page_index.save()
+        return extractor, products
+
+    def test_unchanged_pages_are_not_parsed_again(self):
+        """Test run kedua memakai ulang record tanpa parsing"""
+        first, first_products = self.run_extractor()
+
+        with patch.object(ProductExtractor, 'parse_page') as parse_page:
+            second, second_products = self.run_extractor()
+
+        parse_page.assert_not_called()
+        self.assertEqual(second_products, first_products)
+        self.assertEqual((first.page_index.parsed, first.page_index.reused), (3, 0))
+        self.assertEqual((second.page_index.parsed, second.page_index.reused), (0, 3))
+        self.assertIn('0 pages parsed, 3 reused', second.page_index.report())
+
+
+    def test_parser_change_parses_again(self):
+        """Test record tidak dipakai ulang jika backend parser atau versi parser berubah"""
+        self.run_extractor()
+
+        lxml, _ = self.run_extractor(parser='lxml')
+        with patch('utils.extract.PARSER_VERSION', 2):
+            bumped, _ = self.run_extractor(parser='lxml')
+
+        self.assertEqual((lxml.page_index.parsed, lxml.page_index.reused), (3, 0))
+        self.assertEqual((bumped.page_index.parsed, bumped.page_index.reused), (3, 0))
+
+    def test_replay_ignores_page_index(self):
+        """Test replay selalu parse ulang arsip dengan parser saat ini"""
+        archive_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, archive_dir)
+        extractor = ProductExtractor(base_url=self.site.url, requests_per_second=1000,
+                                     page_index_dir=self.index_dir, archive_dir=archive_dir)
+        extractor.scrape_all_pages(1, 3)
+        extractor.page_index.save()
+        extractor.archive.save_manifest()
+
+        replay = ReplayExtractor(archive_dir, page_index_dir=self.index_dir)
+
+        self.assertIsNone(replay.page_index)
+        self.assertEqual(len(replay.scrape_all_pages(1, 3)), 12)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import os
+import sys
+import time
+from email.utils import formatdate
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.retry import CircuitBreaker, RetryPolicy, parse_retry_after
+from utils.extract import ProductExtractor
+from tests.fake_site import FakeFashionSite
+
+
+class TestRetryPolicy(unittest.TestCase):
+    
+    def test_parse_retry_after_seconds(self):
+        """Test Retry-After dalam detik"""
+        self.assertEqual(parse_retry_after('7'), 7.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+    
+    def test_parse_retry_after_http_date(self):
+        """Test Retry-After dalam format HTTP-date"""
+        value = formatdate(time.time() + 60, usegmt=True)
+        self.assertAlmostEqual(parse_retry_after(value), 60, delta=2)
+    
+    def test_delay_exponential(self):
+        """Test backoff naik dua kali lipat dan dibatasi backoff_max"""
+        policy = RetryPolicy(backoff_base=1, backoff_max=5, jitter=False)
+        
+        self.assertEqual([policy.delay(n) for n in range(1, 5)], [1, 2, 4, 5])
+        self.assertEqual(policy.delay(1, retry_after=3), 3)
+        self.assertEqual(policy.delay(1, retry_after=60), 5)
+    
+    def test_delay_jitter_in_range(self):
+        """Test jitter tidak melebihi batas backoff"""
+        policy = RetryPolicy(backoff_base=1, backoff_max=30)
+        for _ in range(50):
+            self.assertTrue(0 <= policy.delay(3) <= 4)
+
+
+class TestCircuitBreaker(unittest.TestCase):
+    
+    def test_opens_when_error_rate_high(self):
+        """Test circuit open saat error rate melewati threshold"""
+        breaker = CircuitBreaker(window=4, failure_threshold=0.5, min_requests=4, cooldown=60)
+        for success in (True, False, True, False):
+            breaker.record(success)
+        
+        self.assertEqual(breaker.state, 'open')
+        self.assertGreater(breaker.wait_time(), 0)
+    
+    def test_half_open_then_closed(self):
+        """Test circuit kembali closed setelah cooldown dan request sukses"""
+        breaker = CircuitBreaker(window=2, min_requests=2, cooldown=0)
+        breaker.record(False)
+        breaker.record(False)
+        
+        self.assertEqual(breaker.wait_time(), 0)
+        self.assertEqual(breaker.state, 'half-open')
+        
+        breaker.record(True)
+        self.assertEqual(breaker.state, 'closed')
+
+
+class TestExtractorRetry(unittest.TestCase):
+    
+    def start_site(self, **kwargs):
+        site = FakeFashionSite(pages=3, cards_per_page=2, **kwargs).start()
+        self.addCleanup(site.stop)
+        return site
+    
+    def test_transient_errors_retried(self):
+        """Test page dengan error 503 sementara tetap ter-scrape"""
+        site = self.start_site(fail_pages={2: 2})
+        extractor = ProductExtractor(base_url=site.url, requests_per_second=1000,
+                                     retry_policy=RetryPolicy(backoff_base=0.01))
+        
+        products = extractor.scrape_all_pages(1, 3)
+        
+        self.assertEqual(len(products), 6)
+        self.assertEqual(extractor.ledger[2]['attempts'], 3)
+        self.assertEqual(extractor.ledger[2]['status'], 'ok')
+    
+    def test_failed_pages_retried_at_end(self):
+        """Test page yang tetap gagal di retry lagi di akhir dan urutan tetap terjaga"""
+        site = self.start_site(fail_pages={2: 4})
+        breaker = CircuitBreaker(min_requests=5, cooldown=0.05)
+        extractor = ProductExtractor(base_url=site.url, requests_per_second=1000,
+                                     retry_policy=RetryPolicy(max_retries=2, backoff_base=0.01),
+                                     circuit_breaker=breaker)
+        
+        products = extractor.scrape_all_pages(1, 3)
+        
+        self.assertEqual([p['Title'] for p in products],
+                         ['Hoodie 1', 'Pants 2', 'Outerwear 3', 'Jacket 4', 'Shirt 5', 'Sweater 6'])
+        self.assertEqual(extractor.ledger[2]['status'], 'ok')
+        self.assertGreaterEqual(breaker.times_opened, 1)
+    
+    def test_missing_page_not_retried(self):
+        """Test 404 tidak di retry dan tercatat not_found"""
+        site = self.start_site()
+        extractor = ProductExtractor(base_url=site.url, requests_per_second=1000)
+        
+        self.assertEqual(extractor.scrape_page(9), [])
+        self.assertEqual(extractor.ledger[9]['attempts'], 1)
+        self.assertEqual(extractor.ledger[9]['status'], 'not_found')
+        self.assertIn("not_found", extractor.ledger_report())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.schema import COLUMNS, SCHEMA_PROFILES, cast_to_profile, dtype_matches, get_profile, memory_usage
+
+
+class TestSchemaProfiles(unittest.TestCase):
+    
+    def make_frame(self, rows: int = 1000) -> pd.DataFrame:
+        return pd.DataFrame({
+            'Title': [f'Item {i}' for i in range(rows)],
+            'Price': [float(100000 + i) for i in range(rows)],
+            'Rating': [float(i % 5) + 0.5 for i in range(rows)],
+            'Colors': [float(i % 5 + 1) for i in range(rows)],
+            'Size': [['S', 'M', 'L', 'XL', 'XXL'][i % 5] for i in range(rows)],
+            'Gender': [['Men', 'Women', 'Unisex'][i % 3] for i in range(rows)]
+        }, columns=COLUMNS)
+    
+    def test_profiles_cover_all_columns(self):
+        """Test setiap profile punya dtype untuk semua kolom"""
+        for profile in SCHEMA_PROFILES.values():
+            self.assertEqual(list(profile), COLUMNS)
+    
+    def test_unknown_profile(self):
+        """Test profile yang tidak dikenal"""
+        with self.assertRaises(ValueError):
+            get_profile('tiny')
+    
+    def test_cast_compact(self):
+        """Test profile compact memakai category dan numeric sempit"""
+        df = cast_to_profile(self.make_frame(), 'compact')
+        
+        self.assertEqual({col: str(df[col].dtype) for col in COLUMNS}, SCHEMA_PROFILES['compact'])
+        self.assertEqual(df['Colors'].tolist()[:3], [1, 2, 3])
+    
+    def test_compact_uses_less_memory(self):
+        """Test profile compact lebih hemat memory dari standard"""
+        standard = memory_usage(cast_to_profile(self.make_frame(), 'standard'))
+        compact = memory_usage(cast_to_profile(self.make_frame(), 'compact'))
+        
+        self.assertLess(compact, standard * 0.75)
+    
+    def test_arrow_profile(self):
+        """Test profile arrow memakai kolom Arrow-backed dan lebih hemat memory untuk string"""
+        df = cast_to_profile(self.make_frame(), 'arrow')
+        
+        for col, dtype in SCHEMA_PROFILES['arrow'].items():
+            self.assertEqual(df[col].dtype, pd.api.types.pandas_dtype(dtype), col)
+        self.assertLess(memory_usage(df), memory_usage(cast_to_profile(self.make_frame(), 'standard')))
+    
+    def test_dtype_matches_accepts_arrow_equivalents(self):
+        """Test validasi dtype menerima dtype Arrow yang setara"""
+        arrow = cast_to_profile(self.make_frame(), 'arrow')
+        compact = cast_to_profile(self.make_frame(), 'compact')
+        
+        self.assertTrue(dtype_matches(arrow['Title'].dtype, 'string'))
+        self.assertTrue(dtype_matches(arrow['Price'].dtype, 'float64'))
+        self.assertTrue(dtype_matches(arrow['Colors'].dtype, 'int64'))
+        self.assertTrue(dtype_matches(compact['Size'].dtype, 'category'))
+        self.assertFalse(dtype_matches(arrow['Colors'].dtype, 'float64'))
+        self.assertFalse(dtype_matches(compact['Title'].dtype, 'string[pyarrow]'))
+    
+    def test_narrow_integer_overflow(self):
+        """Test nilai di luar range int8 tidak di cast diam-diam"""
+        df = self.make_frame(2)
+        df['Colors'] = [1.0, 300.0]
+        
+        with self.assertRaises(ValueError):
+            cast_to_profile(df, 'compact')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -5,7 +5,7 @@ import sys
 
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
 
-from utils.transform import DataTransformer, transform_fashion_data
+from utils.transform import DataTransformer, transform_fashion_data, transform_fashion_stream
 
 
 class TestDataTransformer(unittest.TestCase):
@@ -226,6 +226,173 @@ class TestDataTransformer(unittest.TestCase):
         self.assertEqual(len(df_result), 1)
         self.assertEqual(df_result.iloc[0]['Title'], 'Jacket 1')
 
+    
+    def test_transform_stream_dedup_across_batches(self):
+        """Test streaming transform membuang duplikat antar batch"""
+        product = {
+            'Title': 'T-shirt 1',
+            'Price': '$50.00',
+            'Rating': 'Rating:  4.5 / 5',
+            'Colors': '3 Colors',
+            'Size': 'Size: M',
+            'Gender': 'Gender: Men'
+        }
+        other = dict(product, Title='Hoodie 2')
+        invalid = dict(product, Title='Unknown Product')
+        batches = [[product, invalid], [], [product, other]]
+        
+        chunks = list(self.transformer.transform_stream(iter(batches)))
+        
+        self.assertEqual([len(chunk) for chunk in chunks], [1, 1])
+        self.assertEqual(chunks[1].iloc[0]['Title'], 'Hoodie 2')
+        self.assertEqual(str(chunks[1]['Colors'].dtype), 'int64')
+    
+    def test_transform_stream_matches_transform_data(self):
+        """Test hasil streaming sama dengan transform_data sekaligus"""
+        raw_data = [
+            {'Title': f'Item {i % 7}', 'Price': f'${10 + i % 7}.00', 'Rating': 'Rating: 4.0 / 5',
+             'Colors': '2 Colors', 'Size': 'Size: S', 'Gender': 'Gender: Unisex'}
+            for i in range(30)
+        ]
+        batches = [raw_data[i:i + 4] for i in range(0, len(raw_data), 4)]
+        
+        expected = self.transformer.transform_data(raw_data)
+        result = pd.concat(transform_fashion_stream(batches), ignore_index=True)
+        
+        pd.testing.assert_frame_equal(result, expected)
+    
+    def test_vectorized_matches_rowwise(self):
+        """Test clean_frame vectorized sama dengan clean_* per row, termasuk nilai invalid"""
+        raw_data = pd.DataFrame({
+            'Title': ['  Hoodie 1 ', 'Unknown Product', '', None, 'Pants 5', 'Jacket 6'],
+            'Price': ['$50.00', '$100', 'Price Unavailable', None, '$1.', 'USD 5'],
+            'Rating': ['Rating: 4.8 / 5', 'Rating: Invalid Rating / 5', 'Rating: Not Rated', None,
+                       '3/5', 'Rating: 4 / 5 (Not Rated)'],
+            'Colors': ['3 Colors', '1 Color', 'Colors', None, '10  Colors', '2 Colors'],
+            'Size': ['Size: M', 'Size: XL', 'Size: m', None, 'S', 'Size: L'],
+            'Gender': ['Gender: Men', 'Gender: Unisex', 'Gender:', None, 'Women', 'Gender: Women']
+        })
+        
+        rowwise = DataTransformer(vectorized=False, factorize=False).clean_frame(raw_data)
+        
+        for options in ({'vectorized': True, 'factorize': False}, {'vectorized': True, 'factorize': True},
+                        {'vectorized': False, 'factorize': True}):
+            cleaned = DataTransformer(**options).clean_frame(raw_data)
+            for column in raw_data.columns:
+                expected = rowwise[column].astype(object).where(rowwise[column].notna(), None).tolist()
+                result = cleaned[column].astype(object).where(cleaned[column].notna(), None).tolist()
+                self.assertEqual(result, expected, (column, options))
+    
+    def test_transform_data_vectorized_matches_rowwise(self):
+        """Test output akhir transform_data identik untuk kedua implementasi"""
+        raw_data = [
+            {'Title': f'Item {i % 9}', 'Price': f'${10 + i % 5}.50' if i % 4 else 'Price Unavailable',
+             'Rating': f'Rating: {i % 5}.0 / 5', 'Colors': f'{i % 3 + 1} Colors',
+             'Size': 'Size: M', 'Gender': 'Gender: Men' if i % 2 else 'Gender: Women'}
+            for i in range(40)
+        ]
+        
+        expected = DataTransformer(vectorized=False, factorize=False).transform_data(raw_data)
+        
+        for options in ({'vectorized': True, 'factorize': False}, {'vectorized': True, 'factorize': True}):
+            result = DataTransformer(**options).transform_data(raw_data)
+            pd.testing.assert_frame_equal(result, expected)
+    
+    def test_factorize_memo_persists_across_batches(self):
+        """Test value yang sudah dibersihkan di batch sebelumnya tidak dibersihkan ulang"""
+        product = {'Title': 'T-shirt 1', 'Price': '$50.00', 'Rating': 'Rating: 4.5 / 5',
+                   'Colors': '3 Colors', 'Size': 'Size: M', 'Gender': 'Gender: Men'}
+        batches = [[product, dict(product, Title='T-shirt 2')], [dict(product, Title='Hoodie 3')]]
+        
+        chunks = list(self.transformer.transform_stream(batches))
+        
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(self.transformer.memo['Price'], {'$50.00': 800000.0})
+        # 5 value berulang dibersihkan sekali, ditambah 3 title unik
+        self.assertEqual(self.transformer.values_cleaned, 8)
+    
+    def test_factorize_memo_is_bounded(self):
+        """Test memo di reset saat melebihi memo_max_entries"""
+        transformer = DataTransformer(memo_max_entries=2)
+        
+        cleaned = transformer.clean_column_factorized('Price', pd.Series(['$1', '$2', '$3', None, '$1']))
+        
+        self.assertEqual(cleaned.tolist()[:3], [16000.0, 32000.0, 48000.0])
+        self.assertTrue(pd.isna(cleaned[3]))
+        self.assertLessEqual(len(transformer.memo['Price']), 3)
+    
+    def test_factorize_memo_reset_keeps_batch_values(self):
+        """Test memo yang sudah terisi di-reset di tengah batch berisi value yang sudah di-memo"""
+        transformer = DataTransformer(memo_max_entries=3)
+        transformer.clean_column_factorized('Price', pd.Series(['$1', '$2']))
+        
+        cleaned = transformer.clean_column_factorized('Price', pd.Series(['$1', '$3', '$4']))
+        
+        self.assertEqual(cleaned.tolist(), [16000.0, 48000.0, 64000.0])
+        self.assertEqual(transformer.memo['Price'], {'$3': 48000.0, '$4': 64000.0})
+
+    
+    def test_compact_profile(self):
+        """Test transform dengan profile compact, streaming dan sekaligus memberi data yang sama"""
+        raw_data = [
+            {'Title': f'Item {i % 11}', 'Price': f'${10 + i % 7}.00', 'Rating': f'Rating: {i % 5}.5 / 5',
+             'Colors': f'{i % 4 + 1} Colors', 'Size': 'Size: M' if i % 2 else 'Size: L',
+             'Gender': 'Gender: Men' if i % 3 else 'Gender: Women'}
+            for i in range(40)
+        ]
+        batches = [raw_data[i:i + 6] for i in range(0, len(raw_data), 6)]
+        
+        expected = transform_fashion_data(raw_data, profile='compact')
+        streamed = pd.concat(transform_fashion_stream(batches, profile='compact'), ignore_index=True)
+        
+        self.assertEqual(str(expected['Size'].dtype), 'category')
+        self.assertEqual(str(expected['Colors'].dtype), 'int8')
+        self.assertEqual(str(expected['Rating'].dtype), 'float32')
+        pd.testing.assert_frame_equal(streamed.astype(expected.dtypes), expected, check_categorical=False)
+
+    
+    def test_chunked_stream_matches_in_memory(self):
+        """Test chunk_size menggabungkan batch dan hasilnya identik dengan transform_data"""
+        raw_data = [
+            {'Title': f'Item {i % 13}', 'Price': f'${10 + i % 3}.00' if i % 9 else 'Price Unavailable',
+             'Rating': 'Rating: 4.5 / 5' if i % 2 else 'Rating: 4.50000001 / 5',
+             'Colors': f'{i % 2 + 1} Colors', 'Size': 'Size: M', 'Gender': 'Gender: Men'}
+            for i in range(60)
+        ]
+        batches = [raw_data[i:i + 5] for i in range(0, len(raw_data), 5)]
+        
+        for profile in ('standard', 'compact'):
+            expected = transform_fashion_data(raw_data, profile=profile)
+            chunks = list(transform_fashion_stream(iter(batches), profile=profile, chunk_size=16))
+            result = pd.concat(chunks, ignore_index=True).astype(expected.dtypes)
+            
+            self.assertTrue(all(len(chunk) <= 20 for chunk in chunks))
+            pd.testing.assert_frame_equal(result, expected, check_categorical=False)
+
+    
+    def test_transform_data_parallel_matches_serial(self):
+        """Test transform multi-core identik dengan transform_data, duplikat antar partisi dibuang"""
+        raw_data = [
+            {'Title': f'Item {(i * 7) % 23}', 'Price': f'${10 + i % 3}.00' if i % 11 else 'Unknown',
+             'Rating': f'Rating: {i % 5}.0 / 5', 'Colors': f'{i % 2 + 1} Colors',
+             'Size': 'Size: M' if i % 4 else 'Size: XL', 'Gender': 'Gender: Men'}
+            for i in range(120)
+        ]
+        
+        for profile in ('standard', 'compact'):
+            transformer = DataTransformer(profile=profile)
+            expected = transformer.transform_data(raw_data)
+            result = transformer.transform_data_parallel(raw_data, workers=2, partitions=5)
+            
+            pd.testing.assert_frame_equal(result, expected)
+    
+    def test_transform_data_parallel_empty(self):
+        """Test transform multi-core dengan input kosong"""
+        result = self.transformer.transform_data_parallel([], workers=2)
+        
+        self.assertTrue(result.empty)
+        self.assertEqual(list(result.columns), ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender'])
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,106 @@
+import unittest
+import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+
+from utils.validation import DataValidator
+
+
+class TestDataValidator(unittest.TestCase):
+
+    def setUp(self):
+        self.validator = DataValidator()
+        self.df = pd.DataFrame({
+            'Title': pd.Series(['T-shirt 1', 'Hoodie 2', 'Jacket 3'], dtype='string'),
+            'Price': pd.Series([800000.0, 1200000.0, 950000.0], dtype='float64'),
+            'Rating': pd.Series([4.5, 3.8, 4.0], dtype='float64'),
+            'Colors': pd.Series([3, 5, 2], dtype='int64'),
+            'Size': pd.Series(['M', 'L', 'S'], dtype='string'),
+            'Gender': pd.Series(['Men', 'Women', 'Unisex'], dtype='string')
+        })
+    
+    def failures(self, report):
+        return {(result['rule'], result['column']): (result['failed'], result['samples'])
+                for result in report.errors}
+    
+    def test_valid_frame(self):
+        """Test data valid lolos semua rule dan durasi tercatat"""
+        report = self.validator.validate(self.df)
+        
+        self.assertTrue(report.passed)
+        self.assertFalse(report.sampled)
+        self.assertGreaterEqual(report.elapsed, 0)
+        self.assertEqual(report.to_dict()['rows_checked'], 3)
+    
+    def test_reports_every_failed_rule(self):
+        """Test semua rule dievaluasi, tidak berhenti di rule pertama yang gagal"""
+        df = pd.concat([self.df, self.df.iloc[[0]]], ignore_index=True)
+        df.loc[1, 'Title'] = None
+        df.loc[2, 'Price'] = -100.0
+        df.loc[[0, 3], 'Rating'] = 6.0
+        
+        report = self.validator.validate(df)
+        
+        self.assertFalse(report.passed)
+        self.assertEqual(self.failures(report), {
+            ('not_null', 'Title'): (1, [1]),
+            ('unique_rows', None): (1, [3]),
+            ('greater_than', 'Price'): (1, [2]),
+            ('between', 'Rating'): (2, [0, 3]),
+        })
+    
+    def test_same_title_different_rows_not_duplicate(self):
+        """Test prefilter Title: row dengan Title sama tetapi kolom lain berbeda bukan duplikat"""
+        df = pd.concat([self.df, self.df.iloc[[0]].assign(Size='XL'), self.df.iloc[[0]]], ignore_index=True)
+        
+        report = self.validator.validate(df)
+        
+        self.assertEqual(self.failures(report), {('unique_rows', None): (1, [4])})
+    
+    def test_null_numeric_not_counted_as_range_failure(self):
+        """Test null di kolom numeric hanya dilaporkan oleh rule not_null"""
+        self.df.loc[0, 'Price'] = None
+        
+        report = self.validator.validate(self.df)
+        
+        self.assertEqual(self.failures(report), {('not_null', 'Price'): (1, [0])})
+    
+    def test_missing_columns_and_empty(self):
+        """Test kolom hilang dan DataFrame kosong"""
+        report = self.validator.validate(self.df[['Title', 'Price']])
+        self.assertIn(('required_columns', None), self.failures(report))
+        self.assertNotIn(('between', 'Rating'), self.failures(report))
+        
+        self.assertFalse(self.validator.validate(pd.DataFrame()).passed)
+    
+    def test_dtype_mismatch_is_warning(self):
+        """Test dtype yang tidak sesuai profile hanya warning"""
+        report = self.validator.validate(self.df.astype({'Colors': 'float64'}))
+        
+        self.assertTrue(report.passed)
+        self.assertEqual([result['column'] for result in report.results if result['rule'] == 'dtype'], ['Colors'])
+    
+    def test_sampled_validation(self):
+        """Test mode sample hanya memeriksa sejumlah row"""
+        df = pd.concat([self.df] * 100, ignore_index=True).assign(Title=lambda d: d['Title'] + d.index.astype(str))
+        
+        report = self.validator.validate(df, sample_rows=50)
+        
+        self.assertTrue(report.sampled)
+        self.assertEqual(report.rows, 300)
+        self.assertEqual(report.rows_checked, 50)
+        self.assertIn("(sampled)", report.format())
+    
+    def test_custom_rules(self):
+        """Test rule custom dan rule yang tidak dikenal"""
+        validator = DataValidator(rules=[{'rule': 'between', 'column': 'Colors', 'low': 1, 'high': 3}])
+        
+        self.assertEqual(self.failures(validator.validate(self.df)), {('between', 'Colors'): (1, [1])})
+        with self.assertRaises(ValueError):
+            DataValidator(rules=[{'rule': 'regex', 'column': 'Title'}])
+
+
+if __name__ == '__main__':
+    unittest.main()
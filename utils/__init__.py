@@ -6,20 +6,62 @@ Utility modul untuk Fashion Studio ETL pipeline:
 - extract: Web scraping dan data extraction
 - transform: Data cleaning dan transformation operasi  
 - load: Data validation dan CSV file output operasi
+- cache: Cache response HTTP di disk (ETag / Last-Modified)
+- retry: Retry dengan exponential backoff dan circuit breaker
+- checkpoint: Checkpoint per page untuk resume extraction
+- metrics: Statistik transfer HTTP dan percentile
+- archive: Arsip raw HTML content-addressed untuk replay offline
+- page_index: Hash body per page untuk reuse hasil parsing page yang tidak berubah
+- schema: Kolom dan schema profile dtype (standard / compact / arrow)
+- fingerprint: Set fingerprint row yang compact untuk deduplikasi antar chunk, dan index persisten antar run
+- columnar: ColumnarBatch, buffer record per kolom pengganti list of dict, konversi Arrow
+- validation: Rule validasi deklaratif dengan report per rule (jumlah gagal, contoh index, durasi)
 """
 
-from .extract import ProductExtractor, extract_fashion_data
-from .transform import DataTransformer, transform_fashion_data
-from .load import DataLoader, load_fashion_data
+from .extract import ProductExtractor, AsyncProductExtractor, ProcessPoolExtractor, TokenBucket, ReplayExtractor, extract_fashion_data, iter_fashion_data
+from .transform import DataTransformer, transform_fashion_data, transform_fashion_stream
+from .load import DataLoader, SummaryAccumulator, load_fashion_data, load_fashion_stream
+from .cache import ResponseCache
+from .retry import RetryPolicy, CircuitBreaker
+from .checkpoint import CheckpointStore
+from .metrics import TransferStats
+from .archive import HtmlArchive
+from .page_index import PageIndex
+from .schema import SCHEMA_PROFILES, cast_to_profile
+from .fingerprint import FingerprintSet, FingerprintIndex
+from .columnar import ColumnarBatch
+from .validation import DataValidator, ValidationReport
 
 __version__ = "1.0.0"
 __author__ = "ETL Pipeline Developer"
 
 __all__ = [
     'ProductExtractor',
+    'AsyncProductExtractor',
+    'ProcessPoolExtractor',
+    'TokenBucket',
+    'ReplayExtractor',
     'extract_fashion_data',
+    'iter_fashion_data',
     'DataTransformer', 
     'transform_fashion_data',
+    'transform_fashion_stream',
     'DataLoader',
-    'load_fashion_data'
+    'SummaryAccumulator',
+    'load_fashion_data',
+    'load_fashion_stream',
+    'ResponseCache',
+    'RetryPolicy',
+    'CircuitBreaker',
+    'CheckpointStore',
+    'TransferStats',
+    'HtmlArchive',
+    'PageIndex',
+    'SCHEMA_PROFILES',
+    'cast_to_profile',
+    'FingerprintSet',
+    'FingerprintIndex',
+    'ColumnarBatch',
+    'DataValidator',
+    'ValidationReport'
 ]
\ No newline at end of file
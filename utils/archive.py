@@ -0,0 +1,83 @@
+import gzip
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Dict, List, Optional
+
+
+class HtmlArchive:
+    """Arsip raw HTML terkompresi, content-addressed dengan SHA-256.
+
+    Struktur direktori:
+        objects/<2 karakter hash>/<hash>.html.gz   body unik, disimpan sekali
+        manifests/<run id>.json                    page number -> hash untuk satu run
+    """
+
+    def __init__(self, archive_dir: str = "archive", run_id: Optional[str] = None):
+        self.archive_dir = archive_dir
+        self.run_id = run_id or datetime.now().strftime('%Y%m%dT%H%M%S')
+        self.manifest: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+        self.objects_written = 0
+        for subdir in ('objects', 'manifests'):
+            os.makedirs(os.path.join(archive_dir, subdir), exist_ok=True)
+
+    def object_path(self, digest: str) -> str:
+        return os.path.join(self.archive_dir, 'objects', digest[:2], f"{digest}.html.gz")
+
+    def manifest_path(self, run_id: str) -> str:
+        return os.path.join(self.archive_dir, 'manifests', f"{run_id}.json")
+
+    def store(self, page_num: int, url: str, body: bytes) -> str:
+        """Simpan body jika belum ada di arsip dan catat di manifest run ini"""
+        digest = hashlib.sha256(body).hexdigest()
+        path = self.object_path(digest)
+
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(gzip.compress(body))
+            os.replace(tmp_path, path)
+            with self.lock:
+                self.objects_written += 1
+
+        with self.lock:
+            self.manifest[str(page_num)] = {
+                'hash': digest,
+                'url': url,
+                'size': len(body),
+                'fetched_at': datetime.now().isoformat(timespec='seconds'),
+            }
+        return digest
+
+    def save_manifest(self) -> str:
+        path = self.manifest_path(self.run_id)
+        tmp_path = path + ".tmp"
+        with self.lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({'run_id': self.run_id, 'pages': self.manifest}, f, indent=1)
+        os.replace(tmp_path, path)
+        return path
+
+    def list_runs(self) -> List[str]:
+        manifests_dir = os.path.join(self.archive_dir, 'manifests')
+        return sorted(name[:-len('.json')] for name in os.listdir(manifests_dir) if name.endswith('.json'))
+
+    def load_manifest(self, run_id: Optional[str] = None) -> Dict[int, Dict]:
+        """Baca manifest sebuah run, default run terakhir"""
+        runs = self.list_runs()
+        if run_id is None:
+            if not runs:
+                raise FileNotFoundError(f"No manifests in archive {self.archive_dir}")
+            run_id = runs[-1]
+
+        with open(self.manifest_path(run_id), 'r', encoding='utf-8') as f:
+            pages = json.load(f)['pages']
+        return {int(page_num): entry for page_num, entry in pages.items()}
+
+    def read(self, digest: str) -> bytes:
+        with open(self.object_path(digest), 'rb') as f:
+            return gzip.decompress(f.read())
@@ -0,0 +1,129 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Optional
+
+
+class ResponseCache:
+    """Cache response HTTP di disk dengan validator ETag / Last-Modified dan eviction LRU"""
+
+    INDEX_FILE = "index.json"
+
+    def __init__(self, cache_dir: str = ".http_cache", max_bytes: int = 50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.ensure_cache_dir()
+        self.entries = self.load_index()
+        self.clock = max((entry['last_used'] for entry in self.entries.values()), default=0)
+
+    def ensure_cache_dir(self):
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir)
+
+    def load_index(self) -> Dict[str, Dict]:
+        """Baca index cache, index rusak dianggap kosong"""
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return {url: entry for url, entry in entries.items()
+                if os.path.exists(self.body_path(entry['file']))}
+
+    def save(self):
+        """Simpan index ke disk secara atomic"""
+        index_path = os.path.join(self.cache_dir, self.INDEX_FILE)
+        tmp_path = index_path + ".tmp"
+        with self.lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f)
+            os.replace(tmp_path, index_path)
+
+    def body_path(self, filename: str) -> str:
+        return os.path.join(self.cache_dir, filename)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(entry['size'] for entry in self.entries.values())
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Header If-None-Match / If-Modified-Since untuk URL yang sudah di cache"""
+        with self.lock:
+            entry = self.entries.get(url)
+        if not entry:
+            return {}
+
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def hit(self, url: str) -> Optional[bytes]:
+        """Ambil body dari cache setelah server membalas 304"""
+        with self.lock:
+            entry = self.entries.get(url)
+            if not entry:
+                return None
+            try:
+                with open(self.body_path(entry['file']), 'rb') as f:
+                    body = f.read()
+            except OSError:
+                del self.entries[url]
+                return None
+
+            self.clock += 1
+            entry['last_used'] = self.clock
+            self.hits += 1
+            self.bytes_saved += len(body)
+            return body
+
+    def store(self, url: str, body: bytes, headers) -> None:
+        """Simpan response 200, hanya jika server memberi validator"""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+
+        with self.lock:
+            self.misses += 1
+            if not (etag or last_modified) or len(body) > self.max_bytes:
+                return
+
+            filename = hashlib.sha1(url.encode('utf-8')).hexdigest() + ".body"
+            with open(self.body_path(filename), 'wb') as f:
+                f.write(body)
+
+            self.clock += 1
+            self.entries[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'file': filename,
+                'size': len(body),
+                'last_used': self.clock,
+            }
+            self.evict()
+
+    def evict(self):
+        """Hapus entry yang paling lama tidak dipakai sampai di bawah max_bytes"""
+        total = self.total_bytes
+        for url, entry in sorted(self.entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(self.body_path(entry['file']))
+            except OSError:
+                pass
+            total -= entry['size']
+            del self.entries[url]
+
+    def report(self) -> str:
+        return (f"Cache hits: {self.hits}, misses: {self.misses}, "
+                f"bytes saved: {self.bytes_saved}, cached: {len(self.entries)} pages "
+                f"({self.total_bytes} bytes)")
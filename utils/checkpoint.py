@@ -0,0 +1,67 @@
+import json
+import os
+import re
+from typing import Dict, List
+
+PAGE_FILE_PATTERN = re.compile(r'page_(\d+)\.json$')
+META_FILE = "meta.json"
+
+
+class CheckpointStore:
+    """Simpan raw product per page ke disk secara durable untuk resume"""
+
+    def __init__(self, checkpoint_dir: str = ".checkpoint"):
+        self.checkpoint_dir = checkpoint_dir
+        self.ensure_checkpoint_dir()
+
+    def ensure_checkpoint_dir(self):
+        if not os.path.exists(self.checkpoint_dir):
+            os.makedirs(self.checkpoint_dir)
+
+    def page_path(self, page_num: int) -> str:
+        return os.path.join(self.checkpoint_dir, f"page_{page_num:05d}.json")
+
+    def save_page(self, page_num: int, products: List[Dict]):
+        """Tulis satu page secara atomic: file sementara, fsync, lalu rename"""
+        self.write_json(self.page_path(page_num), products)
+
+    def save_meta(self, meta: Dict):
+        """Simpan metadata run (misalnya page terakhir hasil discovery) secara atomic"""
+        self.write_json(os.path.join(self.checkpoint_dir, META_FILE), meta)
+
+    def load_meta(self) -> Dict:
+        """Metadata run sebelumnya, file tidak ada atau rusak dianggap kosong"""
+        try:
+            with open(os.path.join(self.checkpoint_dir, META_FILE), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def write_json(self, path: str, data):
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def load_pages(self) -> Dict[int, List[Dict]]:
+        """Baca semua page yang sudah selesai, file rusak diabaikan"""
+        pages = {}
+        for filename in os.listdir(self.checkpoint_dir):
+            match = PAGE_FILE_PATTERN.match(filename)
+            if not match:
+                continue
+            try:
+                with open(os.path.join(self.checkpoint_dir, filename), 'r', encoding='utf-8') as f:
+                    pages[int(match.group(1))] = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Skipping corrupt checkpoint {filename}: {e}")
+        return pages
+
+    def clear(self):
+        """Hapus semua checkpoint dari run sebelumnya"""
+        for filename in os.listdir(self.checkpoint_dir):
+            if PAGE_FILE_PATTERN.match(filename) or filename == META_FILE or filename.endswith('.tmp'):
+                os.remove(os.path.join(self.checkpoint_dir, filename))
@@ -0,0 +1,69 @@
+import pandas as pd
+import pyarrow as pa
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .schema import COLUMNS
+
+
+class ColumnarBatch:
+    """Record product dalam buffer append-only per kolom, pengganti list of dict.
+    Tidak ada dict per product, dan DataFrame dibangun langsung dari list per kolom."""
+
+    def __init__(self, columns: Optional[Dict[str, List]] = None):
+        self.columns = columns if columns is not None else {col: [] for col in COLUMNS}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict]) -> 'ColumnarBatch':
+        batch = cls()
+        batch.extend(records)
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.columns[COLUMNS[0]])
+
+    def __iter__(self) -> Iterator[Dict]:
+        """Iterasi sebagai dict agar kompatibel dengan kode yang memakai list of dict"""
+        for values in zip(*(self.columns[col] for col in COLUMNS)):
+            yield dict(zip(COLUMNS, values))
+
+    def __getitem__(self, index: int) -> Dict:
+        return {col: self.columns[col][index] for col in COLUMNS}
+
+    def append(self, record: Dict):
+        for col, values in self.columns.items():
+            values.append(record.get(col))
+
+    def extend(self, records):
+        """Tambahkan ColumnarBatch lain atau list of dict"""
+        if isinstance(records, ColumnarBatch):
+            for col, values in self.columns.items():
+                values.extend(records.columns[col])
+            return
+        for record in records:
+            self.append(record)
+
+    def to_records(self) -> List[Dict]:
+        return list(self)
+
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame(self.columns, columns=COLUMNS)
+
+    def to_arrow(self) -> pa.RecordBatch:
+        """Arrow record batch dengan kolom string raw"""
+        return pa.RecordBatch.from_pydict({col: pa.array(self.columns[col], type=pa.string()) for col in COLUMNS})
+
+
+def arrow_types_mapper(arrow_type: pa.DataType):
+    """String Arrow menjadi string[pyarrow], tipe lain menjadi ArrowDtype"""
+    if pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type):
+        return pd.StringDtype('pyarrow')
+    return pd.ArrowDtype(arrow_type)
+
+
+def arrow_to_frame(table) -> pd.DataFrame:
+    """DataFrame Arrow-backed dari Table atau RecordBatch, buffer kolom tidak dikonversi ke object"""
+    return table.to_pandas(types_mapper=arrow_types_mapper)
+
+
+def is_arrow(data) -> bool:
+    return isinstance(data, (pa.Table, pa.RecordBatch))
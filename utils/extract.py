@@ -1,16 +1,142 @@
+import asyncio
+import aiohttp
+import multiprocessing
+import os
+import re
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup, UnicodeDammit
+from lxml import etree, html as lxml_html
+import threading
 import time
-from typing import List, Dict
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import count, islice
+from typing import Iterable, Iterator, List, Dict, Optional
+
+from .cache import ResponseCache
+from .archive import HtmlArchive
+from .checkpoint import CheckpointStore
+from .columnar import ColumnarBatch
+from .metrics import TransferStats
+from .page_index import PageIndex
+from .retry import CircuitBreaker, RetryPolicy, parse_retry_after
+
+BASE_URL = "https://fashion-studio.dicoding.dev/"
+PARSERS = ('html.parser', 'lxml')
+# Naikkan setiap kali logika parsing atau format record berubah, agar record di page index di-parse ulang
+PARSER_VERSION = 1
+DEFAULT_END_PAGE = 50
+RECORD_FIELDS = ('Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender')
+
+PAGE_COUNT_PATTERN = re.compile(r'Page\s+\d+\s+of\s+(\d+)', re.IGNORECASE)
+PAGE_LINK_PATTERN = re.compile(r'href="[^"]*?/page(\d+)"', re.IGNORECASE)
+
+DETAIL_STYLE = "font-size: 14px; color: #777;"
+
+
+def _has_class(name: str) -> str:
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+CARD_XPATH = etree.XPath(f"//div[{_has_class('collection-card')}]")
+TITLE_XPATH = etree.XPath(f".//h3[{_has_class('product-title')}]")
+PRICE_XPATH = etree.XPath(f".//span[{_has_class('price')}]")
+PRICE_UNAVAILABLE_XPATH = etree.XPath(f".//p[{_has_class('price')}]")
+DETAIL_XPATH = etree.XPath(f'.//p[@style="{DETAIL_STYLE}"]')
+
+
+class TokenBucket:
+    """Thread-safe token bucket untuk membatasi requests per detik"""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate harus lebih besar dari 0")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Ambil satu token jika tersedia, return 0 atau lama waktu tunggu"""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self):
+        """Ambil satu token, tunggu jika bucket kosong"""
+        wait = self.try_acquire()
+        while wait:
+            time.sleep(wait)
+            wait = self.try_acquire()
+
+    async def acquire_async(self):
+        """Versi non-blocking dari acquire untuk event loop"""
+        wait = self.try_acquire()
+        while wait:
+            await asyncio.sleep(wait)
+            wait = self.try_acquire()
 
 
 class ProductExtractor:
-    def __init__(self, base_url: str = "https://fashion-studio.dicoding.dev/"):
+    def __init__(self, base_url: str = BASE_URL,
+                 max_workers: int = 1, requests_per_second: Optional[float] = None,
+                 cache_dir: Optional[str] = None, cache_max_bytes: int = 50 * 1024 * 1024,
+                 parser: str = 'html.parser', max_empty_pages: Optional[int] = 3,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 checkpoint_dir: Optional[str] = None, resume: bool = False,
+                 pool_size: Optional[int] = None, keep_alive: bool = True,
+                 archive_dir: Optional[str] = None, page_index_dir: Optional[str] = None,
+                 columnar: bool = False):
+        if parser not in PARSERS:
+            raise ValueError(f"Unknown parser backend: {parser}")
         self.base_url = base_url
+        self.parser = parser
+        self.columnar = columnar
+        self.max_workers = max(1, max_workers)
+        self.max_empty_pages = max_empty_pages
+        self.prefetched = {}
+        self.page_requests = 0
+        self.discovery_requests = 0
+        self.stats_lock = threading.Lock()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or CircuitBreaker()
+        self.ledger = {}
+        self.checkpoint = CheckpointStore(checkpoint_dir) if checkpoint_dir else None
+        self.restored = {}
+        self.restored_last_page = None
+        if self.checkpoint and resume:
+            self.restored = self.checkpoint.load_pages()
+            self.restored_last_page = self.checkpoint.load_meta().get('last_page')
+            print(f"Resuming: {len(self.restored)} pages restored from {checkpoint_dir}")
+        elif self.checkpoint:
+            self.checkpoint.clear()
+        self.rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
+        self.cache = ResponseCache(cache_dir, cache_max_bytes) if cache_dir else None
+        self.archive = HtmlArchive(archive_dir) if archive_dir else None
+        self.page_index = PageIndex(page_index_dir) if page_index_dir else None
+        self.page_delay = 1.0
+        self.transfer_stats = TransferStats()
         self.session = requests.Session()
         self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive' if keep_alive else 'close'
         })
+        
+        # Pool default requests hanya 10 koneksi per host, worker lebih dari itu membuang koneksi
+        self.pool_size = pool_size or max(10, self.max_workers)
+        self.adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_size, max_retries=0)
+        self.session.mount('http://', self.adapter)
+        self.session.mount('https://', self.adapter)
     
     def extract_product_data(self, soup: BeautifulSoup) -> List[Dict]:
         """Extract product dari single page"""
@@ -35,7 +161,7 @@ class ProductExtractor:
                     else:
                         product['Price'] = 'Unknown'
                 
-                detail_paragraphs = card.find_all('p', style="font-size: 14px; color: #777;")
+                detail_paragraphs = card.find_all('p', style=DETAIL_STYLE)
                 
                 product['Rating'] = 'Invalid Rating'
                 product['Colors'] = 'Unknown'
@@ -61,49 +187,785 @@ class ProductExtractor:
         
         return products
     
-    def scrape_page(self, page_num: int) -> List[Dict]:
-        """Scrape single page"""
+    def extract_product_data_lxml(self, content) -> List[Dict]:
+        """Extract product langsung dengan lxml dan XPath yang sudah di compile"""
+        if isinstance(content, bytes):
+            try:
+                content = content.decode('utf-8')
+            except UnicodeDecodeError:
+                content = UnicodeDammit(content, is_html=True).unicode_markup
+        
+        if not content.strip():
+            return []
+        
+        products = []
+        root = lxml_html.fromstring(content)
+        
+        for card in CARD_XPATH(root):
+            try:
+                product = {}
+                
+                title_elems = TITLE_XPATH(card)
+                product['Title'] = title_elems[0].text_content().strip() if title_elems else 'Unknown Product'
+                
+                price_elems = PRICE_XPATH(card)
+                if price_elems:
+                    product['Price'] = price_elems[0].text_content().strip()
+                else:
+                    price_unavailable = PRICE_UNAVAILABLE_XPATH(card)
+                    if price_unavailable and 'Price Unavailable' in price_unavailable[0].text_content():
+                        product['Price'] = 'Price Unavailable'
+                    else:
+                        product['Price'] = 'Unknown'
+                
+                product['Rating'] = 'Invalid Rating'
+                product['Colors'] = 'Unknown'
+                product['Size'] = 'Unknown'
+                product['Gender'] = 'Unknown'
+                
+                for p in DETAIL_XPATH(card):
+                    text = p.text_content().strip()
+                    if 'Rating:' in text:
+                        product['Rating'] = text
+                    elif 'Colors' in text:
+                        product['Colors'] = text
+                    elif 'Size:' in text:
+                        product['Size'] = text
+                    elif 'Gender:' in text:
+                        product['Gender'] = text
+                
+                products.append(product)
+                
+            except Exception as e:
+                print(f"Ekstraksi error: {e}")
+                continue
+        
+        return products
+    
+    def parse_page(self, content) -> List[Dict]:
+        """Parse body page dengan parser backend yang dipilih"""
+        if self.parser == 'lxml':
+            return self.extract_product_data_lxml(content)
+        return self.extract_product_data(BeautifulSoup(content, 'html.parser'))
+    
+    def parse_or_reuse(self, page_num: int, content) -> List[Dict]:
+        """Parse body page, kecuali hash body dan parser sama dengan yang tersimpan di page index"""
+        if not self.page_index:
+            return self.parse_page(content)
+        
+        digest = self.page_index.digest(content)
+        products = self.page_index.lookup(page_num, digest, self.parser_key)
+        if products is None:
+            products = self.parse_page(content)
+            self.page_index.store(page_num, digest, products, self.parser_key)
+        return products
+    
+    @property
+    def parser_key(self) -> str:
+        """Identitas parser untuk page index: backend dan versi parser"""
+        return f"{self.parser}:{PARSER_VERSION}"
+    
+    def page_url(self, page_num: int) -> str:
+        """URL untuk nomor page tertentu"""
         if page_num == 1:
-            url = self.base_url
-        else:
-            url = f"{self.base_url}Page{page_num}"
+            return self.base_url
+        return f"{self.base_url}Page{page_num}"
+    
+    def fetch_page(self, url: str) -> bytes:
+        """Download body page, memakai conditional request jika cache aktif"""
+        headers = self.cache.conditional_headers(url) if self.cache else {}
+        response = self.session.get(url, timeout=10, headers=headers)
+        self.record_transfer(response)
         
-        try:
+        if self.cache and response.status_code == 304:
+            content = self.cache.hit(url)
+            if content is not None:
+                return content
             response = self.session.get(url, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            products = self.extract_product_data(soup)
+            self.record_transfer(response)
+        
+        response.raise_for_status()
+        
+        if self.cache:
+            self.cache.store(url, response.content, response.headers)
+        return response.content
+    
+    def record_transfer(self, response: requests.Response):
+        """Catat bytes di wire vs setelah decode dan time-to-first-byte"""
+        if not isinstance(response, requests.Response):
+            return
+        
+        content = response.content
+        wire_bytes = response.raw.tell() if hasattr(response.raw, 'tell') else len(content)
+        self.transfer_stats.record(wire_bytes, len(content), response.headers.get('Content-Encoding'),
+                                   response.elapsed.total_seconds())
+    
+    def connection_stats(self):
+        """Jumlah koneksi baru dan koneksi yang dipakai ulang dari pool urllib3"""
+        opened = 0
+        used = 0
+        pools = self.adapter.poolmanager.pools
+        for key in pools.keys():
+            pool = pools[key]
+            opened += pool.num_connections
+            used += pool.num_requests
+        return opened, max(0, used - opened)
+    
+    def transfer_report(self) -> str:
+        return self.transfer_stats.report(*self.connection_stats())
+    
+    def is_retryable(self, error: requests.RequestException) -> bool:
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        response = getattr(error, 'response', None)
+        return response is not None and self.retry_policy.is_retryable_status(response.status_code)
+    
+    def record_outcome(self, page_num: int, attempts: int, status: str, started: float,
+                       http_status: Optional[int] = None, error: Optional[str] = None):
+        """Catat hasil akhir satu page di ledger"""
+        self.ledger[page_num] = {
+            'attempts': attempts,
+            'status': status,
+            'http_status': http_status,
+            'latency': time.perf_counter() - started,
+            'error': error,
+        }
+    
+    def page_failed(self, page_num: int) -> bool:
+        return self.ledger.get(page_num, {}).get('status') == 'failed'
+    
+    def download_page(self, page_num: int) -> Optional[bytes]:
+        """Download body satu page, error sementara di retry dengan exponential backoff.
+        Body yang berhasil diarsip dan hasilnya dicatat di ledger; return None jika gagal"""
+        url = self.page_url(page_num)
+        started = time.perf_counter()
+        attempts = 0
+        
+        while True:
+            self.circuit_breaker.before_request()
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
             
-            print(f"Scraped page {page_num}: {len(products)} products")
-            return products
+            attempts += 1
+            try:
+                content = self.fetch_page(url)
+                self.circuit_breaker.record(True)
+                if self.archive:
+                    self.archive.store(page_num, url, content)
+                self.record_outcome(page_num, attempts, 'ok', started)
+                return content
             
-        except requests.RequestException as e:
-            print(f"Scraping page error {page_num}: {e}")
+            except requests.RequestException as e:
+                response = getattr(e, 'response', None)
+                http_status = response.status_code if response is not None else None
+                
+                if not self.is_retryable(e):
+                    status = 'not_found' if http_status == 404 else 'failed'
+                    self.record_outcome(page_num, attempts, status, started, http_status, str(e))
+                    print(f"Scraping page error {page_num}: {e}")
+                    return None
+                
+                self.circuit_breaker.record(False)
+                if attempts > self.retry_policy.max_retries:
+                    self.record_outcome(page_num, attempts, 'failed', started, http_status, str(e))
+                    print(f"Scraping page error {page_num} after {attempts} attempts: {e}")
+                    return None
+                
+                retry_after = parse_retry_after(response.headers.get('Retry-After')) if response is not None else None
+                time.sleep(self.retry_policy.delay(attempts, retry_after))
+    
+    def scrape_page(self, page_num: int) -> List[Dict]:
+        """Scrape single page: download dengan retry lalu parse"""
+        content = self.download_page(page_num)
+        if content is None:
             return []
+        
+        products = self.parse_or_reuse(page_num, content)
+        print(f"Scraped page {page_num}: {len(products)} products")
+        return products
 
-    def scrape_all_pages(self, start_page: int = 1, end_page: int = 50) -> List[Dict]:
-        """Scrape semua page dari start_page ke end_page"""
-        all_products = []
+    def probe_page(self, page_num: int) -> bool:
+        """Scrape satu page saat discovery, hasilnya disimpan agar tidak di fetch ulang"""
+        self.discovery_requests += 1
+        products = self.scrape_page(page_num)
+        if products:
+            self.prefetched[page_num] = products
+        return bool(products)
+    
+    def discover_last_page(self, max_page: int = 10000) -> Optional[int]:
+        """Cari page terakhir, saat resume dipakai hasil discovery yang tersimpan di checkpoint"""
+        if self.restored_last_page is not None and 1 in self.restored:
+            return self.restored_last_page
+        
+        last_page = self.find_last_page(max_page)
+        if self.checkpoint and last_page is not None:
+            self.checkpoint.save_meta({'last_page': last_page})
+        return last_page
+    
+    def find_last_page(self, max_page: int = 10000) -> Optional[int]:
+        """Cari page terakhir dari pagination page 1, fallback ke probe exponential lalu binary search.
+        Page 1 di-download seperti page lain (retry, arsip, ledger) dan hasilnya dipakai ulang"""
+        self.discovery_requests += 1
+        content = self.download_page(1)
+        if content is None:
+            print("Pagination discovery error: page 1 not available")
+            return None
+        
+        self.prefetched[1] = self.parse_or_reuse(1, content)
+        text = content.decode('utf-8', errors='ignore') if isinstance(content, bytes) else content
         
-        for page_num in range(start_page, end_page + 1):
+        match = PAGE_COUNT_PATTERN.search(text)
+        if match:
+            return int(match.group(1))
+        
+        low = max([int(n) for n in PAGE_LINK_PATTERN.findall(text)], default=1)
+        high = low * 2
+        while high <= max_page and self.probe_page(high):
+            low, high = high, high * 2
+        high = min(high, max_page + 1)
+        
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.probe_page(middle):
+                low = middle
+            else:
+                high = middle
+        
+        return low
+    
+    def checkpoint_page(self, page_num: int, products: List[Dict]):
+        """Simpan page yang sukses ke checkpoint segera setelah selesai"""
+        if self.checkpoint and self.ledger.get(page_num, {}).get('status') == 'ok':
+            self.checkpoint.save_page(page_num, products)
+    
+    def get_page(self, page_num: int) -> List[Dict]:
+        """Ambil product page dari checkpoint, hasil discovery, atau scrape baru"""
+        products = self.restored.pop(page_num, None)
+        if products is not None:
+            return products
+        
+        products = self.prefetched.pop(page_num, None)
+        if products is None:
+            with self.stats_lock:
+                self.page_requests += 1
             products = self.scrape_page(page_num)
-            all_products.extend(products)
+        
+        self.checkpoint_page(page_num, products)
+        return products
+    
+    @property
+    def concurrent(self) -> bool:
+        return self.max_workers > 1
+    
+    @property
+    def in_flight_pages(self) -> int:
+        """Jumlah page maksimum yang sedang dikerjakan pada mode concurrent"""
+        return self.max_workers * 2
+    
+    def start_page(self, executor: ThreadPoolExecutor, page_num: int) -> Future:
+        return executor.submit(self.get_page, page_num)
+    
+    def finish_page(self, page_num: int, future: Future) -> List[Dict]:
+        return future.result()
+    
+    def should_stop(self, empty_streak: int, page_num: int) -> bool:
+        if self.max_empty_pages and empty_streak >= self.max_empty_pages:
+            print(f"Stopping at page {page_num}: {empty_streak} consecutive empty pages")
+            return True
+        return False
+    
+    def iter_pages(self, start_page: int = 1, end_page: Optional[int] = 50) -> Iterator[List[Dict]]:
+        """Yield product per page, satu batch untuk setiap page.
+        end_page=None berarti scrape sampai max_empty_pages page kosong berturut-turut.
+        Page yang gagal di retry sekali lagi di akhir dan batch-nya di yield paling akhir."""
+        for _, products in self.iter_numbered_pages(start_page, end_page):
+            yield products
+
+    def iter_numbered_pages(self, start_page: int = 1, end_page: Optional[int] = 50):
+        """Yield (page_num, products), termasuk hasil retry page gagal di akhir"""
+        if self.concurrent:
+            yield from self.iter_pages_concurrent(start_page, end_page)
+        else:
+            yield from self.iter_pages_sequential(start_page, end_page)
+        
+        failed = [page_num for page_num in sorted(self.ledger)
+                  if page_num >= start_page and (end_page is None or page_num <= end_page)
+                  and self.page_failed(page_num)]
+        if failed:
+            print(f"Retrying {len(failed)} failed pages: {failed}")
+        
+        for page_num in failed:
+            yield page_num, self.get_page(page_num)
+
+    def iter_pages_sequential(self, start_page: int = 1, end_page: Optional[int] = 50):
+        pages = range(start_page, end_page + 1) if end_page is not None else count(start_page)
+        empty_streak = 0
+        
+        for page_num in pages:
+            products = self.get_page(page_num)
+            yield page_num, products
             
-            time.sleep(1)
+            empty_streak = 0 if products or self.page_failed(page_num) else empty_streak + 1
+            if self.should_stop(empty_streak, page_num):
+                return
+            
+            if not self.rate_limiter and self.page_delay:
+                time.sleep(self.page_delay)
             
             if page_num % 10 == 0:
-                print(f"Progress: {page_num}/{end_page} pages completed")
+                print(f"Progress: {page_num}/{end_page or '?'} pages completed")
+
+    def iter_pages_concurrent(self, start_page: int = 1, end_page: Optional[int] = 50):
+        """Scrape page secara paralel, batch tetap urut dan jumlah page in-flight dibatasi"""
+        pages = range(start_page, end_page + 1) if end_page is not None else count(start_page)
+        page_iter = iter(pages)
+        pending = deque()
         
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for page_num in islice(page_iter, self.in_flight_pages):
+                pending.append((page_num, self.start_page(executor, page_num)))
+            
+            empty_streak = 0
+            while pending:
+                page_num, future = pending.popleft()
+                products = self.finish_page(page_num, future)
+                
+                next_page = next(page_iter, None)
+                if next_page is not None:
+                    pending.append((next_page, self.start_page(executor, next_page)))
+                
+                completed = page_num - start_page + 1
+                if completed % 10 == 0:
+                    print(f"Progress: {completed}/{end_page or '?'} pages completed")
+                
+                yield page_num, products
+                
+                empty_streak = 0 if products or self.page_failed(page_num) else empty_streak + 1
+                if self.should_stop(empty_streak, page_num):
+                    for _, future in pending:
+                        future.cancel()
+                    return
+
+    def scrape_all_pages(self, start_page: int = 1, end_page: Optional[int] = 50) -> List[Dict]:
+        """Scrape semua page dari start_page ke end_page.
+        Dengan columnar=True hasilnya ColumnarBatch, setiap page langsung dipindah ke buffer per kolom."""
+        pages = {}
+        for page_num, products in self.iter_numbered_pages(start_page, end_page):
+            pages[page_num] = ColumnarBatch.from_records(products) if self.columnar else products
+        
+        return self.merge_pages(pages[page_num] for page_num in sorted(pages))
+    
+    def merge_pages(self, pages: Iterable) -> List[Dict]:
+        """Gabungkan hasil per page yang sudah urut, sebagai list of dict atau ColumnarBatch"""
+        all_products = ColumnarBatch() if self.columnar else []
+        for products in pages:
+            all_products.extend(products)
         return all_products
 
+    def ledger_report(self) -> str:
+        """Ringkasan hasil per page: status, jumlah attempt dan latency"""
+        if not self.ledger:
+            return "Page ledger: empty"
+        
+        statuses = Counter(outcome['status'] for outcome in self.ledger.values())
+        latencies = sorted(outcome['latency'] for outcome in self.ledger.values())
+        failed = sorted(page_num for page_num in self.ledger if self.page_failed(page_num))
+        attempts = sum(outcome['attempts'] for outcome in self.ledger.values())
+        
+        report = (f"Page ledger: {dict(statuses)}, attempts: {attempts}, "
+                  f"latency p50: {latencies[len(latencies) // 2]:.3f}s, max: {latencies[-1]:.3f}s")
+        if failed:
+            report += f", failed pages: {failed}"
+        return report
+
+    def close(self):
+        self.session.close()
+
+    def request_report(self, baseline_pages: int = DEFAULT_END_PAGE) -> str:
+        total = self.discovery_requests + self.page_requests
+        return (f"Requests: {total} ({self.discovery_requests} discovery, {self.page_requests} pages), "
+                f"{baseline_pages - total} saved vs hard-coded end_page={baseline_pages}")
+
+
+class AsyncProductExtractor(ProductExtractor):
+    """Extractor berbasis asyncio/aiohttp, parsing tetap memakai extract_product_data"""
+
+    def __init__(self, base_url: str = BASE_URL, max_workers: int = 10, **kwargs):
+        super().__init__(base_url, max_workers, **kwargs)
+        self.headers = dict(self.session.headers)
+        self.semaphore = None
+
+    async def fetch_page_async(self, client: aiohttp.ClientSession, url: str) -> bytes:
+        """Versi async dari fetch_page"""
+        headers = self.cache.conditional_headers(url) if self.cache else {}
+        status, content, response_headers = await self.download_async(client, url, headers)
+        
+        if self.cache and status == 304:
+            cached = self.cache.hit(url)
+            if cached is not None:
+                return cached
+            status, content, response_headers = await self.download_async(client, url, {})
+        
+        if self.cache:
+            self.cache.store(url, content, response_headers)
+        return content
+
+    async def download_async(self, client: aiohttp.ClientSession, url: str, headers: Dict):
+        async with client.get(url, headers=headers) as response:
+            if response.status != 304:
+                response.raise_for_status()
+            return response.status, await response.read(), response.headers
+
+    async def scrape_page_async(self, client: aiohttp.ClientSession, page_num: int) -> List[Dict]:
+        """Scrape single page tanpa blocking event loop, dengan retry yang sama seperti scrape_page"""
+        products = self.restored.pop(page_num, None)
+        if products is None:
+            products = self.prefetched.pop(page_num, None)
+        if products is not None:
+            self.checkpoint_page(page_num, products)
+            return products
+        
+        url = self.page_url(page_num)
+        self.page_requests += 1
+        started = time.perf_counter()
+        attempts = 0
+        
+        async with self.semaphore:
+            while True:
+                wait = self.circuit_breaker.wait_time()
+                while wait:
+                    await asyncio.sleep(wait)
+                    wait = self.circuit_breaker.wait_time()
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire_async()
+                
+                attempts += 1
+                try:
+                    content = await self.fetch_page_async(client, url)
+                    self.circuit_breaker.record(True)
+                    if self.archive:
+                        self.archive.store(page_num, url, content)
+                    break
+                
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    http_status = getattr(e, 'status', None)
+                    retryable = (not isinstance(e, aiohttp.ClientResponseError)
+                                 or self.retry_policy.is_retryable_status(http_status))
+                    
+                    if not retryable:
+                        status = 'not_found' if http_status == 404 else 'failed'
+                        self.record_outcome(page_num, attempts, status, started, http_status, str(e))
+                        print(f"Scraping page error {page_num}: {e}")
+                        return []
+                    
+                    self.circuit_breaker.record(False)
+                    if attempts > self.retry_policy.max_retries:
+                        self.record_outcome(page_num, attempts, 'failed', started, http_status, str(e))
+                        print(f"Scraping page error {page_num} after {attempts} attempts: {e}")
+                        return []
+                    
+                    headers = getattr(e, 'headers', None) or {}
+                    retry_after = parse_retry_after(headers.get('Retry-After'))
+                    await asyncio.sleep(self.retry_policy.delay(attempts, retry_after))
+        
+        products = self.parse_or_reuse(page_num, content)
+        self.record_outcome(page_num, attempts, 'ok', started)
+        self.checkpoint_page(page_num, products)
+        
+        print(f"Scraped page {page_num}: {len(products)} products")
+        return products
+
+    async def scrape_all_pages(self, start_page: int = 1, end_page: Optional[int] = 50) -> List[Dict]:
+        """Scrape semua page secara concurrent, hasil urut sesuai nomor page.
+        end_page=None menjalankan discover_last_page terlebih dahulu, jika page terakhir tidak
+        ditemukan page di-scrape sampai max_empty_pages page kosong berturut-turut seperti engine sync."""
+        if end_page is None:
+            end_page = await asyncio.to_thread(self.discover_last_page)
+            if end_page is None:
+                print("Last page not found, scraping until empty pages")
+            else:
+                print(f"Discovered last page: {end_page}")
+        
+        self.semaphore = asyncio.Semaphore(self.max_workers)
+        connector = aiohttp.TCPConnector(limit=self.max_workers)
+        timeout = aiohttp.ClientTimeout(total=10)
+        
+        async with aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                         timeout=timeout) as client:
+            if end_page is not None:
+                page_nums = range(start_page, end_page + 1)
+                pages = dict(zip(page_nums, await asyncio.gather(*(
+                    self.scrape_page_async(client, page_num) for page_num in page_nums
+                ))))
+            else:
+                pages = await self.scrape_until_empty(client, start_page)
+            
+            failed = [page_num for page_num in sorted(pages) if self.page_failed(page_num)]
+            if failed:
+                print(f"Retrying {len(failed)} failed pages: {failed}")
+                retried = await asyncio.gather(*(
+                    self.scrape_page_async(client, page_num) for page_num in failed
+                ))
+                pages.update(zip(failed, retried))
+        
+        return self.merge_pages(pages[page_num] for page_num in sorted(pages))
+
+    async def scrape_until_empty(self, client: aiohttp.ClientSession, start_page: int) -> Dict[int, List[Dict]]:
+        """Scrape window max_workers page secara concurrent sampai max_empty_pages page kosong berturut-turut"""
+        pages = {}
+        empty_streak = 0
+        for window_start in count(start_page, self.max_workers):
+            page_nums = range(window_start, window_start + self.max_workers)
+            results = await asyncio.gather(*(self.scrape_page_async(client, page_num) for page_num in page_nums))
+            for page_num, products in zip(page_nums, results):
+                pages[page_num] = products
+                empty_streak = 0 if products or self.page_failed(page_num) else empty_streak + 1
+                if self.should_stop(empty_streak, page_num):
+                    return pages
+
+
+class ReplayExtractor(ProductExtractor):
+    """Jalankan extraction dari HtmlArchive tanpa akses network.
+    Page index tidak dipakai: replay ditujukan untuk parsing ulang arsip dengan parser terbaru.
+    Checkpoint juga tidak dipakai, agar checkpoint run live yang terputus tetap utuh untuk --resume"""
 
-def extract_fashion_data(start_page: int = 1, end_page: int = 50) -> List[Dict]:
-    """Fungsi main untuk extract fashion data"""
-    extractor = ProductExtractor()
-    products = extractor.scrape_all_pages(start_page, end_page)
+    def __init__(self, replay_dir: str, run_id: Optional[str] = None, **kwargs):
+        kwargs.pop('requests_per_second', None)
+        kwargs.pop('cache_dir', None)
+        kwargs.pop('archive_dir', None)
+        kwargs.pop('page_index_dir', None)
+        kwargs.pop('checkpoint_dir', None)
+        kwargs.pop('resume', None)
+        super().__init__(**kwargs)
+        self.replay_archive = HtmlArchive(replay_dir)
+        self.replay_pages = self.replay_archive.load_manifest(run_id)
+        self.page_delay = 0
+        print(f"Replaying {len(self.replay_pages)} pages from {replay_dir}")
+
+    def discover_last_page(self, max_page: int = 10000) -> Optional[int]:
+        return max(self.replay_pages, default=None)
+
+    def scrape_page(self, page_num: int) -> List[Dict]:
+        """Parse page dari arsip, page yang tidak ada di manifest dianggap tidak ditemukan"""
+        started = time.perf_counter()
+        entry = self.replay_pages.get(page_num)
+        if entry is None:
+            self.record_outcome(page_num, 1, 'not_found', started, 404, "page not in archive")
+            return []
+        
+        products = self.parse_or_reuse(page_num, self.replay_archive.read(entry['hash']))
+        self.record_outcome(page_num, 1, 'ok', started)
+        return products
+
+
+_WORKER_EXTRACTORS = {}
+
+
+def parse_page_records(parser: str, content: bytes):
+    """Dijalankan di process pool: parse satu page, return record tuple ringkas dan lama parsing"""
+    started = time.perf_counter()
+    extractor = _WORKER_EXTRACTORS.get(parser)
+    if extractor is None:
+        extractor = _WORKER_EXTRACTORS[parser] = ProductExtractor(parser=parser)
+    
+    records = [tuple(product[field] for field in RECORD_FIELDS) for product in extractor.parse_page(content)]
+    return records, time.perf_counter() - started
+
+
+class ProcessPoolExtractor(ProductExtractor):
+    """Thread mengambil raw bytes, parsing dijalankan di process pool agar tidak dibatasi GIL.
+    Fetch thread tidak menunggu hasil parsing, jadi jumlah parsing paralel dibatasi parse_workers"""
+
+    def __init__(self, *args, parse_workers: Optional[int] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        self.parse_pool = ProcessPoolExecutor(self.parse_workers,
+                                              mp_context=multiprocessing.get_context('spawn'))
+        self.fetch_busy = 0.0
+        self.parse_busy = 0.0
+        self.started_at = time.perf_counter()
+
+    @property
+    def concurrent(self) -> bool:
+        return True
+
+    @property
+    def in_flight_pages(self) -> int:
+        return (self.max_workers + self.parse_workers) * 2
+
+    def fetch_page(self, url: str) -> bytes:
+        started = time.perf_counter()
+        try:
+            return super().fetch_page(url)
+        finally:
+            with self.stats_lock:
+                self.fetch_busy += time.perf_counter() - started
+
+    def unpack_records(self, result) -> List[Dict]:
+        records, elapsed = result
+        with self.stats_lock:
+            self.parse_busy += elapsed
+        return [dict(zip(RECORD_FIELDS, record)) for record in records]
+
+    def parse_page(self, content) -> List[Dict]:
+        return self.unpack_records(self.parse_pool.submit(parse_page_records, self.parser, content).result())
+
+    def start_page(self, executor: ThreadPoolExecutor, page_num: int) -> Future:
+        return executor.submit(self.fetch_and_submit, page_num)
+
+    def finish_page(self, page_num: int, future: Future) -> List[Dict]:
+        return self.collect_page(page_num, future.result())
+
+    def fetch_and_submit(self, page_num: int):
+        """Dijalankan di fetch thread. Page dari checkpoint, discovery atau page index langsung
+        return list product; body baru diserahkan ke process pool, return (future, digest) tanpa menunggu"""
+        products = self.restored.pop(page_num, None)
+        if products is not None:
+            return products
+        
+        products = self.prefetched.pop(page_num, None)
+        if products is None:
+            with self.stats_lock:
+                self.page_requests += 1
+            content = self.download_page(page_num)
+            if content is None:
+                return []
+            
+            digest = self.page_index.digest(content) if self.page_index else None
+            if self.page_index:
+                products = self.page_index.lookup(page_num, digest, self.parser_key)
+            if products is None:
+                return self.parse_pool.submit(parse_page_records, self.parser, content), digest
+        
+        self.checkpoint_page(page_num, products)
+        return products
+
+    def collect_page(self, page_num: int, fetched) -> List[Dict]:
+        """Dijalankan sesuai urutan page: tunggu hasil parsing, simpan ke page index dan checkpoint"""
+        if isinstance(fetched, list):
+            return fetched
+        
+        parse_future, digest = fetched
+        products = self.unpack_records(parse_future.result())
+        if self.page_index:
+            self.page_index.store(page_num, digest, products, self.parser_key)
+        self.checkpoint_page(page_num, products)
+        print(f"Scraped page {page_num}: {len(products)} products")
+        return products
+
+    def close(self):
+        self.parse_pool.shutdown()
+        super().close()
+
+    def utilisation_report(self) -> str:
+        """Persentase waktu sibuk setiap stage, untuk melihat bottleneck network atau CPU"""
+        wall = max(time.perf_counter() - self.started_at, 1e-9)
+        fetch_util = self.fetch_busy / (wall * self.max_workers)
+        parse_util = self.parse_busy / (wall * self.parse_workers)
+        bound = 'network-bound' if fetch_util >= parse_util else 'CPU-bound'
+        return (f"Stage utilisation: fetch {fetch_util:.0%} of {self.max_workers} threads, "
+                f"parse {parse_util:.0%} of {self.parse_workers} processes ({bound})")
+
+
+def create_extractor(engine: str = "sync", replay_dir: Optional[str] = None,
+                     parse_workers: Optional[int] = None, **options) -> ProductExtractor:
+    """Buat extractor sesuai engine; replay_dir membaca dari arsip tanpa network"""
+    if replay_dir:
+        return ReplayExtractor(replay_dir, **options)
+    if engine == "async":
+        return AsyncProductExtractor(**options)
+    if engine == "process":
+        return ProcessPoolExtractor(parse_workers=parse_workers, **options)
+    if engine == "sync":
+        return ProductExtractor(**options)
+    raise ValueError(f"Unknown extraction engine: {engine}")
+
+
+def report_extraction(extractor: ProductExtractor):
+    """Print semua statistik extraction dan simpan state yang perlu persisten"""
+    if extractor.cache:
+        extractor.cache.save()
+        print(extractor.cache.report())
+    if extractor.page_index:
+        extractor.page_index.save()
+        print(extractor.page_index.report())
+    if extractor.archive:
+        print(f"Archive manifest: {extractor.archive.save_manifest()} "
+              f"({extractor.archive.objects_written} new objects)")
+    print(extractor.request_report())
+    print(extractor.ledger_report())
+    if extractor.transfer_stats.requests:
+        print(extractor.transfer_report())
+    if isinstance(extractor, ProcessPoolExtractor):
+        print(extractor.utilisation_report())
+
+
+def discover_end_page(extractor: ProductExtractor, end_page: Optional[int]) -> Optional[int]:
+    """Pakai end_page jika diberikan, jika None cari page terakhir secara otomatis"""
+    if end_page is not None:
+        return end_page
+    
+    end_page = extractor.discover_last_page()
+    if end_page is None:
+        print("Last page not found, scraping until empty pages")
+    else:
+        print(f"Discovered last page: {end_page} ({extractor.discovery_requests} discovery requests)")
+    return end_page
+
+
+def extract_fashion_data(start_page: int = 1, end_page: Optional[int] = 50, max_workers: int = 1,
+                         requests_per_second: Optional[float] = None,
+                         engine: str = "sync", cache_dir: Optional[str] = None,
+                         parser: str = 'html.parser', base_url: str = BASE_URL,
+                         checkpoint_dir: Optional[str] = None, resume: bool = False,
+                         archive_dir: Optional[str] = None, replay_dir: Optional[str] = None,
+                         parse_workers: Optional[int] = None,
+                         page_index_dir: Optional[str] = None, columnar: bool = False) -> List[Dict]:
+    """Fungsi main untuk extract fashion data, columnar=True mengembalikan ColumnarBatch"""
+    extractor = create_extractor(engine, replay_dir, parse_workers, base_url=base_url, max_workers=max_workers,
+                                 requests_per_second=requests_per_second, cache_dir=cache_dir,
+                                 parser=parser, checkpoint_dir=checkpoint_dir, resume=resume,
+                                 archive_dir=archive_dir, page_index_dir=page_index_dir, columnar=columnar)
+    
+    try:
+        if isinstance(extractor, AsyncProductExtractor):
+            products = asyncio.run(extractor.scrape_all_pages(start_page, end_page))
+        else:
+            products = extractor.scrape_all_pages(start_page, discover_end_page(extractor, end_page))
+    finally:
+        extractor.close()
+    
+    report_extraction(extractor)
     
     print(f"\Ekstraksi completed!")
     print(f"Total products: {len(products)}")
     
-    return products
\ No newline at end of file
+    return products
+
+
+def iter_fashion_data(start_page: int = 1, end_page: Optional[int] = 50, max_workers: int = 1,
+                      requests_per_second: Optional[float] = None, cache_dir: Optional[str] = None,
+                      parser: str = 'html.parser', base_url: str = BASE_URL,
+                      checkpoint_dir: Optional[str] = None, resume: bool = False,
+                      archive_dir: Optional[str] = None, replay_dir: Optional[str] = None,
+                      engine: str = "sync", parse_workers: Optional[int] = None,
+                      page_index_dir: Optional[str] = None) -> Iterator[List[Dict]]:
+    """Versi streaming dari extract_fashion_data, yield satu batch product per page"""
+    if engine == "async":
+        raise ValueError("Streaming extraction supports the 'sync' and 'process' engines")
+    extractor = create_extractor(engine, replay_dir, parse_workers, base_url=base_url, max_workers=max_workers,
+                                 requests_per_second=requests_per_second, cache_dir=cache_dir,
+                                 parser=parser, checkpoint_dir=checkpoint_dir, resume=resume,
+                                 archive_dir=archive_dir, page_index_dir=page_index_dir)
+    total = 0
+    
+    try:
+        for products in extractor.iter_pages(start_page, discover_end_page(extractor, end_page)):
+            total += len(products)
+            yield products
+    finally:
+        extractor.close()
+        report_extraction(extractor)
+    
+    print("Ekstraksi completed!")
+    print(f"Total products: {total}")
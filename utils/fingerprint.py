@@ -0,0 +1,167 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+
+EMPTY = np.uint64(0)
+
+
+class FingerprintSet:
+    """Set fingerprint uint64 dengan open addressing (linear probing) di satu numpy array.
+    Dengan load factor 0.5 memakai sekitar 16 bytes per fingerprint, jauh lebih kecil dari set Python."""
+
+    def __init__(self, capacity: int = 1024, max_load: float = 0.5):
+        self.capacity = 1 << max(4, int(capacity - 1).bit_length())
+        self.max_load = max_load
+        self.table = np.zeros(self.capacity, dtype=np.uint64)
+        self.count = 0
+        # Fingerprint 0 dipakai sebagai penanda slot kosong, disimpan terpisah
+        self.has_zero = False
+
+    @classmethod
+    def from_table(cls, table: np.ndarray, count: int, has_zero: bool,
+                   max_load: float = 0.5) -> 'FingerprintSet':
+        """Bangun set dari table yang sudah ada, misalnya hasil memory-map dari disk"""
+        fingerprints = cls(len(table), max_load)
+        fingerprints.table = table
+        fingerprints.count = count
+        fingerprints.has_zero = has_zero
+        return fingerprints
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return self.table.nbytes
+
+    def add_new(self, fingerprints) -> np.ndarray:
+        """Tambahkan fingerprints, return mask True untuk kemunculan pertama yang belum pernah dilihat"""
+        fingerprints = np.asarray(fingerprints, dtype=np.uint64)
+        is_new = np.zeros(len(fingerprints), dtype=bool)
+        if not len(fingerprints):
+            return is_new
+
+        first_index = np.flatnonzero(~pd.Index(fingerprints).duplicated())
+        zero = fingerprints[first_index] == EMPTY
+        if zero.any():
+            if not self.has_zero:
+                self.has_zero = True
+                self.count += 1
+                is_new[first_index[zero][0]] = True
+            first_index = first_index[~zero]
+
+        self.reserve(self.count + len(first_index))
+        is_new[first_index] = self.insert(fingerprints[first_index])
+        return is_new
+
+    def reserve(self, count: int):
+        """Perbesar table sampai count fingerprint muat di bawah max_load"""
+        capacity = self.capacity
+        while count > capacity * self.max_load:
+            capacity *= 2
+        if capacity == self.capacity:
+            return
+
+        values = self.table[self.table != EMPTY]
+        self.capacity = capacity
+        self.table = np.zeros(capacity, dtype=np.uint64)
+        self.count -= len(values)
+        self.insert(values)
+
+    def insert(self, values: np.ndarray) -> np.ndarray:
+        """Insert value unik (tanpa 0) secara vectorized, return mask value yang belum ada di table"""
+        mask = self.capacity - 1
+        inserted = np.zeros(len(values), dtype=bool)
+        pending = np.arange(len(values))
+        slots = (values & np.uint64(mask)).astype(np.int64)
+
+        while len(pending):
+            current = self.table[slots]
+            found = current == values[pending]
+            empty = current == EMPTY
+            done = found
+
+            claims = np.flatnonzero(empty)
+            if len(claims):
+                # Beberapa value bisa mengincar slot kosong yang sama: tulis semua,
+                # value yang terbaca kembali dari slot adalah pemenangnya
+                self.table[slots[claims]] = values[pending[claims]]
+                winners = claims[self.table[slots[claims]] == values[pending[claims]]]
+                inserted[pending[winners]] = True
+                done = found.copy()
+                done[winners] = True
+
+            collided = ~found & ~empty
+            slots[collided] = (slots[collided] + 1) & mask
+            pending = pending[~done]
+            slots = slots[~done]
+
+        self.count += int(inserted.sum())
+        return inserted
+
+
+class FingerprintIndex:
+    """FingerprintSet persisten antar run. Table disimpan sebagai .npy dan di memory-map
+    (copy-on-write) saat load, jadi lookup tetap O(1) per row tanpa membaca seluruh file dulu."""
+
+    TABLE_FILE = "fingerprints.npy"
+    META_FILE = "meta.json"
+
+    def __init__(self, index_dir: str = ".fingerprint_index"):
+        self.index_dir = index_dir
+        self.ensure_index_dir()
+        self.fingerprints = self.load()
+        self.loaded = len(self.fingerprints)
+
+    def ensure_index_dir(self):
+        if not os.path.exists(self.index_dir):
+            os.makedirs(self.index_dir)
+
+    def path(self, filename: str) -> str:
+        return os.path.join(self.index_dir, filename)
+
+    def load(self) -> FingerprintSet:
+        """Memory-map table dari disk, index yang rusak atau tidak konsisten dianggap kosong"""
+        try:
+            with open(self.path(self.META_FILE), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            table = np.load(self.path(self.TABLE_FILE), mmap_mode='c')
+        except (OSError, ValueError):
+            return FingerprintSet()
+
+        if table.dtype != np.uint64 or len(table) != meta.get('capacity'):
+            print(f"Ignoring inconsistent fingerprint index in {self.index_dir}")
+            return FingerprintSet()
+        return FingerprintSet.from_table(table, meta['count'], meta['has_zero'], meta['max_load'])
+
+    def save(self):
+        """Tulis table lalu metadata, masing-masing atomic lewat file sementara dan rename"""
+        fingerprints = self.fingerprints
+        table_tmp = self.path(self.TABLE_FILE) + ".tmp"
+        with open(table_tmp, 'wb') as f:
+            np.save(f, np.asarray(fingerprints.table))
+            f.flush()
+            os.fsync(f.fileno())
+
+        meta_tmp = self.path(self.META_FILE) + ".tmp"
+        with open(meta_tmp, 'w', encoding='utf-8') as f:
+            json.dump({'capacity': fingerprints.capacity, 'count': fingerprints.count,
+                       'has_zero': fingerprints.has_zero, 'max_load': fingerprints.max_load}, f)
+
+        os.replace(table_tmp, self.path(self.TABLE_FILE))
+        os.replace(meta_tmp, self.path(self.META_FILE))
+
+    def add_new(self, fingerprints) -> np.ndarray:
+        return self.fingerprints.add_new(fingerprints)
+
+    def seed(self, fingerprints):
+        """Isi index dengan row yang sudah ada di output (misalnya sebelum run incremental pertama),
+        row ini tidak dihitung sebagai row baru di report"""
+        self.fingerprints.add_new(fingerprints)
+        self.loaded = len(self.fingerprints)
+
+    def report(self) -> str:
+        return (f"Fingerprint index: {len(self.fingerprints)} rows "
+                f"({len(self.fingerprints) - self.loaded} new this run), "
+                f"{self.fingerprints.nbytes / 1024 / 1024:.1f} MB")
@@ -1,7 +1,143 @@
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import math
 import os
+import sqlite3
+import time
+from collections import Counter
 from datetime import datetime
-from typing import Optional
+from itertools import islice
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from .columnar import arrow_to_frame, is_arrow
+from .schema import COLUMNS, cast_to_profile, get_profile
+from .validation import DataValidator, ValidationReport
+
+REQUIRED_COLUMNS = COLUMNS
+
+OUTPUT_FORMATS = ('csv', 'parquet', 'sqlite')
+
+# Tipe kolom tabel SQLite, mengikuti schema profile standard
+SQLITE_TYPES = {
+    'Title': 'TEXT NOT NULL',
+    'Price': 'REAL',
+    'Rating': 'REAL',
+    'Colors': 'INTEGER',
+    'Size': 'TEXT',
+    'Gender': 'TEXT'
+}
+
+# Kolom yang sering difilter dashboard, masing-masing diberi secondary index
+SQLITE_INDEXES = ['Gender', 'Size', 'Price']
+
+
+class SummaryAccumulator:
+    """Kumpulkan statistik summary secara incremental dari banyak chunk DataFrame"""
+
+    NUMERIC_COLUMNS = ['Price', 'Rating', 'Colors']
+
+    def __init__(self):
+        self.total = 0
+        self.dtypes = None
+        self.stats = {col: {'count': 0, 'mean': 0.0, 'm2': 0.0, 'min': math.inf, 'max': -math.inf}
+                      for col in self.NUMERIC_COLUMNS}
+        self.gender_counts = Counter()
+        self.size_counts = Counter()
+
+    def update(self, df: pd.DataFrame):
+        """Gabungkan statistik satu chunk (parallel variance, Chan et al.)"""
+        if df.empty:
+            return
+        
+        if self.dtypes is None:
+            self.dtypes = df.dtypes
+        self.total += len(df)
+        
+        for col in self.NUMERIC_COLUMNS:
+            values = df[col].astype('float64')
+            stat = self.stats[col]
+            count = len(values)
+            mean = values.mean()
+            delta = mean - stat['mean']
+            total = stat['count'] + count
+            
+            stat['m2'] += ((values - mean) ** 2).sum() + delta ** 2 * stat['count'] * count / total
+            stat['mean'] += delta * count / total
+            stat['count'] = total
+            stat['min'] = min(stat['min'], values.min())
+            stat['max'] = max(stat['max'], values.max())
+        
+        self.gender_counts.update(df['Gender'].value_counts().to_dict())
+        self.size_counts.update(df['Size'].value_counts().to_dict())
+
+    def describe(self) -> pd.DataFrame:
+        """Statistik seperti DataFrame.describe() tanpa quartile"""
+        rows = {}
+        for col, stat in self.stats.items():
+            std = math.sqrt(stat['m2'] / (stat['count'] - 1)) if stat['count'] > 1 else math.nan
+            rows[col] = {'count': float(stat['count']), 'mean': stat['mean'], 'std': std,
+                         'min': stat['min'], 'max': stat['max']}
+        return pd.DataFrame(rows)
+
+
+def format_summary(total: int, dtypes: pd.Series, describe: pd.DataFrame, gender_counts: dict,
+                   size_counts: dict, price_min: float, price_max: float, rating_mean: float) -> str:
+    return f"""
+=== ETL Pipeline Summary ===
+Execution Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Total Records: {total}
+
+Data Types:
+{dtypes.to_string()}
+
+Statistical Summary:
+{describe}
+
+Value Counts:
+Gender: {gender_counts}
+Size: {size_counts}
+
+Price Range: ${price_min:,.2f} - ${price_max:,.2f} IDR
+Average Rating: {rating_mean:.2f}
+        """
+
+
+def merge_frames(existing: pd.DataFrame, incoming: pd.DataFrame,
+                 key: Sequence[str] = ('Title',)) -> Tuple[pd.DataFrame, pd.DataFrame, Dict[str, int]]:
+    """Bandingkan batch baru dengan output yang ada berdasarkan key.
+    Return (hasil merge, row yang dihapus, jumlah inserted / updated / deleted).
+    Urutan row lama dipertahankan, row baru ditambahkan di akhir; key duplikat memakai row terakhir."""
+    key = list(key)
+    old = cast_to_profile(existing, 'standard').drop_duplicates(key, keep='last').set_index(key)
+    # Perbandingan memakai schema standard, row yang ditulis tetap memakai dtype asli incoming
+    # agar float32 (profile compact) tidak ditulis sebagai 4.800000190734863
+    rows = incoming.drop_duplicates(key, keep='last').set_index(key)
+    new = cast_to_profile(rows.reset_index(), 'standard').set_index(key)
+    
+    inserted = ~new.index.isin(old.index)
+    removed = ~old.index.isin(new.index)
+    common = new.index[~inserted]
+    before, after = old.loc[common], new.loc[common]
+    
+    changed = np.zeros(len(common), dtype=bool)
+    for col in new.columns:
+        if pd.api.types.is_float_dtype(new[col].dtype):
+            # Toleransi kecil agar float32 (profile compact) vs nilai dari CSV tidak dianggap berubah
+            changed |= ~np.isclose(before[col].to_numpy('float64'), after[col].to_numpy('float64'),
+                                   rtol=1e-6, atol=0)
+        else:
+            changed |= (before[col] != after[col]).fillna(True).to_numpy(bool)
+    
+    merged = pd.concat([rows.loc[old.index[~removed]], rows[inserted]]).reset_index()[COLUMNS]
+    counts = {'inserted': int(inserted.sum()), 'updated': int(changed.sum()), 'deleted': int(removed.sum())}
+    return merged, old[removed].reset_index()[COLUMNS], counts
+
+
+def csv_dtypes() -> Dict[str, str]:
+    """Kolom string dibaca sebagai string agar Title seperti "nan" tidak menjadi null"""
+    return {col: 'string' for col, dtype in get_profile().items() if dtype == 'string'}
 
 
 class DataLoader:
@@ -26,99 +162,171 @@ class DataLoader:
             print(f"Error menyimpan CSV file: {e}")
             raise
     
-    def validate_data(self, df: pd.DataFrame) -> bool:
-        """Vallidasi data sebelum saving"""
-        print("\n=== Data Validation ===")
-        
-        if df.empty:
-            print("DataFrame is empty!")
-            return False
-        
-        print(f"DataFrame shape: {df.shape}")
-        
-        required_columns = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        
-        if missing_columns:
-            print(f"Missing columns: {missing_columns}")
-            return False
-        
-        print(f"All required columns present: {required_columns}")
-        
-        expected_types = {
-            'Title': 'string',
-            'Price': 'float64',
-            'Rating': 'float64',
-            'Colors': 'int64',
-            'Size': 'string',
-            'Gender': 'string'
-        }
-        
-        for col, expected_type in expected_types.items():
-            actual_type = str(df[col].dtype)
-            if actual_type != expected_type:
-                print(f"Column '{col}' type mismatch: expected {expected_type}, got {actual_type}")
-            else:
-                print(f"Column '{col}': {actual_type}")
-        
-        null_counts = df.isnull().sum()
-        if null_counts.sum() > 0:
-            print(f" Found null values:")
-            for col, count in null_counts.items():
-                if count > 0:
-                    print(f"   {col}: {count} nulls")
-            return False
-        
-        print("No null values found")
+    def save_to_parquet(self, df: pd.DataFrame, filename: str = "products.parquet",
+                        compression: str = 'snappy', row_group_size: Optional[int] = None,
+                        write_statistics: bool = True) -> str:
+        """Save DataFrame ke Parquet file. Dtype kolom ikut tersimpan, dan statistik min/max
+        per row group memungkinkan reader melewati row group yang tidak relevan"""
+        filepath = os.path.join(self.output_dir, filename)
         
-        duplicate_count = df.duplicated().sum()
-        if duplicate_count > 0:
-            print(f" Found {duplicate_count} duplicate rows")
-            return False
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pq.write_table(table, filepath, compression=compression, row_group_size=row_group_size,
+                           write_statistics=write_statistics)
+            print(f"Data berhasil di save ke: {filepath}")
+            print(f"File size: {os.path.getsize(filepath)} bytes ({compression}, "
+                  f"{pq.ParquetFile(filepath).num_row_groups} row groups)")
+            return filepath
+        except Exception as e:
+            print(f"Error menyimpan Parquet file: {e}")
+            raise
+    
+    def save_to_sqlite(self, df: pd.DataFrame, filename: str = "products.db", table: str = "products",
+                       key: Sequence[str] = ('Title',), batch_size: int = 10_000) -> str:
+        """Upsert DataFrame ke tabel SQLite (WAL) berdasarkan natural key, dengan executemany
+        per batch di dalam satu transaction. Row yang sudah ada di-update, row lain tetap"""
+        if not table.isidentifier():
+            raise ValueError(f"Invalid table name: {table}")
+        key = list(key)
+        unknown = [col for col in key if col not in SQLITE_TYPES]
+        if not key or unknown:
+            raise ValueError(f"Invalid upsert key: {key}")
         
-        print("No duplicate rows found")
+        filepath = os.path.join(self.output_dir, filename)
+        updates = ', '.join(f"{col} = excluded.{col}" for col in COLUMNS if col not in key)
+        upsert = (f"INSERT INTO {table} ({', '.join(COLUMNS)}) VALUES ({', '.join('?' for _ in COLUMNS)}) "
+                  f"ON CONFLICT ({', '.join(key)}) DO " + (f"UPDATE SET {updates}" if updates else "NOTHING"))
+        # Kolom diubah ke list Python sekali, NA menjadi NULL
+        values = [df[col].astype(object).where(df[col].notna(), None).tolist() for col in COLUMNS]
+        rows = zip(*values)
         
-        if (df['Price'] <= 0).any():
-            print(" Found non-positive price values")
-            return False
+        start = time.perf_counter()
+        conn = sqlite3.connect(filepath)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            columns = ', '.join(f"{col} {SQLITE_TYPES[col]}" for col in COLUMNS)
+            conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns})")
+            conn.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS ux_{table}_{'_'.join(key)} "
+                         f"ON {table} ({', '.join(key)})")
+            for col in SQLITE_INDEXES:
+                conn.execute(f"CREATE INDEX IF NOT EXISTS ix_{table}_{col} ON {table} ({col})")
+            
+            with conn:
+                while True:
+                    batch = list(islice(rows, batch_size))
+                    if not batch:
+                        break
+                    conn.executemany(upsert, batch)
+            total = conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+        except Exception as e:
+            print(f"Error menyimpan SQLite database: {e}")
+            raise
+        finally:
+            conn.close()
         
-        print("All price values are positive")
+        elapsed = time.perf_counter() - start
+        print(f"Data berhasil di upsert ke: {filepath} (table {table}, key {key})")
+        print(f"Upserted {len(df)} rows in {elapsed:.2f}s ({len(df) / max(elapsed, 1e-9):,.0f} rows/sec), "
+              f"{total} rows in table")
+        return filepath
+    
+    def read_csv(self, filename: str = "products.csv") -> pd.DataFrame:
+        """Baca output CSV yang ada, file yang belum ada dianggap kosong"""
+        filepath = os.path.join(self.output_dir, filename)
+        if not os.path.exists(filepath):
+            return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in get_profile().items()})
+        return pd.read_csv(filepath, dtype=csv_dtypes(), keep_default_na=False)
+    
+    def merge_to_csv(self, df: pd.DataFrame, filename: str = "products.csv", key: Sequence[str] = ('Title',),
+                     removed_filename: str = "removed_products.csv") -> Dict[str, int]:
+        """Merge batch baru ke CSV yang ada berdasarkan key. Hasil merge ditulis ke file sementara
+        lalu di-rename (atomic), row yang hilang dicatat di removed_filename. Return jumlah perubahan"""
+        filepath = os.path.join(self.output_dir, filename)
+        merged, removed, counts = merge_frames(self.read_csv(filename), df, key)
+        print(f"Merge {filepath} (key {list(key)}): {counts['inserted']} inserted, "
+              f"{counts['updated']} updated, {counts['deleted']} deleted")
+        if not any(counts.values()):
+            print("No changes, output file not rewritten")
+            return counts
         
-        if not df['Rating'].between(0, 5).all():
-            print(" Found rating values outside 0-5 range")
-            return False
+        tmp_path = filepath + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+                merged.to_csv(f, index=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, filepath)
+        except Exception as e:
+            print(f"Error menyimpan CSV file: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        print(f"Data berhasil di merge ke: {filepath} ({len(merged)} rows)")
         
-        print("All rating values are in valid range (0-5)")
+        if len(removed):
+            removed['Removed At'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+            header = not os.path.exists(os.path.join(self.output_dir, removed_filename))
+            self.append_to_csv(removed, removed_filename, header=header)
+            print(f"Removed rows dicatat di: {os.path.join(self.output_dir, removed_filename)}")
+        return counts
+    
+    def append_to_csv(self, df: pd.DataFrame, filename: str = "products.csv", header: bool = False) -> str:
+        """Tambahkan chunk DataFrame ke CSV file, header=True memulai file baru"""
+        filepath = os.path.join(self.output_dir, filename)
         
-        print("\nData validation passed!")
-        return True
+        try:
+            df.to_csv(filepath, mode='w' if header else 'a', header=header, index=False, encoding='utf-8')
+            return filepath
+        except Exception as e:
+            print(f"Error menyimpan CSV file: {e}")
+            raise
+    
+    def validation_report(self, df: pd.DataFrame, profile: str = 'standard',
+                          sample_rows: Optional[int] = None) -> ValidationReport:
+        """Report validasi lengkap: jumlah row gagal dan contoh index per rule, dan durasi"""
+        return DataValidator(profile).validate(df, sample_rows)
+    
+    def validate_data(self, df: pd.DataFrame, profile: str = 'standard', sample_rows: Optional[int] = None) -> bool:
+        """Vallidasi data sebelum saving, tipe kolom dicek terhadap schema profile.
+        sample_rows membatasi validasi ke sample acak untuk DataFrame yang sangat besar"""
+        report = self.validation_report(df, profile, sample_rows)
+        print()
+        print(report.format())
+        return report.passed
     
     def generate_summary(self, df: pd.DataFrame) -> str:
         """Generate data summary"""
-        summary = f"""
-=== ETL Pipeline Summary ===
-Execution Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-Total Records: {len(df)}
-
-Data Types:
-{df.dtypes.to_string()}
-
-Statistical Summary:
-{df.describe()}
-
-Value Counts:
-Gender: {df['Gender'].value_counts().to_dict()}
-Size: {df['Size'].value_counts().to_dict()}
-
-Price Range: ${df['Price'].min():,.2f} - ${df['Price'].max():,.2f} IDR
-Average Rating: {df['Rating'].mean():.2f}
-        """
-        return summary
+        return format_summary(
+            len(df), df.dtypes, df.describe(),
+            df['Gender'].value_counts().to_dict(), df['Size'].value_counts().to_dict(),
+            df['Price'].min(), df['Price'].max(), df['Rating'].mean()
+        )
+    
+    def generate_stream_summary(self, accumulator: SummaryAccumulator) -> str:
+        """Generate data summary dari statistik yang dikumpulkan per chunk"""
+        describe = accumulator.describe()
+        return format_summary(
+            accumulator.total, accumulator.dtypes, describe,
+            dict(accumulator.gender_counts.most_common()), dict(accumulator.size_counts.most_common()),
+            describe.loc['min', 'Price'], describe.loc['max', 'Price'], describe.loc['mean', 'Rating']
+        )
     
-    def save_summary(self, df: pd.DataFrame, filename: str = "summary.txt") -> str:
+    def generate_file_summary(self, filename: str = "products.csv", profile: str = 'standard',
+                              chunksize: int = 100_000) -> str:
+        """Generate data summary seluruh isi CSV (run append), dibaca per chunk"""
+        accumulator = SummaryAccumulator()
+        filepath = os.path.join(self.output_dir, filename)
+        for chunk in pd.read_csv(filepath, dtype=csv_dtypes(), keep_default_na=False, chunksize=chunksize):
+            accumulator.update(cast_to_profile(chunk, profile))
+        return self.generate_stream_summary(accumulator)
+    
+    def save_summary(self, df: pd.DataFrame, filename: str = "summary.txt",
+                     summary: Optional[str] = None) -> str:
         """Save data summary to text file"""
         filepath = os.path.join(self.output_dir, filename)
-        summary = self.generate_summary(df)
+        if summary is None:
+            summary = self.generate_summary(df)
         
         try:
             with open(filepath, 'w', encoding='utf-8') as f:
@@ -131,20 +339,107 @@ Average Rating: {df['Rating'].mean():.2f}
 
 
 def load_fashion_data(df: pd.DataFrame, filename: str = "products.csv", 
-                     output_dir: str = ".", validate: bool = True) -> str:
-    """Main function to load fashion data"""
-    loader = DataLoader(output_dir)
+                     output_dir: str = ".", validate: bool = True, profile: str = 'standard',
+                     append: bool = False, output_format: str = 'csv', compression: str = 'snappy',
+                     row_group_size: Optional[int] = None, key: Sequence[str] = ('Title',),
+                     merge: bool = False, validate_sample: Optional[int] = None) -> str:
+    """Main function to load fashion data, df boleh berupa Arrow Table / RecordBatch.
+    append=True menambahkan row ke CSV yang sudah ada (run incremental).
+    output_format='parquet' menulis <nama file>.parquet dengan compression dan row_group_size,
+    output_format='sqlite' meng-upsert ke <nama file>.db berdasarkan key.
+    merge=True membandingkan df dengan CSV yang ada berdasarkan key (insert / update / delete).
+    validate_sample membatasi validasi ke sample acak sejumlah row tersebut"""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format: {output_format}")
+    if append and output_format == 'parquet':
+        raise ValueError("Append mode is not supported for Parquet output")
+    if merge and (append or output_format != 'csv'):
+        raise ValueError("Merge mode is only supported for CSV output without append")
     
+    loader = DataLoader(output_dir)
+    if is_arrow(df):
+        df = arrow_to_frame(df)
+
+    if append and df.empty:
+        print("No new records to load")
+        return os.path.join(output_dir, filename)
+
     if validate:
-        if not loader.validate_data(df):
+        if not loader.validate_data(df, profile, validate_sample):
             raise ValueError("Data validation failed!")
     
-    csv_path = loader.save_to_csv(df, filename)
+    if output_format == 'parquet':
+        output_path = loader.save_to_parquet(df, os.path.splitext(filename)[0] + ".parquet",
+                                             compression, row_group_size)
+    elif output_format == 'sqlite':
+        output_path = loader.save_to_sqlite(df, os.path.splitext(filename)[0] + ".db", key=key)
+    elif merge:
+        loader.merge_to_csv(df, filename, key)
+        output_path = os.path.join(output_dir, filename)
+    elif append:
+        header = not os.path.exists(os.path.join(output_dir, filename))
+        output_path = loader.append_to_csv(df, filename, header=header)
+    else:
+        output_path = loader.save_to_csv(df, filename)
     
-    loader.save_summary(df)
+    # Pada append, summary menggambarkan seluruh CSV, bukan hanya row baru run ini
+    loader.save_summary(df, summary=loader.generate_file_summary(filename, profile) if append else None)
     
     print(f"\n=== Loading completed! ===")
-    print(f"CSV file: {csv_path}")
+    print(f"{output_format.upper()} file: {output_path}")
     print(f"Records saved: {len(df)}")
     
-    return csv_path
\ No newline at end of file
+    return output_path
+
+
+def load_fashion_stream(frames: Iterable[pd.DataFrame], filename: str = "products.csv",
+                        output_dir: str = ".", validate: bool = True, profile: str = 'standard',
+                        append: bool = False, validate_sample: Optional[int] = None) -> str:
+    """Load chunk DataFrame satu per satu, CSV dan summary ditulis incremental.
+    Tanpa append, chunk ditulis ke file sementara yang baru di-rename ke filename setelah
+    semua chunk sukses, jadi CSV lama tetap utuh jika extraction / transform / validasi gagal.
+    append=True menambahkan row langsung ke CSV yang sudah ada (run incremental)"""
+    loader = DataLoader(output_dir)
+    accumulator = SummaryAccumulator()
+    csv_path = os.path.join(output_dir, filename)
+    write_name = filename if append else filename + ".tmp"
+    if not append or not os.path.exists(csv_path):
+        loader.append_to_csv(pd.DataFrame(columns=REQUIRED_COLUMNS), write_name, header=True)
+    
+    try:
+        for df in frames:
+            if is_arrow(df):
+                df = arrow_to_frame(df)
+            if validate and not loader.validate_data(df, profile, validate_sample):
+                raise ValueError("Data validation failed!")
+            
+            loader.append_to_csv(df, write_name)
+            accumulator.update(df)
+        
+        if accumulator.total == 0 and not append:
+            raise ValueError("No data to load!")
+    except BaseException:
+        if not append:
+            os.remove(os.path.join(output_dir, write_name))
+        raise
+    
+    if not append:
+        with open(os.path.join(output_dir, write_name), 'rb') as f:
+            os.fsync(f.fileno())
+        os.replace(os.path.join(output_dir, write_name), csv_path)
+    
+    if accumulator.total == 0:
+        print("No new records to load")
+        return csv_path
+    
+    if append:
+        summary = loader.generate_file_summary(filename, profile)
+    else:
+        summary = loader.generate_stream_summary(accumulator)
+    loader.save_summary(None, summary=summary)
+    
+    print(f"\n=== Loading completed! ===")
+    print(f"CSV file: {csv_path}")
+    print(f"Records saved: {accumulator.total}")
+    
+    return csv_path
@@ -0,0 +1,48 @@
+import math
+import threading
+from collections import Counter
+from typing import List, Sequence
+
+
+def percentile(values: Sequence[float], pct: float) -> float:
+    """Percentile dengan nearest-rank, 0 untuk data kosong"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class TransferStats:
+    """Statistik transfer HTTP per run: bytes di wire, encoding dan time-to-first-byte"""
+
+    def __init__(self):
+        self.requests = 0
+        self.wire_bytes = 0
+        self.decoded_bytes = 0
+        self.encodings = Counter()
+        self.ttfb: List[float] = []
+        self.lock = threading.Lock()
+
+    def record(self, wire_bytes: int, decoded_bytes: int, encoding: str, ttfb: float):
+        with self.lock:
+            self.requests += 1
+            self.wire_bytes += wire_bytes
+            self.decoded_bytes += decoded_bytes
+            self.encodings[encoding or 'identity'] += 1
+            self.ttfb.append(ttfb)
+
+    @property
+    def compression_ratio(self) -> float:
+        return self.decoded_bytes / self.wire_bytes if self.wire_bytes else 0.0
+
+    def report(self, connections_opened: int = 0, connections_reused: int = 0) -> str:
+        with self.lock:
+            ttfb = list(self.ttfb)
+        return (f"Transfer: {self.requests} responses, {self.wire_bytes} bytes on wire, "
+                f"{self.decoded_bytes} bytes decoded (ratio {self.compression_ratio:.1f}x), "
+                f"encodings: {dict(self.encodings)}\n"
+                f"Connections: {connections_opened} opened, {connections_reused} reused\n"
+                f"TTFB p50: {percentile(ttfb, 50) * 1000:.1f}ms, "
+                f"p90: {percentile(ttfb, 90) * 1000:.1f}ms, "
+                f"p99: {percentile(ttfb, 99) * 1000:.1f}ms")
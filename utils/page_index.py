@@ -0,0 +1,67 @@
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, List, Optional
+
+
+class PageIndex:
+    """Simpan hash body dan record hasil parsing per page agar page yang tidak berubah tidak di parse ulang"""
+
+    INDEX_FILE = "pages.json"
+
+    def __init__(self, index_dir: str = ".page_index"):
+        self.index_dir = index_dir
+        self.lock = threading.Lock()
+        self.parsed = 0
+        self.reused = 0
+        self.ensure_index_dir()
+        self.pages = self.load_index()
+
+    def ensure_index_dir(self):
+        if not os.path.exists(self.index_dir):
+            os.makedirs(self.index_dir)
+
+    def load_index(self) -> Dict[int, Dict]:
+        """Baca index page, index rusak dianggap kosong"""
+        index_path = os.path.join(self.index_dir, self.INDEX_FILE)
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                pages = json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+        return {int(page_num): entry for page_num, entry in pages.items()}
+
+    def save(self):
+        """Simpan index ke disk secara atomic"""
+        index_path = os.path.join(self.index_dir, self.INDEX_FILE)
+        tmp_path = index_path + ".tmp"
+        with self.lock:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.pages, f, ensure_ascii=False)
+            os.replace(tmp_path, index_path)
+
+    @staticmethod
+    def digest(content) -> str:
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return hashlib.sha256(content).hexdigest()
+
+    def lookup(self, page_num: int, digest: str, parser: Optional[str] = None) -> Optional[List[Dict]]:
+        """Record dari run sebelumnya jika hash body page dan parser (backend dan versi) masih sama"""
+        with self.lock:
+            entry = self.pages.get(page_num)
+            if entry is None or entry['hash'] != digest or entry.get('parser') != parser:
+                return None
+            self.reused += 1
+            return [dict(record) for record in entry['records']]
+
+    def store(self, page_num: int, digest: str, records: List[Dict], parser: Optional[str] = None):
+        with self.lock:
+            self.parsed += 1
+            self.pages[page_num] = {'hash': digest, 'parser': parser, 'records': records}
+
+    def report(self) -> str:
+        return (f"Page index: {self.parsed} pages parsed, {self.reused} reused "
+                f"({len(self.pages)} pages indexed)")
@@ -0,0 +1,109 @@
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse header Retry-After (detik atau HTTP-date) menjadi detik"""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Exponential backoff dengan full jitter, menghormati Retry-After dari server"""
+
+    def __init__(self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 30.0,
+                 jitter: bool = True):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+
+    def is_retryable_status(self, status: Optional[int]) -> bool:
+        return status in RETRYABLE_STATUS
+
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Lama tunggu sebelum attempt berikutnya (attempt dimulai dari 1)"""
+        if retry_after is not None:
+            return min(retry_after, self.backoff_max)
+
+        delay = min(self.backoff_max, self.backoff_base * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    """Hentikan sementara semua request jika error rate terlalu tinggi"""
+
+    def __init__(self, window: int = 20, failure_threshold: float = 0.5, min_requests: int = 5,
+                 cooldown: float = 30.0):
+        self.window = window
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.cooldown = cooldown
+        self.results = deque(maxlen=window)
+        self.state = 'closed'
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.lock = threading.Lock()
+
+    def wait_time(self) -> float:
+        """Return 0 jika request boleh jalan, atau lama waktu tunggu selama circuit open"""
+        with self.lock:
+            if self.state != 'open':
+                return 0.0
+
+            remaining = self.opened_at + self.cooldown - time.monotonic()
+            if remaining > 0:
+                return remaining
+
+            self.state = 'half-open'
+            return 0.0
+
+    def before_request(self):
+        """Blok sampai circuit mengizinkan request"""
+        wait = self.wait_time()
+        while wait:
+            time.sleep(wait)
+            wait = self.wait_time()
+
+    def record(self, success: bool):
+        with self.lock:
+            if self.state == 'half-open':
+                if success:
+                    self.state = 'closed'
+                    self.results.clear()
+                else:
+                    self.open()
+                return
+
+            self.results.append(success)
+            failures = self.results.count(False)
+            if (len(self.results) >= self.min_requests
+                    and failures / len(self.results) >= self.failure_threshold
+                    and self.state == 'closed'):
+                self.open()
+
+    def open(self):
+        self.state = 'open'
+        self.opened_at = time.monotonic()
+        self.times_opened += 1
+        self.results.clear()
+        print(f"Circuit breaker open: pausing requests for {self.cooldown:.0f}s")
@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+from typing import Dict
+
+COLUMNS = ['Title', 'Price', 'Rating', 'Colors', 'Size', 'Gender']
+
+# Profile dtype final per kolom. "compact" memakai category untuk kolom dengan sedikit value
+# dan numeric yang lebih sempit; Price tetap float64 karena harga IDR bisa melebihi presisi float32.
+# "arrow" menyimpan semua kolom di buffer Arrow (string[pyarrow] dan numeric Arrow)
+SCHEMA_PROFILES = {
+    'standard': {
+        'Title': 'string',
+        'Price': 'float64',
+        'Rating': 'float64',
+        'Colors': 'int64',
+        'Size': 'string',
+        'Gender': 'string'
+    },
+    'compact': {
+        'Title': 'string',
+        'Price': 'float64',
+        'Rating': 'float32',
+        'Colors': 'int8',
+        'Size': 'category',
+        'Gender': 'category'
+    },
+    'arrow': {
+        'Title': 'string[pyarrow]',
+        'Price': 'double[pyarrow]',
+        'Rating': 'double[pyarrow]',
+        'Colors': 'int64[pyarrow]',
+        'Size': 'string[pyarrow]',
+        'Gender': 'string[pyarrow]'
+    },
+}
+
+# Dtype Arrow yang diterima validasi sebagai pengganti dtype numpy / pandas
+ARROW_EQUIVALENTS = {
+    'string': 'string[pyarrow]',
+    'float64': 'double[pyarrow]',
+    'float32': 'float[pyarrow]',
+    'int64': 'int64[pyarrow]',
+    'int8': 'int8[pyarrow]',
+}
+
+
+def get_profile(profile: str = 'standard') -> Dict[str, str]:
+    """Mapping kolom -> dtype untuk profile tertentu"""
+    if profile not in SCHEMA_PROFILES:
+        raise ValueError(f"Unknown schema profile: {profile}")
+    return SCHEMA_PROFILES[profile]
+
+
+def dtype_matches(actual, expected: str) -> bool:
+    """Cek dtype kolom terhadap dtype profile, dtype Arrow yang setara juga diterima"""
+    if expected == 'category':
+        return isinstance(actual, pd.CategoricalDtype)
+    candidates = [expected, ARROW_EQUIVALENTS.get(expected)]
+    return any(candidate and actual == pd.api.types.pandas_dtype(candidate) for candidate in candidates)
+
+
+def cast_to_profile(df: pd.DataFrame, profile: str = 'standard') -> pd.DataFrame:
+    """Cast setiap kolom ke dtype profile, integer sempit dicek agar tidak overflow"""
+    dtypes = get_profile(profile)
+    for col, dtype in dtypes.items():
+        target = pd.api.types.pandas_dtype(dtype)
+        if pd.api.types.is_integer_dtype(target):
+            limits = np.iinfo(getattr(target, 'numpy_dtype', target))
+            if len(df) and (df[col].min() < limits.min or df[col].max() > limits.max):
+                raise ValueError(f"Column '{col}' does not fit in {dtype}")
+    # Category selalu dibentuk dari kolom string agar dtype categories sama apapun input-nya
+    categories = {col: 'string' for col, dtype in dtypes.items() if dtype == 'category'}
+    if categories:
+        df = df.astype(categories)
+    return df.astype(dtypes)
+
+
+def memory_usage(df: pd.DataFrame) -> int:
+    """Total memory DataFrame dalam bytes, termasuk isi string"""
+    return int(df.memory_usage(deep=True).sum())
@@ -1,18 +1,53 @@
+import multiprocessing
+import numpy as np
+import os
 import pandas as pd
 import re
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable, Iterator, List, Dict, Optional
+
+import pyarrow as pa
+
+from .columnar import ColumnarBatch, arrow_to_frame, is_arrow
+from .fingerprint import FingerprintIndex, FingerprintSet
+from .schema import COLUMNS, cast_to_profile, get_profile, memory_usage
+
+NUMERIC_COLUMNS = ('Price', 'Rating', 'Colors')
+# Title hampir selalu unik, memo hanya untuk kolom yang berulang
+MEMO_COLUMNS = ('Price', 'Rating', 'Colors', 'Size', 'Gender')
+
+PRICE_PATTERN = re.compile(r'\$(\d+\.?\d*)')
+RATING_PATTERN = re.compile(r'(\d+\.?\d*)\s*/\s*5')
+INVALID_RATING_PATTERN = re.compile(r'Invalid Rating|Not Rated')
+COLORS_PATTERN = re.compile(r'(\d+)\s*Colors?')
+SIZE_PATTERN = re.compile(r'Size:\s*([A-Z]+)')
+GENDER_PATTERN = re.compile(r'Gender:\s*(\w+)')
 
 
 class DataTransformer:
-    def __init__(self, usd_to_idr_rate: float = 16000.0):
+    def __init__(self, usd_to_idr_rate: float = 16000.0, vectorized: bool = True,
+                 factorize: bool = True, memo_max_entries: int = 100_000, profile: str = 'standard',
+                 history: Optional[FingerprintIndex] = None):
         self.usd_to_idr_rate = usd_to_idr_rate
+        # Index fingerprint dari run sebelumnya, row yang sudah pernah dilihat dibuang
+        self.history = history
+        self.profile = profile
+        # Profile arrow membersihkan kolom sebagai string[pyarrow] tanpa konversi ke object
+        self.string_dtype = get_profile(profile)['Title']
+        self.vectorized = vectorized
+        self.factorize = factorize
+        self.memo_max_entries = memo_max_entries
+        # Memo raw value -> value bersih, persisten antar batch saat streaming
+        self.memo = {column: {} for column in MEMO_COLUMNS}
+        self.values_cleaned = 0
     
     def clean_price(self, price_str: str) -> float:
         """USD ke IDR"""
         if pd.isna(price_str) or price_str in ['Price Unavailable', 'Unknown', '']:
             return None
         
-        price_match = re.search(r'\$(\d+\.?\d*)', str(price_str))
+        price_match = PRICE_PATTERN.search(str(price_str))
         if price_match:
             usd_price = float(price_match.group(1))
             idr_price = usd_price * self.usd_to_idr_rate
@@ -25,7 +60,7 @@ class DataTransformer:
         if pd.isna(rating_str) or 'Invalid Rating' in str(rating_str) or 'Not Rated' in str(rating_str):
             return None
         
-        rating_match = re.search(r'(\d+\.?\d*)\s*/\s*5', str(rating_str))
+        rating_match = RATING_PATTERN.search(str(rating_str))
         if rating_match:
             return float(rating_match.group(1))
         
@@ -36,7 +71,7 @@ class DataTransformer:
         if pd.isna(colors_str):
             return None
         
-        colors_match = re.search(r'(\d+)\s*Colors?', str(colors_str))
+        colors_match = COLORS_PATTERN.search(str(colors_str))
         if colors_match:
             return int(colors_match.group(1))
         
@@ -47,7 +82,7 @@ class DataTransformer:
         if pd.isna(size_str):
             return None
         
-        size_match = re.search(r'Size:\s*([A-Z]+)', str(size_str))
+        size_match = SIZE_PATTERN.search(str(size_str))
         if size_match:
             return size_match.group(1)
         
@@ -58,7 +93,7 @@ class DataTransformer:
         if pd.isna(gender_str):
             return None
         
-        gender_match = re.search(r'Gender:\s*(\w+)', str(gender_str))
+        gender_match = GENDER_PATTERN.search(str(gender_str))
         if gender_match:
             return gender_match.group(1)
         
@@ -71,52 +106,245 @@ class DataTransformer:
         
         return str(title_str).strip()
     
+    def clean_frame(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Bersihkan setiap kolom raw, nilai invalid menjadi null"""
+        if self.factorize:
+            return self.clean_frame_factorized(df)
+        if self.vectorized:
+            return self.clean_frame_vectorized(df)
+        return self.clean_frame_rowwise(df)
+    
+    def clean_frame_rowwise(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Versi per-row memakai method clean_* untuk setiap value"""
+        return pd.DataFrame({
+            'Title': df['Title'].apply(self.clean_title),
+            'Price': df['Price'].apply(self.clean_price),
+            'Rating': df['Rating'].apply(self.clean_rating),
+            'Colors': df['Colors'].apply(self.clean_colors),
+            'Size': df['Size'].apply(self.clean_size),
+            'Gender': df['Gender'].apply(self.clean_gender)
+        })
+    
+    def clean_title_series(self, series: pd.Series) -> pd.Series:
+        title = series.astype(self.string_dtype)
+        stripped = title.str.strip()
+        invalid = (stripped == '') | title.str.contains('Unknown Product', regex=False)
+        return stripped.mask(invalid.fillna(False))
+    
+    def clean_price_series(self, series: pd.Series) -> pd.Series:
+        price = series.astype(self.string_dtype).str.extract(PRICE_PATTERN, expand=False).astype('float64')
+        return price * self.usd_to_idr_rate
+    
+    def clean_rating_series(self, series: pd.Series) -> pd.Series:
+        rating = series.astype(self.string_dtype)
+        invalid = rating.str.contains(INVALID_RATING_PATTERN.pattern).fillna(False)
+        return rating.str.extract(RATING_PATTERN, expand=False).mask(invalid).astype('float64')
+    
+    def clean_colors_series(self, series: pd.Series) -> pd.Series:
+        return series.astype(self.string_dtype).str.extract(COLORS_PATTERN, expand=False).astype('float64')
+    
+    def clean_size_series(self, series: pd.Series) -> pd.Series:
+        return series.astype(self.string_dtype).str.extract(SIZE_PATTERN, expand=False)
+    
+    def clean_gender_series(self, series: pd.Series) -> pd.Series:
+        return series.astype(self.string_dtype).str.extract(GENDER_PATTERN, expand=False)
+    
+    def clean_frame_vectorized(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Versi vectorized dari clean_frame dengan str.extract, hasil sama dengan clean_* per row"""
+        return pd.DataFrame({
+            column: getattr(self, f"clean_{column.lower()}_series")(df[column]) for column in COLUMNS
+        })
+    
+    def clean_unique_values(self, column: str, values: List) -> List:
+        """Bersihkan daftar value unik dengan cleaner vectorized atau clean_* per value"""
+        if self.vectorized:
+            cleaned = getattr(self, f"clean_{column.lower()}_series")(pd.Series(values, dtype=object))
+            return cleaned.astype(object).where(cleaned.notna(), None).tolist()
+        clean_value = getattr(self, f"clean_{column.lower()}")
+        return [clean_value(value) for value in values]
+    
+    def clean_column_factorized(self, column: str, series: pd.Series) -> pd.Series:
+        """Factorize kolom, bersihkan value unik sekali saja lalu broadcast hasilnya lewat code"""
+        codes, uniques = pd.factorize(series)
+        memo = self.memo[column] if column in MEMO_COLUMNS else {}
+        
+        # Mapping batch ini disimpan lokal, sehingga memo boleh di-clear tanpa kehilangan value batch ini
+        cleaned = {value: memo[value] for value in uniques if value in memo}
+        missing = [value for value in uniques if value not in cleaned]
+        if missing:
+            cleaned.update(zip(missing, self.clean_unique_values(column, missing)))
+            if len(memo) + len(missing) > self.memo_max_entries:
+                memo.clear()
+            memo.update((value, cleaned[value]) for value in missing)
+            self.values_cleaned += len(missing)
+        
+        dtype = 'float64' if column in NUMERIC_COLUMNS else object
+        # Slot terakhir untuk code -1 (nilai null)
+        mapped = np.array([cleaned[value] for value in uniques] + [None], dtype=dtype)
+        return pd.Series(mapped[codes], index=series.index, name=column)
+    
+    def clean_frame_factorized(self, df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({column: self.clean_column_factorized(column, df[column]) for column in COLUMNS})
+    
+    def cast_types(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Set tipe data final setiap kolom sesuai schema profile"""
+        return cast_to_profile(df, self.profile)
+    
     def transform_data(self, products: List[Dict]) -> pd.DataFrame:
         """Transform raw product data"""
-        df = pd.DataFrame(products)
+        df = records_frame(products)
         
         print(f"Initial data shape: {df.shape}")
         
-        df['Title_clean'] = df['Title'].apply(self.clean_title)
-        df['Price_clean'] = df['Price'].apply(self.clean_price)
-        df['Rating_clean'] = df['Rating'].apply(self.clean_rating)
-        df['Colors_clean'] = df['Colors'].apply(self.clean_colors)
-        df['Size_clean'] = df['Size'].apply(self.clean_size)
-        df['Gender_clean'] = df['Gender'].apply(self.clean_gender)
-        
-        df_final = pd.DataFrame({
-            'Title': df['Title_clean'],
-            'Price': df['Price_clean'],
-            'Rating': df['Rating_clean'],
-            'Colors': df['Colors_clean'],
-            'Size': df['Size_clean'],
-            'Gender': df['Gender_clean']
-        })
-        
+        df_final = self.clean_frame(df)
         print(f"After cleaning shape: {df_final.shape}")
         
         df_final = df_final.dropna()
         print(f"After removing null values: {df_final.shape}")
         
+        return self.finalize_frame(df_final)
+    
+    def finalize_frame(self, df_final: pd.DataFrame) -> pd.DataFrame:
+        """Buang duplikat (kemunculan pertama dipertahankan), cast ke profile dan reset index"""
         df_final = df_final.drop_duplicates()
         print(f"After removing duplicates: {df_final.shape}")
         
-        df_final['Title'] = df_final['Title'].astype('string')
-        df_final['Price'] = df_final['Price'].astype('float64')
-        df_final['Rating'] = df_final['Rating'].astype('float64')
-        df_final['Colors'] = df_final['Colors'].astype('int64')
-        df_final['Size'] = df_final['Size'].astype('string')
-        df_final['Gender'] = df_final['Gender'].astype('string')
+        if self.history is not None:
+            df_final = df_final[self.history.add_new(row_fingerprints(df_final))]
+            print(f"After removing rows seen in previous runs: {df_final.shape}")
+        
+        memory_before = memory_usage(df_final)
+        df_final = self.cast_types(df_final)
+        memory_after = memory_usage(df_final)
+        print(f"Memory ({self.profile} profile): {memory_before / 1024 / 1024:.2f} MB -> "
+              f"{memory_after / 1024 / 1024:.2f} MB ({1 - memory_after / max(memory_before, 1):.0%} saved)")
         
         df_final = df_final.reset_index(drop=True)
         
         return df_final
+    
+    def transform_data_parallel(self, products: List[Dict], workers: Optional[int] = None,
+                                partitions: Optional[int] = None) -> pd.DataFrame:
+        """Versi multi-core dari transform_data: partisi dibersihkan di process pool lalu digabung
+        urut partisi, sehingga deduplikasi global tetap mempertahankan kemunculan pertama"""
+        workers = workers or os.cpu_count() or 1
+        df = records_frame(products)
+        print(f"Initial data shape: {df.shape}")
+        
+        bounds = np.linspace(0, len(df), (partitions or workers * 4) + 1).astype(int)
+        parts = [df.iloc[start:end] for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+        if not parts:
+            return self.finalize_frame(cast_to_profile(self.clean_frame(df).dropna(), 'standard'))
+        
+        options = (self.usd_to_idr_rate, self.vectorized, self.factorize, self.memo_max_entries)
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+            cleaned = list(pool.map(clean_partition, repeat(options), parts))
+        
+        df_final = pd.concat(cleaned, ignore_index=True)
+        print(f"After cleaning and removing null values: {df_final.shape} "
+              f"({len(parts)} partitions, {workers} workers)")
+        
+        return self.finalize_frame(df_final)
+    
+    def transform_stream(self, batches: Iterable[List[Dict]],
+                         chunk_size: Optional[int] = None) -> Iterator[pd.DataFrame]:
+        """Transform batch demi batch, duplikat antar batch dibuang dengan FingerprintSet.
+        chunk_size menggabungkan batch kecil (misalnya per page) sampai minimal chunk_size row.
+        Hasil gabungan semua chunk identik dengan transform_data pada seluruh input."""
+        seen = self.history.fingerprints if self.history is not None else FingerprintSet()
+        rows_in = 0
+        rows_out = 0
+        
+        for products in iter_record_chunks(batches, chunk_size):
+            rows_in += len(products)
+            if not products:
+                continue
+            
+            df_batch = self.clean_frame(records_frame(products)).dropna()
+            
+            df_batch = cast_to_profile(df_batch, 'standard')
+            df_batch = df_batch[seen.add_new(row_fingerprints(df_batch))].reset_index(drop=True)
+            if self.profile != 'standard':
+                df_batch = self.cast_types(df_batch)
+            rows_out += len(df_batch)
+            
+            if not df_batch.empty:
+                yield df_batch
+        
+        print(f"Streaming transform: {rows_in} raw rows -> {rows_out} clean rows "
+              f"({self.values_cleaned} unique values cleaned, "
+              f"{seen.nbytes / 1024 / 1024:.1f} MB fingerprints)")
+
+
+def row_fingerprints(df: pd.DataFrame) -> np.ndarray:
+    """Hash uint64 per row dari bentuk normal row: schema standard yang lossless, sama seperti
+    perbandingan drop_duplicates di transform_data yang berjalan sebelum cast ke profile"""
+    return pd.util.hash_pandas_object(cast_to_profile(df, 'standard'), index=False).to_numpy()
 
 
-def transform_fashion_data(products: List[Dict]) -> pd.DataFrame:
-    """Fungsi main untul transform fashion data"""
-    transformer = DataTransformer()
-    df_clean = transformer.transform_data(products)
+_WORKER_TRANSFORMERS = {}
+
+
+def clean_partition(options: tuple, df: pd.DataFrame) -> pd.DataFrame:
+    """Dijalankan di process pool: bersihkan satu partisi, buang null dan duplikat di dalam partisi"""
+    transformer = _WORKER_TRANSFORMERS.get(options)
+    if transformer is None:
+        transformer = _WORKER_TRANSFORMERS[options] = DataTransformer(*options)
+    
+    cleaned = cast_to_profile(transformer.clean_frame(df).dropna(), 'standard')
+    return cleaned.drop_duplicates()
+
+
+def records_frame(products) -> pd.DataFrame:
+    """DataFrame raw dari list of dict, buffer kolom ColumnarBatch atau Arrow record batch"""
+    if isinstance(products, ColumnarBatch):
+        return products.to_frame()
+    if is_arrow(products):
+        return arrow_to_frame(products)
+    return pd.DataFrame(products, columns=COLUMNS)
+
+
+def iter_record_chunks(batches: Iterable[List[Dict]], chunk_size: Optional[int] = None) -> Iterator[List[Dict]]:
+    """Gabungkan batch record sampai minimal chunk_size row, None berarti batch apa adanya"""
+    if not chunk_size:
+        yield from batches
+        return
+    
+    pending = []
+    rows = 0
+    for products in batches:
+        pending.append(products)
+        rows += len(products)
+        if rows >= chunk_size:
+            yield concat_records(pending)
+            pending = []
+            rows = 0
+    if rows:
+        yield concat_records(pending)
+
+
+def concat_records(batches: List):
+    """Gabungkan batch bertipe sama: list of dict, ColumnarBatch atau Arrow record batch"""
+    if is_arrow(batches[0]):
+        return pa.concat_tables([pa.Table.from_batches([batch]) if isinstance(batch, pa.RecordBatch) else batch
+                                 for batch in batches])
+    
+    merged = ColumnarBatch() if isinstance(batches[0], ColumnarBatch) else []
+    for batch in batches:
+        merged.extend(batch)
+    return merged
+
+
+def transform_fashion_data(products: List[Dict], profile: str = 'standard',
+                           workers: Optional[int] = None,
+                           history: Optional[FingerprintIndex] = None) -> pd.DataFrame:
+    """Fungsi main untul transform fashion data, workers > 1 memakai transform_data_parallel.
+    history membuang row yang sudah ada di run sebelumnya; simpan dengan history.save() setelah load."""
+    transformer = DataTransformer(profile=profile, history=history)
+    if workers and workers > 1:
+        df_clean = transformer.transform_data_parallel(products, workers)
+    else:
+        df_clean = transformer.transform_data(products)
     
     print(f"\nTransformation completed!")
     print(f"Final data shape: {df_clean.shape}")
@@ -125,4 +353,12 @@ def transform_fashion_data(products: List[Dict]) -> pd.DataFrame:
     print(f"\nFirst few rows:")
     print(df_clean.head())
     
-    return df_clean
\ No newline at end of file
+    return df_clean
+
+
+def transform_fashion_stream(batches: Iterable[List[Dict]], profile: str = 'standard',
+                             chunk_size: Optional[int] = None,
+                             history: Optional[FingerprintIndex] = None) -> Iterator[pd.DataFrame]:
+    """Versi streaming dari transform_fashion_data"""
+    transformer = DataTransformer(profile=profile, history=history)
+    yield from transformer.transform_stream(batches, chunk_size)
@@ -0,0 +1,152 @@
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from .schema import COLUMNS, dtype_matches, get_profile
+
+# Rule validasi row-level secara deklaratif, dievaluasi oleh DataValidator.check_<rule>
+DEFAULT_RULES = [
+    {'rule': 'not_null', 'columns': COLUMNS},
+    {'rule': 'unique_rows', 'prefilter': 'Title'},
+    {'rule': 'greater_than', 'column': 'Price', 'value': 0},
+    {'rule': 'between', 'column': 'Rating', 'low': 0, 'high': 5},
+]
+
+
+class ValidationReport:
+    """Hasil validasi: jumlah row gagal dan contoh index per rule, serta durasi validasi"""
+
+    def __init__(self, rows: int, rows_checked: int, profile: str):
+        self.rows = rows
+        self.rows_checked = rows_checked
+        self.profile = profile
+        self.results: List[Dict] = []
+        self.elapsed = 0.0
+
+    @property
+    def sampled(self) -> bool:
+        return self.rows_checked < self.rows
+
+    @property
+    def passed(self) -> bool:
+        return not self.errors
+
+    @property
+    def errors(self) -> List[Dict]:
+        return [result for result in self.results if result['severity'] == 'error' and result['failed']]
+
+    def add(self, rule: str, failed: int, column: Optional[str] = None, samples: Optional[List] = None,
+            severity: str = 'error', detail: str = ''):
+        self.results.append({'rule': rule, 'column': column, 'failed': int(failed), 'samples': samples or [],
+                             'severity': severity, 'detail': detail})
+
+    def to_dict(self) -> Dict:
+        return {'passed': self.passed, 'rows': self.rows, 'rows_checked': self.rows_checked,
+                'sampled': self.sampled, 'profile': self.profile, 'elapsed': self.elapsed,
+                'results': self.results}
+
+    def format(self) -> str:
+        lines = ["=== Data Validation ===",
+                 f"Rows checked: {self.rows_checked} of {self.rows}" + (" (sampled)" if self.sampled else ""),
+                 f"Profile: {self.profile}"]
+        for result in self.results:
+            name = result['rule'] + (f"[{result['column']}]" if result['column'] else "")
+            status = "ok" if not result['failed'] else result['severity'].upper()
+            line = f"  {name:<24} {status:<8} failed={result['failed']}"
+            if result['samples']:
+                line += f" samples={result['samples']}"
+            if result['detail']:
+                line += f" ({result['detail']})"
+            lines.append(line)
+        lines.append(f"Validation {'passed' if self.passed else 'FAILED'} in {self.elapsed * 1000:.1f} ms")
+        return "\n".join(lines)
+
+
+class DataValidator:
+    """Evaluasi semua rule sekaligus tanpa berhenti di rule pertama yang gagal.
+    Null dicek dalam satu pass untuk semua kolom, setiap rule lain satu pass vectorized."""
+
+    def __init__(self, profile: str = 'standard', rules: Optional[List[Dict]] = None, max_samples: int = 5):
+        self.profile = profile
+        self.dtypes = get_profile(profile)
+        self.rules = DEFAULT_RULES if rules is None else rules
+        self.max_samples = max_samples
+        for spec in self.rules:
+            if not hasattr(self, f"check_{spec['rule']}"):
+                raise ValueError(f"Unknown validation rule: {spec['rule']}")
+
+    def validate(self, df: pd.DataFrame, sample_rows: Optional[int] = None, seed: int = 0) -> ValidationReport:
+        """Validasi df, atau sample_rows row acak jika df lebih besar (duplikat hanya terdeteksi di dalam sample)"""
+        start = time.perf_counter()
+        rows = len(df)
+        if sample_rows is not None and rows > sample_rows:
+            df = df.sample(n=sample_rows, random_state=seed)
+        report = ValidationReport(rows, len(df), self.profile)
+
+        report.add('not_empty', int(df.empty))
+        missing = [col for col in COLUMNS if col not in df.columns]
+        report.add('required_columns', len(missing), detail=f"missing {missing}" if missing else "")
+
+        for col, expected in self.dtypes.items():
+            if col in df.columns and not dtype_matches(df[col].dtype, expected):
+                report.add('dtype', len(df), col, severity='warning',
+                           detail=f"expected {expected}, got {df[col].dtype}")
+
+        if not df.empty:
+            for spec in self.rules:
+                getattr(self, f"check_{spec['rule']}")(df, spec, report)
+
+        report.elapsed = time.perf_counter() - start
+        return report
+
+    def samples(self, df: pd.DataFrame, failed: np.ndarray) -> List:
+        return df.index[np.flatnonzero(failed)[:self.max_samples]].tolist()
+
+    def check_not_null(self, df: pd.DataFrame, spec: Dict, report: ValidationReport):
+        columns = [col for col in spec['columns'] if col in df.columns]
+        nulls = df[columns].isna().to_numpy()
+        for position in np.flatnonzero(nulls.any(axis=0)):
+            report.add('not_null', nulls[:, position].sum(), columns[position],
+                       self.samples(df, nulls[:, position]))
+        if not nulls.any():
+            report.add('not_null', 0)
+
+    def check_unique_rows(self, df: pd.DataFrame, spec: Dict, report: ValidationReport):
+        """Row duplikat pasti punya nilai prefilter yang sama, jadi duplicated() penuh
+        hanya dijalankan pada row dengan nilai prefilter yang muncul lebih dari sekali"""
+        prefilter = spec.get('prefilter')
+        if prefilter in df.columns:
+            candidates = df[prefilter].duplicated(keep=False).to_numpy()
+            duplicated = np.zeros(len(df), dtype=bool)
+            if candidates.any():
+                duplicated[candidates] = df[candidates].duplicated().to_numpy()
+        else:
+            duplicated = df.duplicated().to_numpy()
+        report.add('unique_rows', duplicated.sum(), samples=self.samples(df, duplicated))
+
+    def column_values(self, df: pd.DataFrame, spec: Dict, report: ValidationReport) -> Optional[np.ndarray]:
+        """Kolom numeric sebagai float64 (null menjadi NaN sehingga tidak dihitung gagal), None jika kolom hilang"""
+        if spec['column'] not in df.columns:
+            report.add(spec['rule'], 0, spec['column'], severity='warning', detail="column missing, skipped")
+            return None
+        try:
+            return df[spec['column']].to_numpy('float64', na_value=np.nan)
+        except (TypeError, ValueError):
+            report.add(spec['rule'], len(df), spec['column'], detail="column is not numeric")
+            return None
+
+    def check_greater_than(self, df: pd.DataFrame, spec: Dict, report: ValidationReport):
+        values = self.column_values(df, spec, report)
+        if values is not None:
+            failed = values <= spec['value']
+            report.add('greater_than', failed.sum(), spec['column'], self.samples(df, failed),
+                       detail=f"> {spec['value']}")
+
+    def check_between(self, df: pd.DataFrame, spec: Dict, report: ValidationReport):
+        values = self.column_values(df, spec, report)
+        if values is not None:
+            failed = (values < spec['low']) | (values > spec['high'])
+            report.add('between', failed.sum(), spec['column'], self.samples(df, failed),
+                       detail=f"{spec['low']}-{spec['high']}")